@@ -31,6 +31,7 @@ __all__ = [
     "ApiException",
     "Account",
     "DetailedStats",
+    "ExtendTaskLeaseResponse",
     "ExtractAccountTaskConfig",
     "ExtractPostDetailsTaskConfig",
     "ExtractPostListTaskConfig",
@@ -40,15 +41,23 @@ __all__ = [
     "ExtractionTaskStatus",
     "ExtractionTaskType",
     "HTTPValidationError",
-    "Influencer",
     "LocationInner",
     "MarkTaskFailedPayload",
+    "MarkTasksCompletedPayload",
+    "MarkTasksFailedPayload",
+    "MarkTasksResponse",
     "Post",
     "RecycleExpiredTasksResponse",
     "RecycleFailedTasksResponse",
+    "RegisterTasksResponse",
+    "ReleaseTasksPayload",
     "SocialNetwork",
     "TaskConfig",
     "TaskConfig1",
+    "TaskFailure",
+    "TaskLease",
+    "TaskMarkResult",
+    "UpsertResultsResponse",
     "ValidationError",
 ]
 
@@ -70,6 +79,7 @@ from api_client.exceptions import ApiException as ApiException
 # import models into sdk package
 from api_client.models.account import Account as Account
 from api_client.models.detailed_stats import DetailedStats as DetailedStats
+from api_client.models.extend_task_lease_response import ExtendTaskLeaseResponse as ExtendTaskLeaseResponse
 from api_client.models.extract_account_task_config import ExtractAccountTaskConfig as ExtractAccountTaskConfig
 from api_client.models.extract_post_details_task_config import ExtractPostDetailsTaskConfig as ExtractPostDetailsTaskConfig
 from api_client.models.extract_post_list_task_config import ExtractPostListTaskConfig as ExtractPostListTaskConfig
@@ -79,14 +89,22 @@ from api_client.models.extraction_task_stats_response import ExtractionTaskStats
 from api_client.models.extraction_task_status import ExtractionTaskStatus as ExtractionTaskStatus
 from api_client.models.extraction_task_type import ExtractionTaskType as ExtractionTaskType
 from api_client.models.http_validation_error import HTTPValidationError as HTTPValidationError
-from api_client.models.influencer import Influencer as Influencer
 from api_client.models.location_inner import LocationInner as LocationInner
 from api_client.models.mark_task_failed_payload import MarkTaskFailedPayload as MarkTaskFailedPayload
+from api_client.models.mark_tasks_completed_payload import MarkTasksCompletedPayload as MarkTasksCompletedPayload
+from api_client.models.mark_tasks_failed_payload import MarkTasksFailedPayload as MarkTasksFailedPayload
+from api_client.models.mark_tasks_response import MarkTasksResponse as MarkTasksResponse
 from api_client.models.post import Post as Post
 from api_client.models.recycle_expired_tasks_response import RecycleExpiredTasksResponse as RecycleExpiredTasksResponse
 from api_client.models.recycle_failed_tasks_response import RecycleFailedTasksResponse as RecycleFailedTasksResponse
+from api_client.models.register_tasks_response import RegisterTasksResponse as RegisterTasksResponse
+from api_client.models.release_tasks_payload import ReleaseTasksPayload as ReleaseTasksPayload
 from api_client.models.social_network import SocialNetwork as SocialNetwork
 from api_client.models.task_config import TaskConfig as TaskConfig
 from api_client.models.task_config1 import TaskConfig1 as TaskConfig1
+from api_client.models.task_failure import TaskFailure as TaskFailure
+from api_client.models.task_lease import TaskLease as TaskLease
+from api_client.models.task_mark_result import TaskMarkResult as TaskMarkResult
+from api_client.models.upsert_results_response import UpsertResultsResponse as UpsertResultsResponse
 from api_client.models.validation_error import ValidationError as ValidationError
 
@@ -15,18 +15,25 @@ from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
-from pydantic import StrictStr
-from typing import Any, List, Optional
+from pydantic import Field, StrictBool, StrictStr
+from typing import Any, List, Optional, Union
+from typing_extensions import Annotated
 from uuid import UUID
 from api_client.models.account import Account
+from api_client.models.extend_task_lease_response import ExtendTaskLeaseResponse
 from api_client.models.extraction_task import ExtractionTask
 from api_client.models.extraction_task_response import ExtractionTaskResponse
 from api_client.models.extraction_task_stats_response import ExtractionTaskStatsResponse
-from api_client.models.influencer import Influencer
 from api_client.models.mark_task_failed_payload import MarkTaskFailedPayload
+from api_client.models.mark_tasks_completed_payload import MarkTasksCompletedPayload
+from api_client.models.mark_tasks_failed_payload import MarkTasksFailedPayload
+from api_client.models.mark_tasks_response import MarkTasksResponse
 from api_client.models.post import Post
 from api_client.models.recycle_expired_tasks_response import RecycleExpiredTasksResponse
 from api_client.models.recycle_failed_tasks_response import RecycleFailedTasksResponse
+from api_client.models.register_tasks_response import RegisterTasksResponse
+from api_client.models.release_tasks_payload import ReleaseTasksPayload
+from api_client.models.upsert_results_response import UpsertResultsResponse
 
 from api_client.api_client import ApiClient, RequestSerialized
 from api_client.api_response import ApiResponse
@@ -50,6 +57,7 @@ class DefaultApi:
     def acquire_available_task_extraction_task_acquire_post(
         self,
         social_network: Optional[Any] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -69,6 +77,8 @@ class DefaultApi:
 
         :param social_network:
         :type social_network: SocialNetwork
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -93,6 +103,7 @@ class DefaultApi:
 
         _param = self._acquire_available_task_extraction_task_acquire_post_serialize(
             social_network=social_network,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -118,6 +129,7 @@ class DefaultApi:
     def acquire_available_task_extraction_task_acquire_post_with_http_info(
         self,
         social_network: Optional[Any] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -137,6 +149,8 @@ class DefaultApi:
 
         :param social_network:
         :type social_network: SocialNetwork
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -161,6 +175,7 @@ class DefaultApi:
 
         _param = self._acquire_available_task_extraction_task_acquire_post_serialize(
             social_network=social_network,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -186,6 +201,7 @@ class DefaultApi:
     def acquire_available_task_extraction_task_acquire_post_without_preload_content(
         self,
         social_network: Optional[Any] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -205,6 +221,8 @@ class DefaultApi:
 
         :param social_network:
         :type social_network: SocialNetwork
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -229,6 +247,7 @@ class DefaultApi:
 
         _param = self._acquire_available_task_extraction_task_acquire_post_serialize(
             social_network=social_network,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -249,6 +268,7 @@ class DefaultApi:
     def _acquire_available_task_extraction_task_acquire_post_serialize(
         self,
         social_network,
+        wait_seconds,
         _request_auth,
         _content_type,
         _headers,
@@ -275,6 +295,10 @@ class DefaultApi:
             
             _query_params.append(('social_network', social_network.value))
             
+        if wait_seconds is not None:
+            
+            _query_params.append(('wait_seconds', wait_seconds))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -313,11 +337,11 @@ class DefaultApi:
 
 
     @validate_call
-    def get_extraction_task_stats_extraction_task_stats_get(
+    def acquire_available_tasks_extraction_task_acquire_batch_post(
         self,
         social_network: Optional[Any] = None,
-        account_id: Optional[StrictStr] = None,
-        task_type: Optional[Any] = None,
+        count: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -330,17 +354,17 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ExtractionTaskStatsResponse:
-        """Get Extraction Task Stats
+    ) -> List[ExtractionTaskResponse]:
+        """Acquire Available Tasks
 
-        Get statistics on extraction tasks with optional filters
+        Get up to `count` available tasks and switch their status to acquired
 
         :param social_network:
         :type social_network: SocialNetwork
-        :param account_id:
-        :type account_id: str
-        :param task_type:
-        :type task_type: ExtractionTaskType
+        :param count:
+        :type count: int
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -363,10 +387,10 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+        _param = self._acquire_available_tasks_extraction_task_acquire_batch_post_serialize(
             social_network=social_network,
-            account_id=account_id,
-            task_type=task_type,
+            count=count,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -374,7 +398,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ExtractionTaskStatsResponse",
+            '200': "List[ExtractionTaskResponse]",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -389,11 +413,11 @@ class DefaultApi:
 
 
     @validate_call
-    def get_extraction_task_stats_extraction_task_stats_get_with_http_info(
+    def acquire_available_tasks_extraction_task_acquire_batch_post_with_http_info(
         self,
         social_network: Optional[Any] = None,
-        account_id: Optional[StrictStr] = None,
-        task_type: Optional[Any] = None,
+        count: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -406,17 +430,17 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[ExtractionTaskStatsResponse]:
-        """Get Extraction Task Stats
+    ) -> ApiResponse[List[ExtractionTaskResponse]]:
+        """Acquire Available Tasks
 
-        Get statistics on extraction tasks with optional filters
+        Get up to `count` available tasks and switch their status to acquired
 
         :param social_network:
         :type social_network: SocialNetwork
-        :param account_id:
-        :type account_id: str
-        :param task_type:
-        :type task_type: ExtractionTaskType
+        :param count:
+        :type count: int
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -439,10 +463,10 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+        _param = self._acquire_available_tasks_extraction_task_acquire_batch_post_serialize(
             social_network=social_network,
-            account_id=account_id,
-            task_type=task_type,
+            count=count,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -450,7 +474,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ExtractionTaskStatsResponse",
+            '200': "List[ExtractionTaskResponse]",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -465,11 +489,11 @@ class DefaultApi:
 
 
     @validate_call
-    def get_extraction_task_stats_extraction_task_stats_get_without_preload_content(
+    def acquire_available_tasks_extraction_task_acquire_batch_post_without_preload_content(
         self,
         social_network: Optional[Any] = None,
-        account_id: Optional[StrictStr] = None,
-        task_type: Optional[Any] = None,
+        count: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
+        wait_seconds: Optional[Union[Annotated[float, Field(le=60, strict=True, ge=0)], Annotated[int, Field(le=60, strict=True, ge=0)]]] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -483,16 +507,16 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Get Extraction Task Stats
+        """Acquire Available Tasks
 
-        Get statistics on extraction tasks with optional filters
+        Get up to `count` available tasks and switch their status to acquired
 
         :param social_network:
         :type social_network: SocialNetwork
-        :param account_id:
-        :type account_id: str
-        :param task_type:
-        :type task_type: ExtractionTaskType
+        :param count:
+        :type count: int
+        :param wait_seconds:
+        :type wait_seconds: float
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -515,10 +539,10 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+        _param = self._acquire_available_tasks_extraction_task_acquire_batch_post_serialize(
             social_network=social_network,
-            account_id=account_id,
-            task_type=task_type,
+            count=count,
+            wait_seconds=wait_seconds,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -526,7 +550,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "ExtractionTaskStatsResponse",
+            '200': "List[ExtractionTaskResponse]",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -536,11 +560,11 @@ class DefaultApi:
         return response_data.response
 
 
-    def _get_extraction_task_stats_extraction_task_stats_get_serialize(
+    def _acquire_available_tasks_extraction_task_acquire_batch_post_serialize(
         self,
         social_network,
-        account_id,
-        task_type,
+        count,
+        wait_seconds,
         _request_auth,
         _content_type,
         _headers,
@@ -567,13 +591,13 @@ class DefaultApi:
             
             _query_params.append(('social_network', social_network.value))
             
-        if account_id is not None:
+        if count is not None:
             
-            _query_params.append(('account_id', account_id))
+            _query_params.append(('count', count))
             
-        if task_type is not None:
+        if wait_seconds is not None:
             
-            _query_params.append(('task_type', task_type.value))
+            _query_params.append(('wait_seconds', wait_seconds))
             
         # process the header parameters
         # process the form parameters
@@ -595,8 +619,8 @@ class DefaultApi:
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/extraction-task/stats',
+            method='POST',
+            resource_path='/extraction-task/acquire-batch',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -613,9 +637,10 @@ class DefaultApi:
 
 
     @validate_call
-    def get_influencer_accounts_influencer_username_get(
+    def extend_task_lease_extraction_task_task_uid_extend_lease_post(
         self,
-        username: StrictStr,
+        task_uid: UUID,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -628,13 +653,15 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> Influencer:
-        """Get Influencer Accounts
+    ) -> ExtendTaskLeaseResponse:
+        """Extend Task Lease
 
-        Get social network accounts for an influencer
+        Extend the lease of an acquired task
 
-        :param username: (required)
-        :type username: str
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -657,8 +684,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_influencer_accounts_influencer_username_get_serialize(
-            username=username,
+        _param = self._extend_task_lease_extraction_task_task_uid_extend_lease_post_serialize(
+            task_uid=task_uid,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -666,7 +694,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Influencer",
+            '200': "ExtendTaskLeaseResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -681,9 +709,10 @@ class DefaultApi:
 
 
     @validate_call
-    def get_influencer_accounts_influencer_username_get_with_http_info(
+    def extend_task_lease_extraction_task_task_uid_extend_lease_post_with_http_info(
         self,
-        username: StrictStr,
+        task_uid: UUID,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -696,13 +725,15 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[Influencer]:
-        """Get Influencer Accounts
+    ) -> ApiResponse[ExtendTaskLeaseResponse]:
+        """Extend Task Lease
 
-        Get social network accounts for an influencer
+        Extend the lease of an acquired task
 
-        :param username: (required)
-        :type username: str
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -725,8 +756,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_influencer_accounts_influencer_username_get_serialize(
-            username=username,
+        _param = self._extend_task_lease_extraction_task_task_uid_extend_lease_post_serialize(
+            task_uid=task_uid,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -734,7 +766,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Influencer",
+            '200': "ExtendTaskLeaseResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -749,9 +781,10 @@ class DefaultApi:
 
 
     @validate_call
-    def get_influencer_accounts_influencer_username_get_without_preload_content(
+    def extend_task_lease_extraction_task_task_uid_extend_lease_post_without_preload_content(
         self,
-        username: StrictStr,
+        task_uid: UUID,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -765,12 +798,14 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Get Influencer Accounts
+        """Extend Task Lease
 
-        Get social network accounts for an influencer
+        Extend the lease of an acquired task
 
-        :param username: (required)
-        :type username: str
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -793,8 +828,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._get_influencer_accounts_influencer_username_get_serialize(
-            username=username,
+        _param = self._extend_task_lease_extraction_task_task_uid_extend_lease_post_serialize(
+            task_uid=task_uid,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -802,7 +838,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "Influencer",
+            '200': "ExtendTaskLeaseResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -812,9 +848,10 @@ class DefaultApi:
         return response_data.response
 
 
-    def _get_influencer_accounts_influencer_username_get_serialize(
+    def _extend_task_lease_extraction_task_task_uid_extend_lease_post_serialize(
         self,
-        username,
+        task_uid,
+        lease_token,
         _request_auth,
         _content_type,
         _headers,
@@ -836,9 +873,13 @@ class DefaultApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if username is not None:
-            _path_params['username'] = username
+        if task_uid is not None:
+            _path_params['task_uid'] = task_uid
         # process the query parameters
+        if lease_token is not None:
+            
+            _query_params.append(('lease_token', lease_token))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -855,11 +896,12 @@ class DefaultApi:
 
         # authentication setting
         _auth_settings: List[str] = [
+            'HTTPBearer'
         ]
 
         return self.api_client.param_serialize(
-            method='GET',
-            resource_path='/influencer/{username}',
+            method='POST',
+            resource_path='/extraction-task/{task_uid}/extend-lease',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -876,9 +918,12 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_completed_extraction_task_task_uid_mark_completed_post(
+    def get_extraction_task_stats_extraction_task_stats_get(
         self,
-        task_uid: UUID,
+        social_network: Optional[Any] = None,
+        account_id: Optional[StrictStr] = None,
+        task_type: Optional[Any] = None,
+        include_archive: Optional[StrictBool] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -891,13 +936,19 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> object:
-        """Mark Completed
+    ) -> ExtractionTaskStatsResponse:
+        """Get Extraction Task Stats
 
-        Mark Completed
+        Get statistics on extraction tasks with optional filters
 
-        :param task_uid: (required)
-        :type task_uid: UUID
+        :param social_network:
+        :type social_network: SocialNetwork
+        :param account_id:
+        :type account_id: str
+        :param task_type:
+        :type task_type: ExtractionTaskType
+        :param include_archive:
+        :type include_archive: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -920,8 +971,11 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
-            task_uid=task_uid,
+        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+            social_network=social_network,
+            account_id=account_id,
+            task_type=task_type,
+            include_archive=include_archive,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -929,7 +983,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '200': "ExtractionTaskStatsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -944,9 +998,12 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_completed_extraction_task_task_uid_mark_completed_post_with_http_info(
+    def get_extraction_task_stats_extraction_task_stats_get_with_http_info(
         self,
-        task_uid: UUID,
+        social_network: Optional[Any] = None,
+        account_id: Optional[StrictStr] = None,
+        task_type: Optional[Any] = None,
+        include_archive: Optional[StrictBool] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -959,13 +1016,19 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[object]:
-        """Mark Completed
+    ) -> ApiResponse[ExtractionTaskStatsResponse]:
+        """Get Extraction Task Stats
 
-        Mark Completed
+        Get statistics on extraction tasks with optional filters
 
-        :param task_uid: (required)
-        :type task_uid: UUID
+        :param social_network:
+        :type social_network: SocialNetwork
+        :param account_id:
+        :type account_id: str
+        :param task_type:
+        :type task_type: ExtractionTaskType
+        :param include_archive:
+        :type include_archive: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -988,8 +1051,11 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
-            task_uid=task_uid,
+        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+            social_network=social_network,
+            account_id=account_id,
+            task_type=task_type,
+            include_archive=include_archive,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -997,7 +1063,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '200': "ExtractionTaskStatsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1012,9 +1078,12 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_completed_extraction_task_task_uid_mark_completed_post_without_preload_content(
+    def get_extraction_task_stats_extraction_task_stats_get_without_preload_content(
         self,
-        task_uid: UUID,
+        social_network: Optional[Any] = None,
+        account_id: Optional[StrictStr] = None,
+        task_type: Optional[Any] = None,
+        include_archive: Optional[StrictBool] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1028,12 +1097,18 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Mark Completed
+        """Get Extraction Task Stats
 
-        Mark Completed
+        Get statistics on extraction tasks with optional filters
 
-        :param task_uid: (required)
-        :type task_uid: UUID
+        :param social_network:
+        :type social_network: SocialNetwork
+        :param account_id:
+        :type account_id: str
+        :param task_type:
+        :type task_type: ExtractionTaskType
+        :param include_archive:
+        :type include_archive: bool
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1056,8 +1131,11 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
-            task_uid=task_uid,
+        _param = self._get_extraction_task_stats_extraction_task_stats_get_serialize(
+            social_network=social_network,
+            account_id=account_id,
+            task_type=task_type,
+            include_archive=include_archive,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1065,7 +1143,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '200': "ExtractionTaskStatsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1075,9 +1153,12 @@ class DefaultApi:
         return response_data.response
 
 
-    def _mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
+    def _get_extraction_task_stats_extraction_task_stats_get_serialize(
         self,
-        task_uid,
+        social_network,
+        account_id,
+        task_type,
+        include_archive,
         _request_auth,
         _content_type,
         _headers,
@@ -1099,9 +1180,23 @@ class DefaultApi:
         _body_params: Optional[bytes] = None
 
         # process the path parameters
-        if task_uid is not None:
-            _path_params['task_uid'] = task_uid
         # process the query parameters
+        if social_network is not None:
+            
+            _query_params.append(('social_network', social_network.value))
+            
+        if account_id is not None:
+            
+            _query_params.append(('account_id', account_id))
+            
+        if task_type is not None:
+            
+            _query_params.append(('task_type', task_type.value))
+            
+        if include_archive is not None:
+            
+            _query_params.append(('include_archive', include_archive))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
@@ -1122,8 +1217,8 @@ class DefaultApi:
         ]
 
         return self.api_client.param_serialize(
-            method='POST',
-            resource_path='/extraction-task/{task_uid}/mark-completed',
+            method='GET',
+            resource_path='/extraction-task/stats',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1140,10 +1235,10 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_failed_extraction_task_task_uid_mark_failed_post(
+    def mark_completed_extraction_task_task_uid_mark_completed_post(
         self,
         task_uid: UUID,
-        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1157,14 +1252,14 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> object:
-        """Mark Failed
+        """Mark Completed
 
-        Mark Failed
+        Mark Completed
 
         :param task_uid: (required)
         :type task_uid: UUID
-        :param mark_task_failed_payload: (required)
-        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1187,9 +1282,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
             task_uid=task_uid,
-            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1212,10 +1307,10 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_failed_extraction_task_task_uid_mark_failed_post_with_http_info(
+    def mark_completed_extraction_task_task_uid_mark_completed_post_with_http_info(
         self,
         task_uid: UUID,
-        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1229,14 +1324,14 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> ApiResponse[object]:
-        """Mark Failed
+        """Mark Completed
 
-        Mark Failed
+        Mark Completed
 
         :param task_uid: (required)
         :type task_uid: UUID
-        :param mark_task_failed_payload: (required)
-        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1259,9 +1354,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
             task_uid=task_uid,
-            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1284,10 +1379,10 @@ class DefaultApi:
 
 
     @validate_call
-    def mark_failed_extraction_task_task_uid_mark_failed_post_without_preload_content(
+    def mark_completed_extraction_task_task_uid_mark_completed_post_without_preload_content(
         self,
         task_uid: UUID,
-        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1301,14 +1396,14 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Mark Failed
+        """Mark Completed
 
-        Mark Failed
+        Mark Completed
 
         :param task_uid: (required)
         :type task_uid: UUID
-        :param mark_task_failed_payload: (required)
-        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1331,9 +1426,9 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+        _param = self._mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
             task_uid=task_uid,
-            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1351,10 +1446,10 @@ class DefaultApi:
         return response_data.response
 
 
-    def _mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+    def _mark_completed_extraction_task_task_uid_mark_completed_post_serialize(
         self,
         task_uid,
-        mark_task_failed_payload,
+        lease_token,
         _request_auth,
         _content_type,
         _headers,
@@ -1379,11 +1474,13 @@ class DefaultApi:
         if task_uid is not None:
             _path_params['task_uid'] = task_uid
         # process the query parameters
+        if lease_token is not None:
+            
+            _query_params.append(('lease_token', lease_token))
+            
         # process the header parameters
         # process the form parameters
         # process the body parameter
-        if mark_task_failed_payload is not None:
-            _body_params = mark_task_failed_payload
 
 
         # set the HTTP header `Accept`
@@ -1394,19 +1491,6 @@ class DefaultApi:
                 ]
             )
 
-        # set the HTTP header `Content-Type`
-        if _content_type:
-            _header_params['Content-Type'] = _content_type
-        else:
-            _default_content_type = (
-                self.api_client.select_header_content_type(
-                    [
-                        'application/json'
-                    ]
-                )
-            )
-            if _default_content_type is not None:
-                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
@@ -1415,7 +1499,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/extraction-task/{task_uid}/mark-failed/',
+            resource_path='/extraction-task/{task_uid}/mark-completed',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1432,8 +1516,11 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_expired_tasks_extraction_task_recycle_expired_post(
+    def mark_failed_extraction_task_task_uid_mark_failed_post(
         self,
+        task_uid: UUID,
+        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1446,11 +1533,17 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RecycleExpiredTasksResponse:
-        """Recycle Expired Tasks
+    ) -> object:
+        """Mark Failed
 
-        Recycle all acquired tasks that have passed their acquisition limit
+        Mark Failed
 
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param mark_task_failed_payload: (required)
+        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1473,15 +1566,1366 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
-            _request_auth=_request_auth,
+        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+            task_uid=task_uid,
+            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "object",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def mark_failed_extraction_task_task_uid_mark_failed_post_with_http_info(
+        self,
+        task_uid: UUID,
+        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[object]:
+        """Mark Failed
+
+        Mark Failed
+
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param mark_task_failed_payload: (required)
+        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+            task_uid=task_uid,
+            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "object",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def mark_failed_extraction_task_task_uid_mark_failed_post_without_preload_content(
+        self,
+        task_uid: UUID,
+        mark_task_failed_payload: MarkTaskFailedPayload,
+        lease_token: Optional[UUID] = None,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Mark Failed
+
+        Mark Failed
+
+        :param task_uid: (required)
+        :type task_uid: UUID
+        :param mark_task_failed_payload: (required)
+        :type mark_task_failed_payload: MarkTaskFailedPayload
+        :param lease_token:
+        :type lease_token: UUID
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+            task_uid=task_uid,
+            mark_task_failed_payload=mark_task_failed_payload,
+            lease_token=lease_token,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "object",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _mark_failed_extraction_task_task_uid_mark_failed_post_serialize(
+        self,
+        task_uid,
+        mark_task_failed_payload,
+        lease_token,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        if task_uid is not None:
+            _path_params['task_uid'] = task_uid
+        # process the query parameters
+        if lease_token is not None:
+            
+            _query_params.append(('lease_token', lease_token))
+            
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+        if mark_task_failed_payload is not None:
+            _body_params = mark_task_failed_payload
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'HTTPBearer'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/extraction-task/{task_uid}/mark-failed/',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def mark_tasks_completed_extraction_task_mark_completed_post(
+        self,
+        mark_tasks_completed_payload: MarkTasksCompletedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> MarkTasksResponse:
+        """Mark Tasks Completed
+
+        Mark a batch of tasks as completed
+
+        :param mark_tasks_completed_payload: (required)
+        :type mark_tasks_completed_payload: MarkTasksCompletedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_completed_extraction_task_mark_completed_post_serialize(
+            mark_tasks_completed_payload=mark_tasks_completed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def mark_tasks_completed_extraction_task_mark_completed_post_with_http_info(
+        self,
+        mark_tasks_completed_payload: MarkTasksCompletedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[MarkTasksResponse]:
+        """Mark Tasks Completed
+
+        Mark a batch of tasks as completed
+
+        :param mark_tasks_completed_payload: (required)
+        :type mark_tasks_completed_payload: MarkTasksCompletedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_completed_extraction_task_mark_completed_post_serialize(
+            mark_tasks_completed_payload=mark_tasks_completed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def mark_tasks_completed_extraction_task_mark_completed_post_without_preload_content(
+        self,
+        mark_tasks_completed_payload: MarkTasksCompletedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Mark Tasks Completed
+
+        Mark a batch of tasks as completed
+
+        :param mark_tasks_completed_payload: (required)
+        :type mark_tasks_completed_payload: MarkTasksCompletedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_completed_extraction_task_mark_completed_post_serialize(
+            mark_tasks_completed_payload=mark_tasks_completed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _mark_tasks_completed_extraction_task_mark_completed_post_serialize(
+        self,
+        mark_tasks_completed_payload,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+        if mark_tasks_completed_payload is not None:
+            _body_params = mark_tasks_completed_payload
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'HTTPBearer'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/extraction-task/mark-completed',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def mark_tasks_failed_extraction_task_mark_failed_post(
+        self,
+        mark_tasks_failed_payload: MarkTasksFailedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> MarkTasksResponse:
+        """Mark Tasks Failed
+
+        Mark a batch of tasks as failed, each with its own error
+
+        :param mark_tasks_failed_payload: (required)
+        :type mark_tasks_failed_payload: MarkTasksFailedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_failed_extraction_task_mark_failed_post_serialize(
+            mark_tasks_failed_payload=mark_tasks_failed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def mark_tasks_failed_extraction_task_mark_failed_post_with_http_info(
+        self,
+        mark_tasks_failed_payload: MarkTasksFailedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[MarkTasksResponse]:
+        """Mark Tasks Failed
+
+        Mark a batch of tasks as failed, each with its own error
+
+        :param mark_tasks_failed_payload: (required)
+        :type mark_tasks_failed_payload: MarkTasksFailedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_failed_extraction_task_mark_failed_post_serialize(
+            mark_tasks_failed_payload=mark_tasks_failed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def mark_tasks_failed_extraction_task_mark_failed_post_without_preload_content(
+        self,
+        mark_tasks_failed_payload: MarkTasksFailedPayload,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Mark Tasks Failed
+
+        Mark a batch of tasks as failed, each with its own error
+
+        :param mark_tasks_failed_payload: (required)
+        :type mark_tasks_failed_payload: MarkTasksFailedPayload
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._mark_tasks_failed_extraction_task_mark_failed_post_serialize(
+            mark_tasks_failed_payload=mark_tasks_failed_payload,
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _mark_tasks_failed_extraction_task_mark_failed_post_serialize(
+        self,
+        mark_tasks_failed_payload,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+        if mark_tasks_failed_payload is not None:
+            _body_params = mark_tasks_failed_payload
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'HTTPBearer'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/extraction-task/mark-failed',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def recycle_expired_tasks_extraction_task_recycle_expired_post(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RecycleExpiredTasksResponse:
+        """Recycle Expired Tasks
+
+        Recycle all acquired tasks that have passed their acquisition limit
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleExpiredTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def recycle_expired_tasks_extraction_task_recycle_expired_post_with_http_info(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[RecycleExpiredTasksResponse]:
+        """Recycle Expired Tasks
+
+        Recycle all acquired tasks that have passed their acquisition limit
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleExpiredTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def recycle_expired_tasks_extraction_task_recycle_expired_post_without_preload_content(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Recycle Expired Tasks
+
+        Recycle all acquired tasks that have passed their acquisition limit
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleExpiredTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+        self,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'HTTPBearer'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/extraction-task/recycle-expired',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def recycle_failed_tasks_extraction_task_recycle_failed_post(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RecycleFailedTasksResponse:
+        """Recycle Failed Tasks
+
+        Recycle all failed tasks back to available status
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleFailedTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        ).data
+
+
+    @validate_call
+    def recycle_failed_tasks_extraction_task_recycle_failed_post_with_http_info(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> ApiResponse[RecycleFailedTasksResponse]:
+        """Recycle Failed Tasks
+
+        Recycle all failed tasks back to available status
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleFailedTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=_response_types_map,
+        )
+
+
+    @validate_call
+    def recycle_failed_tasks_extraction_task_recycle_failed_post_without_preload_content(
+        self,
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RESTResponseType:
+        """Recycle Failed Tasks
+
+        Recycle all failed tasks back to available status
+
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+            _request_auth=_request_auth,
+            _content_type=_content_type,
+            _headers=_headers,
+            _host_index=_host_index
+        )
+
+        _response_types_map: Dict[str, Optional[str]] = {
+            '200': "RecycleFailedTasksResponse",
+        }
+        response_data = self.api_client.call_api(
+            *_param,
+            _request_timeout=_request_timeout
+        )
+        return response_data.response
+
+
+    def _recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+        self,
+        _request_auth,
+        _content_type,
+        _headers,
+        _host_index,
+    ) -> RequestSerialized:
+
+        _host = None
+
+        _collection_formats: Dict[str, str] = {
+        }
+
+        _path_params: Dict[str, str] = {}
+        _query_params: List[Tuple[str, str]] = []
+        _header_params: Dict[str, Optional[str]] = _headers or {}
+        _form_params: List[Tuple[str, str]] = []
+        _files: Dict[
+            str, Union[str, bytes, List[str], List[bytes], List[Tuple[str, bytes]]]
+        ] = {}
+        _body_params: Optional[bytes] = None
+
+        # process the path parameters
+        # process the query parameters
+        # process the header parameters
+        # process the form parameters
+        # process the body parameter
+
+
+        # set the HTTP header `Accept`
+        if 'Accept' not in _header_params:
+            _header_params['Accept'] = self.api_client.select_header_accept(
+                [
+                    'application/json'
+                ]
+            )
+
+
+        # authentication setting
+        _auth_settings: List[str] = [
+            'HTTPBearer'
+        ]
+
+        return self.api_client.param_serialize(
+            method='POST',
+            resource_path='/extraction-task/recycle-failed',
+            path_params=_path_params,
+            query_params=_query_params,
+            header_params=_header_params,
+            body=_body_params,
+            post_params=_form_params,
+            files=_files,
+            auth_settings=_auth_settings,
+            collection_formats=_collection_formats,
+            _host=_host,
+            _request_auth=_request_auth
+        )
+
+
+
+
+    @validate_call
+    def register_tasks_extraction_task_post(
+        self,
+        extraction_task: List[ExtractionTask],
+        _request_timeout: Union[
+            None,
+            Annotated[StrictFloat, Field(gt=0)],
+            Tuple[
+                Annotated[StrictFloat, Field(gt=0)],
+                Annotated[StrictFloat, Field(gt=0)]
+            ]
+        ] = None,
+        _request_auth: Optional[Dict[StrictStr, Any]] = None,
+        _content_type: Optional[StrictStr] = None,
+        _headers: Optional[Dict[StrictStr, Any]] = None,
+        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
+    ) -> RegisterTasksResponse:
+        """Register Tasks
+
+        Register tasks, skipping the ones already registered and not completed (same social network, type and config)
+
+        :param extraction_task: (required)
+        :type extraction_task: List[ExtractionTask]
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :param _request_auth: set to override the auth_settings for an a single
+                              request; this effectively ignores the
+                              authentication in the spec for a single request.
+        :type _request_auth: dict, optional
+        :param _content_type: force content-type for the request.
+        :type _content_type: str, Optional
+        :param _headers: set to override the headers for a single
+                         request; this effectively ignores the headers
+                         in the spec for a single request.
+        :type _headers: dict, optional
+        :param _host_index: set to override the host_index for a single
+                            request; this effectively ignores the host_index
+                            in the spec for a single request.
+        :type _host_index: int, optional
+        :return: Returns the result object.
+        """ # noqa: E501
+
+        _param = self._register_tasks_extraction_task_post_serialize(
+            extraction_task=extraction_task,
+            _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
             _host_index=_host_index
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleExpiredTasksResponse",
+            '200': "RegisterTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1495,8 +2939,9 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_expired_tasks_extraction_task_recycle_expired_post_with_http_info(
+    def register_tasks_extraction_task_post_with_http_info(
         self,
+        extraction_task: List[ExtractionTask],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1509,11 +2954,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[RecycleExpiredTasksResponse]:
-        """Recycle Expired Tasks
+    ) -> ApiResponse[RegisterTasksResponse]:
+        """Register Tasks
 
-        Recycle all acquired tasks that have passed their acquisition limit
+        Register tasks, skipping the ones already registered and not completed (same social network, type and config)
 
+        :param extraction_task: (required)
+        :type extraction_task: List[ExtractionTask]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1536,7 +2983,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+        _param = self._register_tasks_extraction_task_post_serialize(
+            extraction_task=extraction_task,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1544,7 +2992,8 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleExpiredTasksResponse",
+            '200': "RegisterTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1558,8 +3007,9 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_expired_tasks_extraction_task_recycle_expired_post_without_preload_content(
+    def register_tasks_extraction_task_post_without_preload_content(
         self,
+        extraction_task: List[ExtractionTask],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1573,10 +3023,12 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Recycle Expired Tasks
+        """Register Tasks
 
-        Recycle all acquired tasks that have passed their acquisition limit
+        Register tasks, skipping the ones already registered and not completed (same social network, type and config)
 
+        :param extraction_task: (required)
+        :type extraction_task: List[ExtractionTask]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1599,7 +3051,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+        _param = self._register_tasks_extraction_task_post_serialize(
+            extraction_task=extraction_task,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1607,7 +3060,8 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleExpiredTasksResponse",
+            '200': "RegisterTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1616,8 +3070,9 @@ class DefaultApi:
         return response_data.response
 
 
-    def _recycle_expired_tasks_extraction_task_recycle_expired_post_serialize(
+    def _register_tasks_extraction_task_post_serialize(
         self,
+        extraction_task,
         _request_auth,
         _content_type,
         _headers,
@@ -1627,6 +3082,7 @@ class DefaultApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
+            'ExtractionTask': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -1643,6 +3099,8 @@ class DefaultApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
+        if extraction_task is not None:
+            _body_params = extraction_task
 
 
         # set the HTTP header `Accept`
@@ -1653,6 +3111,19 @@ class DefaultApi:
                 ]
             )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
@@ -1661,7 +3132,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/extraction-task/recycle-expired',
+            resource_path='/extraction-task/',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1678,8 +3149,9 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_failed_tasks_extraction_task_recycle_failed_post(
+    def release_tasks_extraction_task_release_post(
         self,
+        release_tasks_payload: ReleaseTasksPayload,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1692,11 +3164,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> RecycleFailedTasksResponse:
-        """Recycle Failed Tasks
+    ) -> MarkTasksResponse:
+        """Release Tasks
 
-        Recycle all failed tasks back to available status
+        Release a batch of acquired tasks back to available status
 
+        :param release_tasks_payload: (required)
+        :type release_tasks_payload: ReleaseTasksPayload
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1719,7 +3193,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+        _param = self._release_tasks_extraction_task_release_post_serialize(
+            release_tasks_payload=release_tasks_payload,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1727,7 +3202,8 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleFailedTasksResponse",
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1741,8 +3217,9 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_failed_tasks_extraction_task_recycle_failed_post_with_http_info(
+    def release_tasks_extraction_task_release_post_with_http_info(
         self,
+        release_tasks_payload: ReleaseTasksPayload,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1755,11 +3232,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[RecycleFailedTasksResponse]:
-        """Recycle Failed Tasks
+    ) -> ApiResponse[MarkTasksResponse]:
+        """Release Tasks
 
-        Recycle all failed tasks back to available status
+        Release a batch of acquired tasks back to available status
 
+        :param release_tasks_payload: (required)
+        :type release_tasks_payload: ReleaseTasksPayload
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1782,7 +3261,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+        _param = self._release_tasks_extraction_task_release_post_serialize(
+            release_tasks_payload=release_tasks_payload,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1790,7 +3270,8 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleFailedTasksResponse",
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1804,8 +3285,9 @@ class DefaultApi:
 
 
     @validate_call
-    def recycle_failed_tasks_extraction_task_recycle_failed_post_without_preload_content(
+    def release_tasks_extraction_task_release_post_without_preload_content(
         self,
+        release_tasks_payload: ReleaseTasksPayload,
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1819,10 +3301,12 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Recycle Failed Tasks
+        """Release Tasks
 
-        Recycle all failed tasks back to available status
+        Release a batch of acquired tasks back to available status
 
+        :param release_tasks_payload: (required)
+        :type release_tasks_payload: ReleaseTasksPayload
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1845,7 +3329,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+        _param = self._release_tasks_extraction_task_release_post_serialize(
+            release_tasks_payload=release_tasks_payload,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1853,7 +3338,8 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "RecycleFailedTasksResponse",
+            '200': "MarkTasksResponse",
+            '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -1862,8 +3348,9 @@ class DefaultApi:
         return response_data.response
 
 
-    def _recycle_failed_tasks_extraction_task_recycle_failed_post_serialize(
+    def _release_tasks_extraction_task_release_post_serialize(
         self,
+        release_tasks_payload,
         _request_auth,
         _content_type,
         _headers,
@@ -1889,6 +3376,8 @@ class DefaultApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
+        if release_tasks_payload is not None:
+            _body_params = release_tasks_payload
 
 
         # set the HTTP header `Accept`
@@ -1899,6 +3388,19 @@ class DefaultApi:
                 ]
             )
 
+        # set the HTTP header `Content-Type`
+        if _content_type:
+            _header_params['Content-Type'] = _content_type
+        else:
+            _default_content_type = (
+                self.api_client.select_header_content_type(
+                    [
+                        'application/json'
+                    ]
+                )
+            )
+            if _default_content_type is not None:
+                _header_params['Content-Type'] = _default_content_type
 
         # authentication setting
         _auth_settings: List[str] = [
@@ -1907,7 +3409,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/extraction-task/recycle-failed',
+            resource_path='/extraction-task/release',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -1924,9 +3426,9 @@ class DefaultApi:
 
 
     @validate_call
-    def register_tasks_extraction_task_post(
+    def upsert_accounts_accounts_post(
         self,
-        extraction_task: List[ExtractionTask],
+        account: List[Account],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -1939,13 +3441,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> List[ExtractionTask]:
-        """Register Tasks
+    ) -> UpsertResultsResponse:
+        """Upsert Accounts
 
-        Register tasks
+        Upsert accounts data, the changed ones are synced to NocoDB in the background. Reports how many accounts were written and skipped (unchanged)
 
-        :param extraction_task: (required)
-        :type extraction_task: List[ExtractionTask]
+        :param account: (required)
+        :type account: List[Account]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -1968,8 +3470,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._register_tasks_extraction_task_post_serialize(
-            extraction_task=extraction_task,
+        _param = self._upsert_accounts_accounts_post_serialize(
+            account=account,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -1977,7 +3479,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ExtractionTask]",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -1992,9 +3494,9 @@ class DefaultApi:
 
 
     @validate_call
-    def register_tasks_extraction_task_post_with_http_info(
+    def upsert_accounts_accounts_post_with_http_info(
         self,
-        extraction_task: List[ExtractionTask],
+        account: List[Account],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2007,13 +3509,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[List[ExtractionTask]]:
-        """Register Tasks
+    ) -> ApiResponse[UpsertResultsResponse]:
+        """Upsert Accounts
 
-        Register tasks
+        Upsert accounts data, the changed ones are synced to NocoDB in the background. Reports how many accounts were written and skipped (unchanged)
 
-        :param extraction_task: (required)
-        :type extraction_task: List[ExtractionTask]
+        :param account: (required)
+        :type account: List[Account]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2036,8 +3538,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._register_tasks_extraction_task_post_serialize(
-            extraction_task=extraction_task,
+        _param = self._upsert_accounts_accounts_post_serialize(
+            account=account,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2045,7 +3547,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ExtractionTask]",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -2060,9 +3562,9 @@ class DefaultApi:
 
 
     @validate_call
-    def register_tasks_extraction_task_post_without_preload_content(
+    def upsert_accounts_accounts_post_without_preload_content(
         self,
-        extraction_task: List[ExtractionTask],
+        account: List[Account],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2076,12 +3578,12 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Register Tasks
+        """Upsert Accounts
 
-        Register tasks
+        Upsert accounts data, the changed ones are synced to NocoDB in the background. Reports how many accounts were written and skipped (unchanged)
 
-        :param extraction_task: (required)
-        :type extraction_task: List[ExtractionTask]
+        :param account: (required)
+        :type account: List[Account]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2104,8 +3606,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._register_tasks_extraction_task_post_serialize(
-            extraction_task=extraction_task,
+        _param = self._upsert_accounts_accounts_post_serialize(
+            account=account,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2113,7 +3615,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "List[ExtractionTask]",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -2123,9 +3625,9 @@ class DefaultApi:
         return response_data.response
 
 
-    def _register_tasks_extraction_task_post_serialize(
+    def _upsert_accounts_accounts_post_serialize(
         self,
-        extraction_task,
+        account,
         _request_auth,
         _content_type,
         _headers,
@@ -2135,7 +3637,7 @@ class DefaultApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
-            'ExtractionTask': '',
+            'Account': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -2152,8 +3654,8 @@ class DefaultApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
-        if extraction_task is not None:
-            _body_params = extraction_task
+        if account is not None:
+            _body_params = account
 
 
         # set the HTTP header `Accept`
@@ -2185,7 +3687,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/extraction-task/',
+            resource_path='/accounts/',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -2202,9 +3704,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_accounts_accounts_post(
+    def upsert_posts_posts_post(
         self,
-        account: List[Account],
+        post: List[Post],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2217,13 +3719,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> object:
-        """Upsert Accounts
+    ) -> UpsertResultsResponse:
+        """Upsert Posts
 
-        Upsert accounts data
+        Upsert account posts, the changed ones are synced to NocoDB in the background. Reports how many posts were written and skipped (unchanged)
 
-        :param account: (required)
-        :type account: List[Account]
+        :param post: (required)
+        :type post: List[Post]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2246,8 +3748,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_accounts_accounts_post_serialize(
-            account=account,
+        _param = self._upsert_posts_posts_post_serialize(
+            post=post,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2255,7 +3757,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -2270,9 +3772,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_accounts_accounts_post_with_http_info(
+    def upsert_posts_posts_post_with_http_info(
         self,
-        account: List[Account],
+        post: List[Post],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2285,13 +3787,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[object]:
-        """Upsert Accounts
+    ) -> ApiResponse[UpsertResultsResponse]:
+        """Upsert Posts
 
-        Upsert accounts data
+        Upsert account posts, the changed ones are synced to NocoDB in the background. Reports how many posts were written and skipped (unchanged)
 
-        :param account: (required)
-        :type account: List[Account]
+        :param post: (required)
+        :type post: List[Post]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2314,8 +3816,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_accounts_accounts_post_serialize(
-            account=account,
+        _param = self._upsert_posts_posts_post_serialize(
+            post=post,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2323,7 +3825,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -2338,9 +3840,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_accounts_accounts_post_without_preload_content(
+    def upsert_posts_posts_post_without_preload_content(
         self,
-        account: List[Account],
+        post: List[Post],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2354,12 +3856,12 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Upsert Accounts
+        """Upsert Posts
 
-        Upsert accounts data
+        Upsert account posts, the changed ones are synced to NocoDB in the background. Reports how many posts were written and skipped (unchanged)
 
-        :param account: (required)
-        :type account: List[Account]
+        :param post: (required)
+        :type post: List[Post]
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2382,8 +3884,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_accounts_accounts_post_serialize(
-            account=account,
+        _param = self._upsert_posts_posts_post_serialize(
+            post=post,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2391,7 +3893,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
+            '202': "UpsertResultsResponse",
             '422': "HTTPValidationError",
         }
         response_data = self.api_client.call_api(
@@ -2401,9 +3903,9 @@ class DefaultApi:
         return response_data.response
 
 
-    def _upsert_accounts_accounts_post_serialize(
+    def _upsert_posts_posts_post_serialize(
         self,
-        account,
+        post,
         _request_auth,
         _content_type,
         _headers,
@@ -2413,7 +3915,7 @@ class DefaultApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
-            'Account': '',
+            'Post': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -2430,8 +3932,8 @@ class DefaultApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
-        if account is not None:
-            _body_params = account
+        if post is not None:
+            _body_params = post
 
 
         # set the HTTP header `Accept`
@@ -2463,7 +3965,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/accounts/',
+            resource_path='/posts/',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
@@ -2480,9 +3982,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_posts_posts_post(
+    def upsert_posts_stream_posts_stream_post(
         self,
-        post: List[Post],
+        body: Optional[StrictStr],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2495,13 +3997,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> object:
-        """Upsert Posts
+    ) -> UpsertResultsResponse:
+        """Upsert Posts Stream
 
-        Upsert account posts
+        Upsert account posts sent as NDJSON (one post per line), processed in batches while they are received. Reports how many posts were written and skipped (unchanged)
 
-        :param post: (required)
-        :type post: List[Post]
+        :param body: (required)
+        :type body: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2524,8 +4026,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_posts_posts_post_serialize(
-            post=post,
+        _param = self._upsert_posts_stream_posts_stream_post_serialize(
+            body=body,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2533,8 +4035,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
-            '422': "HTTPValidationError",
+            '202': "UpsertResultsResponse",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -2548,9 +4049,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_posts_posts_post_with_http_info(
+    def upsert_posts_stream_posts_stream_post_with_http_info(
         self,
-        post: List[Post],
+        body: Optional[StrictStr],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2563,13 +4064,13 @@ class DefaultApi:
         _content_type: Optional[StrictStr] = None,
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
-    ) -> ApiResponse[object]:
-        """Upsert Posts
+    ) -> ApiResponse[UpsertResultsResponse]:
+        """Upsert Posts Stream
 
-        Upsert account posts
+        Upsert account posts sent as NDJSON (one post per line), processed in batches while they are received. Reports how many posts were written and skipped (unchanged)
 
-        :param post: (required)
-        :type post: List[Post]
+        :param body: (required)
+        :type body: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2592,8 +4093,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_posts_posts_post_serialize(
-            post=post,
+        _param = self._upsert_posts_stream_posts_stream_post_serialize(
+            body=body,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2601,8 +4102,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
-            '422': "HTTPValidationError",
+            '202': "UpsertResultsResponse",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -2616,9 +4116,9 @@ class DefaultApi:
 
 
     @validate_call
-    def upsert_posts_posts_post_without_preload_content(
+    def upsert_posts_stream_posts_stream_post_without_preload_content(
         self,
-        post: List[Post],
+        body: Optional[StrictStr],
         _request_timeout: Union[
             None,
             Annotated[StrictFloat, Field(gt=0)],
@@ -2632,12 +4132,12 @@ class DefaultApi:
         _headers: Optional[Dict[StrictStr, Any]] = None,
         _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,
     ) -> RESTResponseType:
-        """Upsert Posts
+        """Upsert Posts Stream
 
-        Upsert account posts
+        Upsert account posts sent as NDJSON (one post per line), processed in batches while they are received. Reports how many posts were written and skipped (unchanged)
 
-        :param post: (required)
-        :type post: List[Post]
+        :param body: (required)
+        :type body: str
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
@@ -2660,8 +4160,8 @@ class DefaultApi:
         :return: Returns the result object.
         """ # noqa: E501
 
-        _param = self._upsert_posts_posts_post_serialize(
-            post=post,
+        _param = self._upsert_posts_stream_posts_stream_post_serialize(
+            body=body,
             _request_auth=_request_auth,
             _content_type=_content_type,
             _headers=_headers,
@@ -2669,8 +4169,7 @@ class DefaultApi:
         )
 
         _response_types_map: Dict[str, Optional[str]] = {
-            '200': "object",
-            '422': "HTTPValidationError",
+            '202': "UpsertResultsResponse",
         }
         response_data = self.api_client.call_api(
             *_param,
@@ -2679,9 +4178,9 @@ class DefaultApi:
         return response_data.response
 
 
-    def _upsert_posts_posts_post_serialize(
+    def _upsert_posts_stream_posts_stream_post_serialize(
         self,
-        post,
+        body,
         _request_auth,
         _content_type,
         _headers,
@@ -2691,7 +4190,6 @@ class DefaultApi:
         _host = None
 
         _collection_formats: Dict[str, str] = {
-            'Post': '',
         }
 
         _path_params: Dict[str, str] = {}
@@ -2708,8 +4206,8 @@ class DefaultApi:
         # process the header parameters
         # process the form parameters
         # process the body parameter
-        if post is not None:
-            _body_params = post
+        if body is not None:
+            _body_params = body
 
 
         # set the HTTP header `Accept`
@@ -2727,7 +4225,7 @@ class DefaultApi:
             _default_content_type = (
                 self.api_client.select_header_content_type(
                     [
-                        'application/json'
+                        'application/x-ndjson'
                     ]
                 )
             )
@@ -2741,7 +4239,7 @@ class DefaultApi:
 
         return self.api_client.param_serialize(
             method='POST',
-            resource_path='/posts/',
+            resource_path='/posts/stream',
             path_params=_path_params,
             query_params=_query_params,
             header_params=_header_params,
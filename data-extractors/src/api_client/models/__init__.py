@@ -15,6 +15,7 @@
 # import models into model package
 from api_client.models.account import Account
 from api_client.models.detailed_stats import DetailedStats
+from api_client.models.extend_task_lease_response import ExtendTaskLeaseResponse
 from api_client.models.extract_account_task_config import ExtractAccountTaskConfig
 from api_client.models.extract_post_details_task_config import ExtractPostDetailsTaskConfig
 from api_client.models.extract_post_list_task_config import ExtractPostListTaskConfig
@@ -24,14 +25,22 @@ from api_client.models.extraction_task_stats_response import ExtractionTaskStats
 from api_client.models.extraction_task_status import ExtractionTaskStatus
 from api_client.models.extraction_task_type import ExtractionTaskType
 from api_client.models.http_validation_error import HTTPValidationError
-from api_client.models.influencer import Influencer
 from api_client.models.location_inner import LocationInner
 from api_client.models.mark_task_failed_payload import MarkTaskFailedPayload
+from api_client.models.mark_tasks_completed_payload import MarkTasksCompletedPayload
+from api_client.models.mark_tasks_failed_payload import MarkTasksFailedPayload
+from api_client.models.mark_tasks_response import MarkTasksResponse
 from api_client.models.post import Post
 from api_client.models.recycle_expired_tasks_response import RecycleExpiredTasksResponse
 from api_client.models.recycle_failed_tasks_response import RecycleFailedTasksResponse
+from api_client.models.register_tasks_response import RegisterTasksResponse
+from api_client.models.release_tasks_payload import ReleaseTasksPayload
 from api_client.models.social_network import SocialNetwork
 from api_client.models.task_config import TaskConfig
 from api_client.models.task_config1 import TaskConfig1
+from api_client.models.task_failure import TaskFailure
+from api_client.models.task_lease import TaskLease
+from api_client.models.task_mark_result import TaskMarkResult
+from api_client.models.upsert_results_response import UpsertResultsResponse
 from api_client.models.validation_error import ValidationError
 
@@ -18,8 +18,9 @@ import re  # noqa: F401
 import json
 
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, StrictStr
 from typing import Any, ClassVar, Dict, List, Optional
+from typing_extensions import Annotated
 from uuid import UUID
 from api_client.models.extraction_task_status import ExtractionTaskStatus
 from api_client.models.extraction_task_type import ExtractionTaskType
@@ -40,7 +41,8 @@ class ExtractionTask(BaseModel):
     status: Optional[ExtractionTaskStatus] = None
     visible_at: Optional[datetime] = None
     error: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = ["uid", "social_network", "type", "task_config", "status", "visible_at", "error"]
+    priority: Optional[Annotated[int, Field(le=32767, strict=True, ge=-32768)]] = None
+    __properties: ClassVar[List[str]] = ["uid", "social_network", "type", "task_config", "status", "visible_at", "error", "priority"]
 
     model_config = ConfigDict(
         validate_by_name=True,
@@ -104,6 +106,11 @@ class ExtractionTask(BaseModel):
         if self.error is None and "error" in self.model_fields_set:
             _dict['error'] = None
 
+        # set to None if priority (nullable) is None
+        # and model_fields_set contains the field
+        if self.priority is None and "priority" in self.model_fields_set:
+            _dict['priority'] = None
+
         return _dict
 
     @classmethod
@@ -122,7 +129,8 @@ class ExtractionTask(BaseModel):
             "task_config": TaskConfig.from_dict(obj["task_config"]) if obj.get("task_config") is not None else None,
             "status": obj.get("status"),
             "visible_at": obj.get("visible_at"),
-            "error": obj.get("error")
+            "error": obj.get("error"),
+            "priority": obj.get("priority")
         })
         return _obj
 
@@ -38,7 +38,8 @@ class ExtractionTaskResponse(BaseModel):
     type: Optional[ExtractionTaskType] = None
     task_config: Optional[TaskConfig1] = None
     error: Optional[StrictStr] = None
-    __properties: ClassVar[List[str]] = ["task_uid", "social_network", "visible_at", "type", "task_config", "error"]
+    lease_token: Optional[UUID] = None
+    __properties: ClassVar[List[str]] = ["task_uid", "social_network", "visible_at", "type", "task_config", "error", "lease_token"]
 
     model_config = ConfigDict(
         validate_by_name=True,
@@ -112,6 +113,11 @@ class ExtractionTaskResponse(BaseModel):
         if self.error is None and "error" in self.model_fields_set:
             _dict['error'] = None
 
+        # set to None if lease_token (nullable) is None
+        # and model_fields_set contains the field
+        if self.lease_token is None and "lease_token" in self.model_fields_set:
+            _dict['lease_token'] = None
+
         return _dict
 
     @classmethod
@@ -129,7 +135,8 @@ class ExtractionTaskResponse(BaseModel):
             "visible_at": obj.get("visible_at"),
             "type": obj.get("type"),
             "task_config": TaskConfig1.from_dict(obj["task_config"]) if obj.get("task_config") is not None else None,
-            "error": obj.get("error")
+            "error": obj.get("error"),
+            "lease_token": obj.get("lease_token")
         })
         return _obj
 
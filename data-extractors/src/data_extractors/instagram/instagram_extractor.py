@@ -11,7 +11,6 @@ from extraction_task.extraction_task_result import (
     PostDetailsExtractionResult,
     PostListExtractionResult,
 )
-import time
 import random
 import datetime
 from datetime import timezone
@@ -20,9 +19,26 @@ import logging
 import instaloader
 from instaloader import NodeIterator, Post
 
+import worker_metrics
+
 logger = logging.getLogger(__name__)
 
 
+class MeasuredRateController(instaloader.RateController):
+    """Instaloader rate controller counting queries and rate limiting sleeps.
+
+    Queries are sent through sessions instaloader creates on the fly: their
+    response bytes and network time are not measured.
+    """
+
+    def wait_before_query(self, query_type: str) -> None:
+        super().wait_before_query(query_type)
+        worker_metrics.record_http_query()
+
+    def sleep(self, secs: float) -> None:
+        worker_metrics.sleep(secs)
+
+
 class InstagramExtractor(DataExtractor):
     def __init__(self) -> None:
         self.L = instaloader.Instaloader(
@@ -30,6 +46,7 @@ class InstagramExtractor(DataExtractor):
             download_videos=False,
             download_video_thumbnails=False,
             compress_json=False,
+            rate_controller=MeasuredRateController,
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
         )
 
@@ -178,7 +195,7 @@ class InstagramExtractor(DataExtractor):
 
             random_sleep = random.uniform(2, 6)
             logger.debug(f"Sleeping for random duration {random_sleep:0.1f}s")
-            time.sleep(random_sleep)
+            worker_metrics.sleep(random_sleep)
 
         # End of cursor reached
         fetch_duration = datetime.datetime.now().timestamp() - start_time.timestamp()
@@ -5,6 +5,8 @@ import logging
 
 from bs4 import BeautifulSoup
 
+import worker_metrics
+
 from data_extractors.data_extractor import DataExtractor
 from extraction_task.extraction_task_config import (
     ExtractAccountTaskConfig,
@@ -43,6 +45,7 @@ class TiktokExtractor(DataExtractor):
             headers=self.headers,
             timeout=20,
             stream=False,
+            hooks={"response": worker_metrics.record_http_response},
         )
         response.raise_for_status()
 
@@ -87,6 +90,7 @@ class TiktokExtractor(DataExtractor):
             headers=self.headers,
             timeout=20,
             stream=False,
+            hooks={"response": worker_metrics.record_http_response},
         )
         data = self._extract_rehydration_data(response.text)
         post_data = data["__DEFAULT_SCOPE__"]["webapp.video-detail"]["itemInfo"][
@@ -5,10 +5,9 @@ import logging
 from os import path
 from pathlib import Path
 
-from TikTokApi import TikTokApi
-
 from data_extractors.data_extractor import DataExtractor
 from data_extractors.tiktok.tta.tiktokapi import (
+    MeasuredTikTokApi,
     TikTokApiConfig,
     create_sessions,
     get_videos_for_date_range,
@@ -59,7 +58,7 @@ class TiktokExtractorTTA(DataExtractor):
         task_config: ExtractAccountTaskConfig,
     ) -> AccountExtractionResult:
         try:
-            async with TikTokApi() as api:
+            async with MeasuredTikTokApi() as api:
                 await create_sessions(api, self.api_config)
                 user_data = await api.user(username=task_config.account_id).info()
                 self._write_user_dict_to_disk(task_config.account_id, user_data)
@@ -104,7 +103,7 @@ class TiktokExtractorTTA(DataExtractor):
         posts: list[PostDetailsExtractionResult] = []
 
         try:
-            async with TikTokApi() as api:
+            async with MeasuredTikTokApi() as api:
                 await create_sessions(api, self.api_config)
 
                 user = api.user(username=task_config.account_id)
@@ -155,7 +154,7 @@ class TiktokExtractorTTA(DataExtractor):
         try:
             video_id = task_config.post_id
 
-            async with TikTokApi() as api:
+            async with MeasuredTikTokApi() as api:
                 await create_sessions(api, self.api_config)
                 user_agnostic_video_url = (
                     f"https://www.tiktok.com/@tiktok/video/{video_id}"
@@ -3,16 +3,36 @@ from collections import defaultdict
 import datetime
 import logging
 import random
-from typing import Literal
+import time
+from typing import Any, Literal
 from playwright.async_api import async_playwright
 
 from TikTokApi import TikTokApi
 from pydantic import BaseModel
 
+import worker_metrics
+
 
 logger = logging.getLogger(__name__)
 
 
+class MeasuredTikTokApi(TikTokApi):
+    """TikTokApi recording its requests in the worker metrics.
+
+    Requests are fetches run in the playwright session page: their duration
+    and response size are measured around it.
+    """
+
+    async def run_fetch_script(self, url: str, headers: dict, **kwargs: Any) -> Any:
+        started_at = time.monotonic()
+        result = await super().run_fetch_script(url, headers=headers, **kwargs)
+        worker_metrics.record_http_call(
+            len(result.encode()) if isinstance(result, str) else 0,
+            time.monotonic() - started_at,
+        )
+        return result
+
+
 async def get_ms_tokens(headless: bool) -> list[str]:
     async with async_playwright() as p:
         browser = await p.chromium.launch(
@@ -116,6 +136,7 @@ async def get_videos_for_date_range(
         random_sleep = random.triangular(MIN_WAIT, MAX_WAIT, MIN_WAIT)
         logger.debug(f"Sleeping for random duration {random_sleep:0.1f}s")
         await asyncio.sleep(random_sleep)
+        worker_metrics.record_sleep(random_sleep)
         index += 1
 
     # End of cursor reached
@@ -136,6 +157,10 @@ class TikTokApiConfig(BaseModel):
     headless: bool
 
 
+# Seconds the sessions wait after their creation, for the msToken to be generated
+SESSION_SLEEP_AFTER = 3
+
+
 async def create_sessions(api: TikTokApi, config: TikTokApiConfig) -> None:
     if config.ms_token is None:
         ms_tokens = None
@@ -146,8 +171,9 @@ async def create_sessions(api: TikTokApi, config: TikTokApiConfig) -> None:
     await api.create_sessions(
         ms_tokens=ms_tokens,
         num_sessions=1,
-        sleep_after=3,
+        sleep_after=SESSION_SLEEP_AFTER,
         timeout=60000,
         browser="chromium",
         headless=config.headless,
     )
+    worker_metrics.record_sleep(SESSION_SLEEP_AFTER)
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 import hashlib
 import json
 import logging
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any
@@ -128,9 +130,13 @@ class DiskCache:
             "data": data,
         }
 
+        # Written to a temporary file then renamed: extractors sharing the cache
+        # folder (concurrent task slots) never read a partially written entry
+        tmp_path = cache_path.with_name(f"{key}.{threading.get_ident()}.tmp")
         try:
-            with open(cache_path, "w", encoding="utf-8") as f:
+            with open(tmp_path, "w", encoding="utf-8") as f:
                 json.dump(cache_data, f, indent=2)
+            os.replace(tmp_path, cache_path)
             logger.debug(f"Cached response for url {url} with key {key}s")
         except OSError as e:
             logger.warning(f"Failed to write cache for key {key}: {e}")
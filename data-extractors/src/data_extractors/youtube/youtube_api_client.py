@@ -8,6 +8,8 @@ from typing import Any
 
 import requests
 
+import worker_metrics
+
 from .disk_cache import DiskCache
 from .youtube_api_config import YoutubeApiConfig
 
@@ -106,6 +108,7 @@ class YoutubeApiClient:
     def __init__(self, config: YoutubeApiConfig):
         self.config = config
         self.session = requests.Session()
+        self.session.hooks["response"].append(worker_metrics.record_http_response)
         self._disk_cache = DiskCache(config=config.cache_config)
 
     def get_channel_by_id(self, id: str) -> Channel:
@@ -294,6 +297,8 @@ class YoutubeApiClient:
 
         # Check cache first
         cached_data = self._disk_cache.get(url, params)
+        if self._disk_cache.enabled:
+            worker_metrics.record_cache_lookup(hit=cached_data is not None)
         if cached_data is not None:
             logger.debug(f"Cache hit for {endpoint}")
             return cached_data
@@ -1,7 +1,14 @@
 import logging
 
-from api_client import api_client
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http import HTTPStatus
+
+import urllib3
+
+from api_client import api_client, rest
 from api_client.api import DefaultApi
+from api_client.exceptions import ApiException
 from extraction_task.extraction_task import (
     ExtractionTask,
     ExtractionTaskType,
@@ -18,7 +25,10 @@ from extraction_task.extraction_task_result import (
     PostDetailsExtractionResult,
     PostListExtractionResult,
 )
-from extraction_task.extraction_task_service import ExtractionTaskService
+from extraction_task.extraction_task_service import (
+    ExtractionTaskService,
+    TaskLeaseLostError,
+)
 from extraction_task.api.mappings import (
     to_api_social_network,
     to_domain_extractions_task,
@@ -28,31 +38,58 @@ from api_client.models import (
     Account,
     Post as ApiPost,
     MarkTaskFailedPayload,
+    ReleaseTasksPayload,
+    TaskLease,
+    UpsertResultsResponse,
 )
 
 from extraction_task.social_network import SocialNetwork as DomainSocialNetwork
 
 LOGGER = logging.getLogger(__name__)
 
+# Posts sent per request of the JSON upsert endpoint. Larger post lists are
+# streamed in a single NDJSON request
+POSTS_CHUNK_SIZE = 300
+
 
 class ApiExtractionTaskService(ExtractionTaskService):
     """Service to communicate with the HTTP API for extraction tasks.
 
     Uses the typed ApiClient to interact with the OPI API endpoints.
     Maps between API models and domain models.
+    Thread safe: may be shared by concurrent task slots.
+
+    Requests time out after request_timeout (connect, read) seconds: the read
+    timeout must stay above the long polling wait.
     """
 
-    def __init__(self, api_url: str, api_token: str) -> None:
+    def __init__(
+        self,
+        api_url: str,
+        api_token: str,
+        max_connections: int | None = None,
+        request_timeout: tuple[float, float] = (10, 300),
+    ) -> None:
         configuration = api_client.Configuration(access_token=api_token, host=api_url)
+        if max_connections is not None:
+            configuration.connection_pool_maxsize = max(
+                configuration.connection_pool_maxsize, max_connections
+            )
         self._client = api_client.ApiClient(configuration=configuration)
         self._api = DefaultApi(self._client)
+        self._request_timeout = request_timeout
+        # Cleared when the API has no /posts/stream endpoint
+        self._stream_posts = True
 
     def acquire_next_task(
-        self, social_network: DomainSocialNetwork
+        self, social_network: DomainSocialNetwork, wait_seconds: int = 0
     ) -> ExtractionTask | None:
-
+        # Long polling: the server holds the request until a task is available
+        # or wait_seconds elapsed
         response = self._api.acquire_available_task_extraction_task_acquire_post(
-            to_api_social_network(social_network)
+            to_api_social_network(social_network),
+            wait_seconds=wait_seconds,
+            _request_timeout=self._request_timeout,
         )
 
         # Check if no task is available
@@ -62,16 +99,69 @@ class ApiExtractionTaskService(ExtractionTaskService):
         # Convert API response to domain model using the shared mapping function
         return to_domain_extractions_task(response)
 
+    def acquire_next_tasks(
+        self, social_network: DomainSocialNetwork, count: int, wait_seconds: int = 0
+    ) -> list[ExtractionTask]:
+        # Single request (and statement) for the whole batch
+        responses = (
+            self._api.acquire_available_tasks_extraction_task_acquire_batch_post(
+                to_api_social_network(social_network),
+                count=count,
+                wait_seconds=wait_seconds,
+                _request_timeout=self._request_timeout,
+            )
+        )
+        return [to_domain_extractions_task(response) for response in responses]
+
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        """Release acquired tasks back to available."""
+        if not tasks:
+            return
+        response = self._api.release_tasks_extraction_task_release_post(
+            ReleaseTasksPayload(
+                tasks=[
+                    TaskLease(task_uid=task.id, lease_token=task.lease_token)
+                    for task in tasks
+                ]
+            ),
+            _request_timeout=self._request_timeout,
+        )
+        LOGGER.info("%s/%s tasks released", response.updated_count, len(tasks))
+
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        """Extend the lease of an acquired task."""
+        with _lease_conflict_as_lost(task):
+            response = (
+                self._api.extend_task_lease_extraction_task_task_uid_extend_lease_post(
+                    task.id,
+                    lease_token=task.lease_token,
+                    _request_timeout=self._request_timeout,
+                )
+            )
+        task.visible_at = response.visible_at
+
     def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
         """Mark a task as failed."""
-        self._api.mark_failed_extraction_task_task_uid_mark_failed_post(
-            task.id, mark_task_failed_payload=MarkTaskFailedPayload(error=task_error)
-        )
+        with _lease_conflict_as_lost(task):
+            self._api.mark_failed_extraction_task_task_uid_mark_failed_post(
+                task.id,
+                mark_task_failed_payload=MarkTaskFailedPayload(error=task_error),
+                lease_token=task.lease_token,
+                _request_timeout=self._request_timeout,
+            )
 
     def mark_task_completed(
         self, task: ExtractionTask, task_result: ExtractionTaskResult
     ) -> None:
-        """Mark a task as completed and process the result."""
+        """Mark a task as completed and process the result.
+
+        Raises TaskLeaseLostError, without uploading the result, if the task lease
+        expired or the task was acquired again by another worker.
+        """
+
+        # Check the task is still ours (and keep it, or take it back if its lease
+        # expired, for the upload) before writing
+        self.extend_task_lease(task)
 
         LOGGER.info("Upserting data...")
         # Handle different task types
@@ -95,9 +185,12 @@ class ApiExtractionTaskService(ExtractionTaskService):
 
         # Mark task as completed
         LOGGER.info("Marking extraction task complete")
-        self._api.mark_completed_extraction_task_task_uid_mark_completed_post(
-            task.id,
-        )
+        with _lease_conflict_as_lost(task):
+            self._api.mark_completed_extraction_task_task_uid_mark_completed_post(
+                task.id,
+                lease_token=task.lease_token,
+                _request_timeout=self._request_timeout,
+            )
 
     def _upsert_account(
         self,
@@ -120,7 +213,9 @@ class ApiExtractionTaskService(ExtractionTaskService):
             categories=task_result.categories,
         )
 
-        self._api.upsert_accounts_accounts_post([account])
+        self._api.upsert_accounts_accounts_post(
+            [account], _request_timeout=self._request_timeout
+        )
 
     def _parse_task_config(
         self, task_type: ExtractionTaskType, config_dict: dict
@@ -168,13 +263,85 @@ class ApiExtractionTaskService(ExtractionTaskService):
             for post_details in post_details_list
         ]
 
-        chunk_size = 300
+        if len(api_posts) > POSTS_CHUNK_SIZE and self._stream_posts:
+            LOGGER.info("upserting %s posts", len(api_posts))
+            try:
+                response = self._upsert_posts_stream(api_posts)
+            except ApiException as e:
+                if e.status != HTTPStatus.NOT_FOUND:
+                    raise
+                LOGGER.warning("API has no posts stream endpoint -> Upserting chunks")
+                self._stream_posts = False
+            else:
+                LOGGER.info(
+                    "%s posts written, %s unchanged",
+                    response.written_count,
+                    response.skipped_count,
+                )
+                return
+
         api_posts_chunks = [
-            api_posts[i : i + chunk_size] for i in range(0, len(api_posts), chunk_size)
+            api_posts[i : i + POSTS_CHUNK_SIZE]
+            for i in range(0, len(api_posts), POSTS_CHUNK_SIZE)
         ]
-
         for chunkIndex, chunk in enumerate(api_posts_chunks):
             LOGGER.info(
                 "upserting post chunk %s/%s", chunkIndex + 1, len(api_posts_chunks)
             )
-            self._api.upsert_posts_posts_post(chunk)
+            response = self._api.upsert_posts_posts_post(
+                chunk, _request_timeout=self._request_timeout
+            )
+            LOGGER.info(
+                "%s posts written, %s unchanged",
+                response.written_count,
+                response.skipped_count,
+            )
+
+    def _upsert_posts_stream(self, api_posts: list[ApiPost]) -> UpsertResultsResponse:
+        """Upload posts as NDJSON in a single chunked request, processed as they arrive.
+
+        The generated client json-encodes bodies of any json content type, and its
+        REST layer does not accept a generator body: the request is serialized by the
+        client but sent through its urllib3 pool (which applies the configured retries,
+        proxy and SSL settings) with an explicit timeout.
+        """
+        method, url, headers, _, _ = self._client.param_serialize(
+            method="POST",
+            resource_path="/posts/stream",
+            header_params={
+                "Accept": "application/json",
+                "Content-Type": "application/x-ndjson",
+            },
+            auth_settings=["HTTPBearer"],
+        )
+        response_data = rest.RESTResponse(
+            self._client.rest_client.pool_manager.request(
+                method,
+                url,
+                body=(post.to_json().encode() + b"\n" for post in api_posts),
+                headers=headers,
+                chunked=True,
+                timeout=urllib3.Timeout(
+                    connect=self._request_timeout[0], read=self._request_timeout[1]
+                ),
+                preload_content=False,
+            )
+        )
+        response_data.read()
+        response = self._client.response_deserialize(
+            response_data=response_data,
+            response_types_map={"202": "UpsertResultsResponse"},
+        ).data
+        assert isinstance(response, UpsertResultsResponse)
+        return response
+
+
+@contextmanager
+def _lease_conflict_as_lost(task: ExtractionTask) -> Iterator[None]:
+    """Raise TaskLeaseLostError when the API responds the task lease is not ours."""
+    try:
+        yield
+    except ApiException as e:
+        if e.status == HTTPStatus.CONFLICT:
+            raise TaskLeaseLostError(f"Task {task.id} lease expired") from e
+        raise
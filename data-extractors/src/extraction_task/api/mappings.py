@@ -154,6 +154,7 @@ def to_domain_extractions_task(
         status=DomainExtractionTaskStatus.ACQUIRED,
         visible_at=visible_at,
         error=task_response.error,
+        lease_token=task_response.lease_token,
     )
 
 
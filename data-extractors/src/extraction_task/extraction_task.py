@@ -28,6 +28,8 @@ class ExtractionTask(BaseModel):
     status: ExtractionTaskStatus
     visible_at: Optional[AwareDatetime]
     error: Optional[str]
+    # Fencing token of the current lease, when the backend provides one
+    lease_token: Optional[uuid.UUID] = None
 
     def is_acquirable(self) -> bool:
         return self.status == ExtractionTaskStatus.AVAILABLE or (
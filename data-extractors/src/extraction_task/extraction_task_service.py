@@ -10,11 +10,51 @@ from extraction_task.extraction_task_result import (
 from extraction_task.social_network import SocialNetwork
 
 
+class TaskLeaseLostError(Exception):
+    """Raised when a task is no longer acquired by the caller (lease expired)."""
+
+
 class ExtractionTaskService(ABC):
     @abstractmethod
     def acquire_next_task(
-        self, social_network: SocialNetwork
+        self, social_network: SocialNetwork, wait_seconds: int = 0
     ) -> Optional[ExtractionTask]:
+        """Acquire the next available task.
+
+        If none is available, wait up to wait_seconds for one before returning None.
+        """
+        print("Abstract method1")
+        return None
+
+    def acquire_next_tasks(
+        self, social_network: SocialNetwork, count: int, wait_seconds: int = 0
+    ) -> list[ExtractionTask]:
+        """Acquire up to count available tasks.
+
+        If none is available, wait up to wait_seconds for some before returning
+        an empty list.
+        """
+        tasks: list[ExtractionTask] = []
+        task = self.acquire_next_task(social_network, wait_seconds)
+        while task is not None:
+            tasks.append(task)
+            if len(tasks) >= count:
+                break
+            task = self.acquire_next_task(social_network)
+        return tasks
+
+    @abstractmethod
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        """Give back acquired tasks that will not be executed, available again."""
+        print("Abstract method1")
+        return None
+
+    @abstractmethod
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        """Extend the lease of an acquired task and update its visible_at.
+
+        Raises TaskLeaseLostError if the task lease already expired.
+        """
         print("Abstract method1")
         return None
 
@@ -22,10 +62,18 @@ class ExtractionTaskService(ABC):
     def mark_task_completed(
         self, task: ExtractionTask, task_result: ExtractionTaskResult
     ) -> None:
+        """Store the task result and mark the task completed.
+
+        Raise TaskLeaseLostError if the task lease was lost: the result is dropped.
+        """
         print("Abstract method1")
         return None
 
     @abstractmethod
     def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
+        """Mark the task failed.
+
+        Raise TaskLeaseLostError if the task lease was lost.
+        """
         print("Abstract method1")
         return None
@@ -1,4 +1,6 @@
 import datetime
+import threading
+import time
 from typing import Optional
 from extraction_task.local.account_repository import Account, AccountRepository
 from extraction_task.local.post_repository import (
@@ -6,7 +8,10 @@ from extraction_task.local.post_repository import (
     PostRepository,
 )
 from extraction_task.local.task_repository import TaskRepository
-from extraction_task.extraction_task_service import ExtractionTaskService
+from extraction_task.extraction_task_service import (
+    ExtractionTaskService,
+    TaskLeaseLostError,
+)
 from extraction_task.extraction_task import (
     ExtractionTask,
     ExtractionTaskStatus,
@@ -42,6 +47,10 @@ class LocalExtractionTaskService(ExtractionTaskService):
 
     _create_post_details_tasks: bool
 
+    # Tasks are executed by concurrent slots and leases extended from heartbeat
+    # threads: serializes the task and result files read-modify-write cycles
+    _task_lock: threading.Lock
+
     def __init__(
         self,
         task_repository: TaskRepository,
@@ -54,25 +63,66 @@ class LocalExtractionTaskService(ExtractionTaskService):
         self._post_repository = post_repository
 
         self._create_post_details_tasks = create_post_details_tasks
+        self._task_lock = threading.Lock()
 
     def acquire_next_task(
-        self, social_network: SocialNetwork
+        self, social_network: SocialNetwork, wait_seconds: int = 0
     ) -> Optional[ExtractionTask]:
-        task = self._task_repository.get_first_acquirable_task(social_network)
-
-        if task is None:
-            return None
-
-        task.status = ExtractionTaskStatus.ACQUIRED
-        task.visible_at = datetime.datetime.now(
-            datetime.timezone.utc
-        ) + datetime.timedelta(minutes=60)
-        self._task_repository.upsert(task)
-
+        deadline = time.monotonic() + wait_seconds
+        task = self._acquire_first_acquirable_task(social_network)
+        while task is None and time.monotonic() < deadline:
+            # Tasks file has no change notification: poll it
+            time.sleep(1)
+            task = self._acquire_first_acquirable_task(social_network)
         return task
 
+    def _acquire_first_acquirable_task(
+        self, social_network: SocialNetwork
+    ) -> Optional[ExtractionTask]:
+        with self._task_lock:
+            task = self._task_repository.get_first_acquirable_task(social_network)
+            if task is None:
+                return None
+
+            task.status = ExtractionTaskStatus.ACQUIRED
+            task.visible_at = _lease_end()
+            self._task_repository.upsert(task)
+            return task
+
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        with self._task_lock:
+            for task in tasks:
+                refetched_task = self._task_repository.find_by_id(task.id)
+                if (
+                    refetched_task is None
+                    or not refetched_task.is_acquired_and_current()
+                ):
+                    continue
+                refetched_task.status = ExtractionTaskStatus.AVAILABLE
+                refetched_task.visible_at = None
+                self._task_repository.upsert(refetched_task)
+
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        with self._task_lock:
+            refetched_task = self._task_repository.find_by_id(task.id)
+            if refetched_task is None:
+                raise Exception("Task does not exist")
+
+            if not refetched_task.is_acquired_and_current():
+                raise TaskLeaseLostError(f"Task {task.id} lease expired")
+
+            refetched_task.visible_at = _lease_end()
+            self._task_repository.upsert(refetched_task)
+            task.visible_at = refetched_task.visible_at
+
     def mark_task_completed(
         self, task: ExtractionTask, task_result: ExtractionTaskResult
+    ) -> None:
+        with self._task_lock:
+            self._mark_task_completed(task, task_result)
+
+    def _mark_task_completed(
+        self, task: ExtractionTask, task_result: ExtractionTaskResult
     ) -> None:
         task_config = task.task_config
         refetched_task = self._task_repository.find_by_id(task.id)
@@ -80,7 +130,7 @@ class LocalExtractionTaskService(ExtractionTaskService):
             raise Exception("Task does not exist")
 
         if not refetched_task.is_acquired_and_current():
-            raise Exception("Task is not acquired or acquisition timedout")
+            raise TaskLeaseLostError(f"Task {task.id} lease expired")
 
         if task.type == ExtractionTaskType.EXTRACT_ACCOUNT:
             assert isinstance(task_result, AccountExtractionResult)
@@ -120,7 +170,6 @@ class LocalExtractionTaskService(ExtractionTaskService):
         refetched_task.error = None
         refetched_task.status = ExtractionTaskStatus.COMPLETED
         self._task_repository.upsert(refetched_task)
-        return
 
     def _upsert_posts(
         self,
@@ -155,18 +204,25 @@ class LocalExtractionTaskService(ExtractionTaskService):
         self._post_repository.upsert_post_list(post_details_list)
 
     def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
+        with self._task_lock:
+            self._mark_task_failed(task, task_error)
+
+    def _mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
         refetched_task = self._task_repository.find_by_id(task.id)
         if refetched_task is None:
             raise Exception("Task does not exist")
 
         if not refetched_task.is_acquired_and_current():
-            raise Exception(
-                f"Task is not acquired or acquisition timed out - status:{task.status}, visible_at:{task.visible_at}"
+            raise TaskLeaseLostError(
+                f"Task {task.id} lease expired - status:{refetched_task.status},"
+                f" visible_at:{refetched_task.visible_at}"
             )
 
         refetched_task.status = ExtractionTaskStatus.FAILED
         refetched_task.error = task_error
         refetched_task.visible_at = None
-
         self._task_repository.upsert(refetched_task)
-        return
+
+
+def _lease_end() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=60)
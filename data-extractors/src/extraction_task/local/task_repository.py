@@ -22,7 +22,8 @@ class TaskRepository:
 
     def __init__(self, tasks_csv_file: str):
         self._csv_repository = CsvRowRepository(
-            tasks_csv_file, list(ExtractionTask.model_fields.keys())
+            tasks_csv_file,
+            [field for field in ExtractionTask.model_fields if field != "lease_token"],
         )
 
     def find_by_id(self, id: UUID) -> Optional[ExtractionTask]:
@@ -80,7 +81,8 @@ class TaskRepository:
         return ExtractionTask.model_validate(csv_row)
 
     def _task_to_csv_row(self, task: ExtractionTask) -> dict:
-        dict = task.model_dump()
+        # Leases of the tasks file are not fenced: no lease token column
+        dict = task.model_dump(exclude={"lease_token"})
         json_task_config = json.dumps(task.task_config.model_dump(mode="json"))
         dict["task_config"] = json_task_config
         return dict
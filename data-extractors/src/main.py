@@ -36,7 +36,7 @@ class DataExtractorsCli(BaseSettings):
 def main() -> None:
     logging.basicConfig(
         level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        format="%(asctime)s - %(threadName)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),
         ],
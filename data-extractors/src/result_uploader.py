@@ -0,0 +1,328 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Optional
+
+from extraction_task.extraction_task import ExtractionTask
+from extraction_task.extraction_task_result import (
+    AccountExtractionResult,
+    ExtractionTaskResult,
+    PostDetailsExtractionResult,
+    PostListExtractionResult,
+)
+from extraction_task.extraction_task_service import (
+    ExtractionTaskService,
+    TaskLeaseLostError,
+)
+from extraction_task.social_network import SocialNetwork
+from task_processing_loop import TaskLeaseHeartbeat
+from worker_metrics import WORKER_METRICS
+
+logger = logging.getLogger(__name__)
+
+_RESULT_TYPES: dict[
+    str,
+    type[AccountExtractionResult]
+    | type[PostListExtractionResult]
+    | type[PostDetailsExtractionResult],
+] = {
+    result_type.__name__: result_type
+    for result_type in (
+        AccountExtractionResult,
+        PostListExtractionResult,
+        PostDetailsExtractionResult,
+    )
+}
+
+
+@dataclass
+class SpooledResult:
+    id: int
+    task: ExtractionTask
+    result: ExtractionTaskResult
+
+
+class ResultSpool:
+    """Task results waiting for upload, persisted in a SQLite database.
+
+    A result is committed to the spool before its task is reported done, and
+    deleted once it is uploaded and the task marked completed: the results of a
+    process that crashed or stopped are still on disk on next start.
+    The spool is locked by the process using it.
+    """
+
+    def __init__(self, spool_file: str):
+        os.makedirs(os.path.dirname(spool_file) or ".", exist_ok=True)
+        # Autocommit: each statement is durable once it returns
+        self._connection = sqlite3.connect(
+            spool_file, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        try:
+            self._connection.execute("PRAGMA locking_mode = EXCLUSIVE")
+            self._connection.execute("PRAGMA synchronous = FULL")
+            # Takes the exclusive lock, kept until the spool is closed
+            self._connection.execute("BEGIN EXCLUSIVE")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS spooled_result (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task TEXT NOT NULL,
+                    result_type TEXT NOT NULL,
+                    result TEXT NOT NULL
+                )
+                """
+            )
+            self._connection.execute("COMMIT")
+        except sqlite3.OperationalError as e:
+            self._connection.close()
+            raise Exception(
+                f"Result spool {spool_file} is used by another process:"
+                " configure another result_spool_file"
+            ) from e
+
+    def append(self, task: ExtractionTask, result: ExtractionTaskResult) -> int:
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO spooled_result (task, result_type, result)"
+                " VALUES (?, ?, ?)",
+                (
+                    task.model_dump_json(),
+                    type(result).__name__,
+                    result.model_dump_json(),
+                ),
+            )
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def list_all(self) -> list[SpooledResult]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, task, result_type, result FROM spooled_result ORDER BY id"
+            ).fetchall()
+        return [
+            SpooledResult(
+                id=id,
+                task=ExtractionTask.model_validate_json(task),
+                result=_RESULT_TYPES[result_type].model_validate_json(result),
+            )
+            for id, task, result_type, result in rows
+        ]
+
+    def delete(self, id: int) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM spooled_result WHERE id = ?", (id,))
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+class SpooledResultTaskService(ExtractionTaskService):
+    """Uploads task results in the background, through a ResultSpool.
+
+    mark_task_completed spools the result and returns right away: the slot
+    starts its next task while a background thread uploads the result and
+    marks the task completed with the wrapped service. Spooled tasks leases
+    are extended until then. At most max_pending results wait for upload,
+    further completions wait for room (back pressure on a slow backend).
+
+    An upload failure is fatal, as an inline one: the next acquire or
+    completion raises it. The results are left in the spool.
+
+    Use as a context manager: on enter, results spooled by a previous process
+    are queued for upload again, the backend rejecting the ones whose task was
+    acquired again since.
+    On exit, the pending results are uploaded, for up to the time set by
+    limit_exit_wait: the results not uploaded by then are left in the spool.
+    Tasks completed after exit raise TaskLeaseLostError, their result is not
+    spooled.
+    """
+
+    def __init__(
+        self,
+        task_service: ExtractionTaskService,
+        spool: ResultSpool,
+        max_pending: int,
+        lease_extension_interval: int,
+    ):
+        self._task_service = task_service
+        self._spool = spool
+        self._max_pending = max_pending
+        self._lease_extension_interval = lease_extension_interval
+
+        self._pending: deque[SpooledResult] = deque()
+        self._heartbeats: dict[int, TaskLeaseHeartbeat] = {}
+        # Guards the pending results, notified whenever they change
+        self._condition = threading.Condition()
+        self._closing = False
+        # Set when exiting without waiting for the upload in progress
+        self._abandoned = False
+        self._exit_timeout: Optional[float] = None
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._run, name="result-uploader", daemon=True
+        )
+
+    def __enter__(self) -> "SpooledResultTaskService":
+        for spooled_result in self._spool.list_all():
+            # Even if its lease expired: the backend takes the result back unless the
+            # task was acquired again since, dropped on upload otherwise
+            logger.info(
+                "Task %s - Resuming spooled result upload", spooled_result.task.id
+            )
+            self._add_pending(spooled_result)
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        with self._condition:
+            self._closing = True
+            if self._pending and self._error is None:
+                logger.info(
+                    "Waiting for %s spooled results to be uploaded", len(self._pending)
+                )
+            self._condition.notify_all()
+        self._thread.join(self._exit_timeout)
+        with self._condition:
+            # An upload still in progress is not deleted from the spool: if it
+            # succeeds, the task is found completed on next start and dropped
+            self._abandoned = True
+            self._condition.notify_all()
+            heartbeats = list(self._heartbeats.values())
+            self._heartbeats.clear()
+            if self._pending:
+                logger.warning(
+                    "%s results left in the spool, uploaded on next start",
+                    len(self._pending),
+                )
+            self._spool.close()
+        for heartbeat in heartbeats:
+            heartbeat.__exit__(None, None, None)
+        if exc_type is None and self._error is not None:
+            raise self._error
+
+    def limit_exit_wait(self, timeout: Optional[float]) -> None:
+        """Wait at most timeout seconds (None: no limit) for the uploads on exit."""
+        self._exit_timeout = timeout
+
+    def _raise_upload_error(self) -> None:
+        with self._condition:
+            error = self._error
+        if error is not None:
+            raise error
+
+    def acquire_next_task(
+        self, social_network: SocialNetwork, wait_seconds: int = 0
+    ) -> Optional[ExtractionTask]:
+        # Not one more task to extract once the results can not be uploaded
+        self._raise_upload_error()
+        return self._task_service.acquire_next_task(social_network, wait_seconds)
+
+    def acquire_next_tasks(
+        self, social_network: SocialNetwork, count: int, wait_seconds: int = 0
+    ) -> list[ExtractionTask]:
+        self._raise_upload_error()
+        return self._task_service.acquire_next_tasks(
+            social_network, count, wait_seconds
+        )
+
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        self._task_service.release_tasks(tasks)
+
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        self._task_service.extend_task_lease(task)
+
+    def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
+        self._task_service.mark_task_failed(task, task_error)
+
+    def mark_task_completed(
+        self, task: ExtractionTask, task_result: ExtractionTaskResult
+    ) -> None:
+        with self._condition:
+            while (
+                len(self._pending) >= self._max_pending
+                and self._error is None
+                and not self._abandoned
+            ):
+                self._condition.wait()
+            if self._abandoned:
+                # The spool is closed: the task is executed again once its lease expires
+                raise TaskLeaseLostError(f"Task {task.id} completed after exit")
+            spooled_id = self._spool.append(task, task_result)
+            error = self._error
+        if error is not None:
+            # Kept in the spool: uploaded on next start, not extracted again
+            logger.warning("Task %s - Result spooled, uploaded on next start", task.id)
+            raise error
+        self._add_pending(SpooledResult(id=spooled_id, task=task, result=task_result))
+        logger.info("Task %s - Result spooled for upload", task.id)
+
+    def _add_pending(self, spooled_result: SpooledResult) -> None:
+        heartbeat = TaskLeaseHeartbeat(
+            self._task_service, spooled_result.task, self._lease_extension_interval
+        )
+        heartbeat.__enter__()
+        with self._condition:
+            self._heartbeats[spooled_result.id] = heartbeat
+            self._pending.append(spooled_result)
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closing:
+                    self._condition.wait()
+                if not self._pending or self._abandoned:
+                    return
+                spooled_result = self._pending[0]
+                # Kept extending the lease until the task is marked completed
+                self._heartbeats[spooled_result.id].completing()
+
+            task = spooled_result.task
+            started_at = time.monotonic()
+            try:
+                try:
+                    self._task_service.mark_task_completed(task, spooled_result.result)
+                finally:
+                    self._stop_heartbeat(spooled_result.id)
+                    WORKER_METRICS.observe_background_upload(
+                        task.social_network, task.type, time.monotonic() - started_at
+                    )
+                logger.info("Task %s - Result uploaded and marked completed", task.id)
+            except TaskLeaseLostError:
+                logger.warning(
+                    "Task %s - Lease lost -> Result dropped,"
+                    " the task may be executed by another worker",
+                    task.id,
+                )
+            except BaseException as e:  # noqa: BLE001 - raised again in the slots
+                logger.exception("Task %s - Failed to upload result", task.id)
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                if self._abandoned:
+                    return
+                self._spool.delete(spooled_result.id)
+                self._pending.popleft()
+                self._condition.notify_all()
+
+    def _stop_heartbeat(self, spooled_id: int) -> None:
+        with self._condition:
+            # Already stopped if the exit did not wait for the upload
+            heartbeat = self._heartbeats.pop(spooled_id, None)
+        if heartbeat is not None:
+            heartbeat.__exit__(None, None, None)
@@ -23,7 +23,9 @@ from extraction_task.local.local_extraction_task_service import (
 from extraction_task.local.post_repository import PostRepository
 from extraction_task.local.task_repository import TaskRepository
 from extraction_task.social_network import SocialNetwork
+from result_uploader import ResultSpool, SpooledResultTaskService
 from task_processing_loop import TaskProcessingLoop
+from worker_metrics import WORKER_METRICS, MetricsExporter
 
 
 class YoutubeSettings(BaseModel):
@@ -68,6 +70,80 @@ class ExtractSettings(BaseSettings):
     task_polling_interval: int = Field(
         default=10, ge=1, description="Task polling interval seconds"
     )
+    task_wait_seconds: int = Field(
+        default=30,
+        ge=0,
+        le=60,
+        description=(
+            "Long polling: seconds the backend waits for a task to become available."
+            " 0 to poll every task_polling_interval instead"
+        ),
+    )
+    task_slots: int = Field(
+        default=1,
+        ge=1,
+        description=(
+            "Number of tasks executed concurrently, each slot with its own extractor"
+        ),
+    )
+    task_prefetch_count: int = Field(
+        default=2,
+        ge=0,
+        description=(
+            "Maximum number of tasks leased in advance, while the current tasks"
+            " execute. 0 disables prefetching"
+        ),
+    )
+    result_upload_queue_size: int = Field(
+        default=4,
+        ge=0,
+        description=(
+            "Maximum number of results uploaded in the background while the next"
+            " tasks execute, through an on-disk spool. 0 uploads results before"
+            " starting the next task"
+        ),
+    )
+    result_spool_file: Optional[str] = Field(
+        default=None,
+        description=(
+            "Spool of the results waiting for upload, resumed on next start."
+            " Default: data/.spool/results-<social network>.sqlite"
+        ),
+    )
+    lease_extension_interval: int = Field(
+        default=120,
+        ge=1,
+        description="Seconds between task lease extensions while a task is executed",
+    )
+    shutdown_grace_seconds: float = Field(
+        default=8,
+        ge=0,
+        description=(
+            "On SIGTERM or SIGINT, seconds the executing tasks are given to finish"
+            " before their lease is released"
+        ),
+    )
+    metrics_port: int = Field(
+        default=0,
+        ge=0,
+        description="Port of the Prometheus metrics endpoint (/metrics). 0 disables it",
+    )
+    metrics_host: str = Field(
+        default="127.0.0.1",
+        description="Address the metrics endpoint listens on",
+    )
+    metrics_textfile: Optional[str] = Field(
+        default=None,
+        description=(
+            "File the metrics are periodically written to, in the Prometheus text"
+            " format"
+        ),
+    )
+    metrics_textfile_interval: int = Field(
+        default=15,
+        ge=1,
+        description="Seconds between metrics textfile writes",
+    )
     cache_folder: str = Field(
         default=path.join("data", ".cache"), description="Cache folder"
     )
@@ -122,25 +198,67 @@ class ExtractSettings(BaseSettings):
 def run_extract(config: ExtractSettings) -> None:
     logging.info("config: %s", config)
 
-    task_service = create_task_service(config)
+    with MetricsExporter(
+        WORKER_METRICS,
+        port=config.metrics_port,
+        host=config.metrics_host,
+        textfile=config.metrics_textfile,
+        textfile_interval=config.metrics_textfile_interval,
+    ):
+        run_tasks(config)
+
 
-    extractor = create_extractor(config)
+def run_tasks(config: ExtractSettings) -> None:
+    task_service = create_task_service(config)
+    if config.result_upload_queue_size == 0:
+        create_loop(config, task_service).run()
+        return
 
-    loop = TaskProcessingLoop(
+    spool = ResultSpool(
+        config.result_spool_file
+        or path.join("data", ".spool", f"results-{config.social_network}.sqlite")
+    )
+    with SpooledResultTaskService(
+        task_service,
+        spool,
+        max_pending=config.result_upload_queue_size,
+        lease_extension_interval=config.lease_extension_interval,
+    ) as spooled_task_service:
+        loop = create_loop(config, spooled_task_service)
+        try:
+            loop.run()
+        finally:
+            # On a stop signal, pending uploads get what is left of the grace period
+            spooled_task_service.limit_exit_wait(loop.remaining_grace_seconds())
+
+
+def create_loop(
+    config: ExtractSettings, task_service: ExtractionTaskService
+) -> TaskProcessingLoop:
+    return TaskProcessingLoop(
         social_network=config.social_network,
         task_repository=task_service,
-        extractor=extractor,
+        extractor_factory=lambda: create_extractor(config),
         polling_interval=config.task_polling_interval,
         exit_after_tasks_failure=config.exit_after_task_failure,
+        lease_extension_interval=config.lease_extension_interval,
+        task_wait_seconds=config.task_wait_seconds,
+        slot_count=config.task_slots,
+        prefetch_count=config.task_prefetch_count,
+        shutdown_grace_seconds=config.shutdown_grace_seconds,
     )
 
-    loop.run()
-
 
 def create_task_service(config: ExtractSettings) -> ExtractionTaskService:
     if config.backend == "api":
         assert config.api_key is not None
-        return ApiExtractionTaskService(config.api_url, config.api_key)
+        # Each slot may use a connection for its task and one for its lease heartbeat,
+        # the result uploader one and one per spooled result lease heartbeat
+        return ApiExtractionTaskService(
+            config.api_url,
+            config.api_key,
+            max_connections=2 * config.task_slots + config.result_upload_queue_size + 1,
+        )
     else:
         task_repository = TaskRepository(config.fs_tasks_file)
         account_repository = AccountRepository(
@@ -200,4 +200,9 @@ def store_tasks_using_api(
     configuration = api_client.Configuration(access_token=api_token, host=api_url)
     client = api_client.ApiClient(configuration=configuration)
     api = DefaultApi(client)
-    api.register_tasks_extraction_task_post(to_api_extractions_tasks(tasks))
+    response = api.register_tasks_extraction_task_post(to_api_extractions_tasks(tasks))
+    logging.info(
+        "%s tasks registered, %s already registered",
+        response.inserted_count,
+        response.existing_count,
+    )
@@ -1,7 +1,13 @@
+import datetime
 import logging
-
+import signal
+import threading
 import time
+import uuid
 import traceback
+from collections import deque
+from types import FrameType, TracebackType
+from typing import Any, Callable, Optional
 
 import requests
 from extraction_task.extraction_task import (
@@ -16,95 +22,353 @@ from extraction_task.extraction_task_config import (
 from extraction_task.extraction_task_result import ExtractionTaskResult
 from extraction_task.social_network import SocialNetwork
 from data_extractors.data_extractor import DataExtractor
-from extraction_task.extraction_task_service import ExtractionTaskService
+from extraction_task.extraction_task_service import (
+    ExtractionTaskService,
+    TaskLeaseLostError,
+)
+from worker_metrics import WORKER_METRICS, TaskMetrics, recording_task_metrics
 
 logger = logging.getLogger(__name__)
 
 
 class TaskProcessingLoop:
+    """Acquires and executes extraction tasks in concurrent slots.
+
+    Each slot is a thread with its own extractor, acquiring and executing one
+    task at a time: while a slot waits on the social network, the others keep
+    working. The task service is shared by all slots.
+
+    On SIGTERM or SIGINT, slots stop acquiring tasks and are given
+    shutdown_grace_seconds to finish their current one: the leases of the tasks
+    still executing then are released, so that other workers can execute them
+    right away, and their results are dropped. A second signal stops without
+    waiting.
+    """
+
     _task_service: ExtractionTaskService
     _polling_interval: int
     _social_network: SocialNetwork
-    _extractor: DataExtractor
+    _extractor_factory: Callable[[], DataExtractor]
+    _slot_count: int
 
     def __init__(
         self,
         task_repository: ExtractionTaskService,
         social_network: SocialNetwork,
-        extractor: DataExtractor,
+        extractor_factory: Callable[[], DataExtractor],
         polling_interval: int,
         exit_after_tasks_failure: bool | int,
+        lease_extension_interval: int,
+        task_wait_seconds: int,
+        slot_count: int = 1,
+        prefetch_count: int = 0,
+        shutdown_grace_seconds: float = 8,
     ):
         self._social_network = social_network
         self._task_service = task_repository
         self._polling_interval = polling_interval
-        self._extractor = extractor
+        self._extractor_factory = extractor_factory
         self._exit_after_tasks_failure = exit_after_tasks_failure
+        self._lease_extension_interval = lease_extension_interval
+        self._task_wait_seconds = task_wait_seconds
+        self._slot_count = slot_count
+        self._shutdown_grace_seconds = shutdown_grace_seconds
+        self._prefetch_buffer = (
+            TaskPrefetchBuffer(
+                task_service=task_repository,
+                social_network=social_network,
+                slot_count=slot_count,
+                max_size=prefetch_count,
+                min_lease_seconds=lease_extension_interval,
+                polling_interval=polling_interval,
+                task_wait_seconds=task_wait_seconds,
+            )
+            if prefetch_count > 0
+            else None
+        )
+
+        # Set to stop all slots: they finish their current task, then exit
+        self._stopped = threading.Event()
+        # Set by a stop signal: when the leases of the executing tasks are released
+        self._shutdown_deadline: Optional[float] = None
+        # Guards the state shared by slots: failures are counted for the whole
+        # process, across slots
+        self._lock = threading.Lock()
+        self._failure_count = 0
+        self._fatal_error: Optional[BaseException] = None
+        self._executing_tasks: dict[
+            uuid.UUID, tuple[ExtractionTask, TaskLeaseHeartbeat]
+        ] = {}
+        # Set when the leases of the executing tasks are released at the shutdown
+        # deadline: the slots then drop these tasks without reporting them
+        self._released = False
 
     # Error handling expected behavior:
     #  - If mark completed fails or aqcuire failed or mark failed fail => exit
     #  - if execute fails => exit based on _exit_after_tasks_failure
+    #  - if the task lease was lost (expired, acquired again) => drop the result
+    # Exiting stops every slot once its current task is done, then raises the error.
     def run(self) -> None:
         public_ip = get_my_public_ip()
         logger.info("Public IP: " + public_ip)
-        failure_count = 0
-        while True:
-            logger.info("Attempting to acquire a task for %s", self._social_network)
-            task = self._task_service.acquire_next_task(self._social_network)
-            if task is None:
-                logger.info(
-                    "No tasks available - Sleeping %ss before next poll",
-                    self._polling_interval,
-                )
-                time.sleep(self._polling_interval)
-            else:
+        slots = [
+            threading.Thread(
+                target=self._run_slot,
+                args=(self._extractor_factory(),),
+                name=f"task-slot-{slot_index}",
+                # Lets a second interrupt exit without waiting for the slots
+                daemon=True,
+            )
+            for slot_index in range(self._slot_count)
+        ]
+        logger.info("Starting %s task slots for %s", len(slots), self._social_network)
+        if self._prefetch_buffer is not None:
+            self._prefetch_buffer.start()
+        for slot in slots:
+            slot.start()
+
+        previous_handlers = self._install_stop_signal_handlers()
+        try:
+            self._wait_for_slots(slots)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            if self._prefetch_buffer is not None:
+                self._prefetch_buffer.close(timeout=self.remaining_grace_seconds())
+
+        if self._fatal_error is not None:
+            raise self._fatal_error
+
+    def _install_stop_signal_handlers(self) -> dict[int, Any]:
+        if threading.current_thread() is not threading.main_thread():
+            # Signal handlers can only be installed by the main thread
+            return {}
+        return {
+            signum: signal.signal(signum, self._handle_stop_signal)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+    def _handle_stop_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        signal_name = signal.Signals(signum).name
+        if self._shutdown_deadline is None:
+            logger.info(
+                "Received %s -> Waiting up to %ss for executing tasks to finish",
+                signal_name,
+                self._shutdown_grace_seconds,
+            )
+            self._shutdown_deadline = time.monotonic() + self._shutdown_grace_seconds
+            self._stop()
+        else:
+            logger.info("Received %s again -> Stopping now", signal_name)
+            self._shutdown_deadline = time.monotonic()
+
+    def remaining_grace_seconds(self) -> Optional[float]:
+        """Seconds left before the shutdown deadline, None if not stopped by signal."""
+        if self._shutdown_deadline is None:
+            return None
+        return max(0, self._shutdown_deadline - time.monotonic())
+
+    def _wait_for_slots(self, slots: list[threading.Thread]) -> None:
+        for slot in slots:
+            while slot.is_alive():
+                # Wakes up regularly to honor the shutdown deadline set by a signal
+                slot.join(timeout=1)
+                if self.remaining_grace_seconds() == 0:
+                    # Stopped first: no slot starts a task once the leases are released
+                    self._stop()
+                    self._release_executing_tasks()
+                    return
+
+    def _release_executing_tasks(self) -> None:
+        with self._lock:
+            self._released = True
+            executing = list(self._executing_tasks.values())
+            self._executing_tasks.clear()
+        if not executing:
+            return
+        logger.warning("Releasing %s tasks still executing", len(executing))
+        for _, heartbeat in executing:
+            heartbeat.stop()
+        self._release_tasks([task for task, _ in executing])
+
+    def _release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        try:
+            self._task_service.release_tasks(tasks)
+        except Exception:
+            logger.exception(
+                "Failed to release tasks,"
+                " they will be recycled when their lease expires"
+            )
+
+    def _start_executing(
+        self, task: ExtractionTask, heartbeat: "TaskLeaseHeartbeat"
+    ) -> bool:
+        """Register the task as executing, False once the slots are stopped."""
+        with self._lock:
+            if self._stopped.is_set():
+                return False
+            self._executing_tasks[task.id] = (task, heartbeat)
+            return True
+
+    def _finish_executing(self, task: ExtractionTask) -> None:
+        """Unregister the task before reporting its outcome.
+
+        Raises TaskLeaseLostError if its lease was released at the shutdown deadline.
+        """
+        with self._lock:
+            if self._executing_tasks.pop(task.id, None) is None:
+                raise TaskLeaseLostError(f"Task {task.id} released on shutdown")
+
+    def _run_slot(self, extractor: DataExtractor) -> None:
+        try:
+            while not self._stopped.is_set():
+                self._process_next_task(extractor)
+        except BaseException as e:  # noqa: BLE001 - raised again by run
+            with self._lock:
+                if self._fatal_error is None:
+                    self._fatal_error = e
+            self._stop()
+
+    def _stop(self) -> None:
+        self._stopped.set()
+        if self._prefetch_buffer is not None:
+            self._prefetch_buffer.stop()
+
+    def _acquire_task(self) -> Optional[ExtractionTask]:
+        if self._prefetch_buffer is not None:
+            return self._prefetch_buffer.take()
+
+        logger.info("Attempting to acquire a task for %s", self._social_network)
+        task = self._task_service.acquire_next_task(
+            self._social_network, self._task_wait_seconds
+        )
+        if task is None and self._task_wait_seconds > 0:
+            # Backend already waited for a task: poll again right away
+            logger.info("No tasks available after waiting %ss", self._task_wait_seconds)
+        elif task is None:
+            logger.info(
+                "No tasks available - Sleeping %ss before next poll",
+                self._polling_interval,
+            )
+            self._stopped.wait(self._polling_interval)
+        return task
+
+    def _process_next_task(self, extractor: DataExtractor) -> None:
+        wait_started_at = time.monotonic()
+        task = self._acquire_task()
+        WORKER_METRICS.observe_queue_wait(
+            self._social_network, time.monotonic() - wait_started_at
+        )
+        if task is not None:
+            heartbeat = TaskLeaseHeartbeat(
+                self._task_service, task, self._lease_extension_interval
+            )
+            if not self._start_executing(task, heartbeat):
+                # e.g. returned by a long poll after a stop signal
                 logger.info(
-                    "Task %s - Acquired -> Executing it..",
-                    task.id,
+                    "Task %s - Acquired while stopping -> Releasing it", task.id
                 )
-                try:
-                    result = self.execute_task(task)
+                self._release_tasks([task])
+                return
+            logger.info(
+                "Task %s - Acquired -> Executing it..",
+                task.id,
+            )
+            started_at = time.monotonic()
+            duration_seconds = 0.0
+            upload_seconds = 0.0
+            task_metrics = TaskMetrics()
+            status = "error"
+            try:
+                # Kept until the task is marked completed: the result upload may
+                # outlast a lease
+                with heartbeat:
+                    try:
+                        with recording_task_metrics(task_metrics):
+                            result = self.execute_task(task, extractor)
+                    finally:
+                        duration_seconds = time.monotonic() - started_at
                     logger.info(
                         "Task %s - Completed -> Marking as completed",
                         task.id,
                     )
-                    self._task_service.mark_task_completed(task, result)
-                    logger.info(
-                        "Task %s - Marked completed",
-                        task.id,
-                    )
-                except TaskExecutionFailedError as e:
-                    error_message = str(e)
-                    logger.exception(
-                        "Task %s - Execution failed -> Marking as failed with error: %s",
-                        task.id,
-                        error_message,
-                    )
+                    heartbeat.completing()
+                    self._finish_executing(task)
+                    try:
+                        self._task_service.mark_task_completed(task, result)
+                    finally:
+                        upload_seconds = (
+                            time.monotonic() - started_at - duration_seconds
+                        )
+                status = "completed"
+                logger.info(
+                    "Task %s - Marked completed",
+                    task.id,
+                )
+            except TaskExecutionFailedError as e:
+                status = "failed"
+                error_message = str(e)
+                logger.exception(
+                    "Task %s - Execution failed -> Marking as failed with error: %s",
+                    task.id,
+                    error_message,
+                )
+                try:
+                    self._finish_executing(task)
                     self._task_service.mark_task_failed(
                         task, "\n".join(traceback.format_exception(e))
                     )
-                    failure_count += 1
-                    if (
-                        isinstance(self._exit_after_tasks_failure, bool)
-                        and self._exit_after_tasks_failure
-                    ) or (
-                        isinstance(self._exit_after_tasks_failure, int)
-                        and self._exit_after_tasks_failure <= failure_count
-                    ):
-                        logger.info("Reached max failure -> Exiting")
-                        raise e
-
-    def execute_task(self, task: ExtractionTask) -> ExtractionTaskResult:
+                except TaskLeaseLostError:
+                    logger.warning(
+                        "Task %s - Lease lost -> Not marked as failed", task.id
+                    )
+                if self._count_failure():
+                    logger.info("Reached max failure -> Exiting")
+                    raise e
+            except TaskLeaseLostError:
+                status = "lease_lost"
+                logger.warning(
+                    "Task %s - Lease lost -> Result dropped,"
+                    " the task may be executed by another worker",
+                    task.id,
+                )
+            finally:
+                with self._lock:
+                    self._executing_tasks.pop(task.id, None)
+                WORKER_METRICS.observe_task(
+                    self._social_network,
+                    task.type,
+                    status,
+                    duration_seconds,
+                    upload_seconds,
+                    task_metrics,
+                )
+                if self._prefetch_buffer is not None:
+                    self._prefetch_buffer.record_task_duration(
+                        time.monotonic() - started_at
+                    )
+
+    def _count_failure(self) -> bool:
+        """Count a task failure, return whether the process should exit."""
+        with self._lock:
+            self._failure_count += 1
+            if isinstance(self._exit_after_tasks_failure, bool):
+                return self._exit_after_tasks_failure
+            return self._exit_after_tasks_failure <= self._failure_count
+
+    def execute_task(
+        self, task: ExtractionTask, extractor: DataExtractor
+    ) -> ExtractionTaskResult:
         try:
             if task.type == ExtractionTaskType.EXTRACT_ACCOUNT:
                 assert isinstance(task.task_config, ExtractAccountTaskConfig)
-                return self._extractor.extract_account(task.task_config)
+                return extractor.extract_account(task.task_config)
             elif task.type == ExtractionTaskType.EXTRACT_POST_LIST:
                 assert isinstance(task.task_config, ExtractPostListTaskConfig)
-                return self._extractor.extract_post_list(task.task_config)
+                return extractor.extract_post_list(task.task_config)
             elif task.type == ExtractionTaskType.EXTRACT_POST_DETAILS:
                 assert isinstance(task.task_config, ExtractPostDetailsTaskConfig)
-                return self._extractor.extract_post_details(task.task_config)
+                return extractor.extract_post_details(task.task_config)
         except Exception as e:
             raise TaskExecutionFailedError from e
 
@@ -113,6 +377,268 @@ class TaskExecutionFailedError(Exception):
     pass
 
 
+# Maximum tasks acquired per request (see the API acquire-batch endpoint)
+MAX_ACQUIRE_BATCH_SIZE = 100
+
+
+class TaskPrefetchBuffer:
+    """Keeps tasks leased in advance so that slots start their next task right away.
+
+    A background thread refills the buffer, with a single batch acquire, while the
+    slots execute tasks. Buffered leases are not extended: the buffer is kept
+    small enough for its tasks to be started long before their lease expires,
+    from the average task duration and the lease duration. A task whose lease
+    is about to expire is extended when taken. Tasks still buffered when the
+    buffer is closed are released.
+    """
+
+    def __init__(
+        self,
+        task_service: ExtractionTaskService,
+        social_network: SocialNetwork,
+        slot_count: int,
+        max_size: int,
+        min_lease_seconds: float,
+        polling_interval: int,
+        task_wait_seconds: int,
+    ):
+        self._task_service = task_service
+        self._social_network = social_network
+        self._slot_count = slot_count
+        self._max_size = max_size
+        self._min_lease_seconds = min_lease_seconds
+        self._polling_interval = polling_interval
+        self._task_wait_seconds = task_wait_seconds
+
+        self._tasks: deque[ExtractionTask] = deque()
+        # Guards the buffer state, notified whenever it changes
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._waiting_slots = 0
+        self._error: Optional[BaseException] = None
+        self._task_seconds: Optional[float] = None
+        self._lease_seconds: Optional[float] = None
+        self._thread = threading.Thread(
+            target=self._run, name="task-prefetch", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop refilling the buffer and wake up the slots waiting for a task."""
+        with self._condition:
+            self._stopped.set()
+            self._condition.notify_all()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the buffer and release the tasks left in it.
+
+        Waits up to timeout for a pending acquire: the tasks it returns are
+        released too.
+        """
+        self.stop()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Closing the prefetch buffer while it is acquiring tasks")
+        with self._condition:
+            tasks = list(self._tasks)
+            self._tasks.clear()
+        self._release(tasks)
+
+    def _release(self, tasks: list[ExtractionTask]) -> None:
+        if not tasks:
+            return
+        logger.info("Releasing %s prefetched tasks", len(tasks))
+        try:
+            self._task_service.release_tasks(tasks)
+        except Exception:
+            logger.exception(
+                "Failed to release prefetched tasks,"
+                " they will be recycled when their lease expires"
+            )
+
+    def take(self) -> Optional[ExtractionTask]:
+        """Wait for a buffered task, None once the buffer is stopped."""
+        while True:
+            with self._condition:
+                self._waiting_slots += 1
+                self._condition.notify_all()
+                try:
+                    while not (self._tasks or self._stopped.is_set() or self._error):
+                        self._condition.wait()
+                finally:
+                    self._waiting_slots -= 1
+                if self._error is not None:
+                    raise self._error
+                if self._stopped.is_set():
+                    return None
+                task = self._tasks.popleft()
+                # Room to refill
+                self._condition.notify_all()
+            if self._ensure_lease(task):
+                return task
+
+    def record_task_duration(self, seconds: float) -> None:
+        """Update the average task duration the buffer is sized from."""
+        with self._condition:
+            if self._task_seconds is None:
+                self._task_seconds = seconds
+            else:
+                self._task_seconds = 0.8 * self._task_seconds + 0.2 * seconds
+
+    def _target_size(self) -> int:
+        if self._task_seconds is None or self._lease_seconds is None:
+            return self._max_size
+        # The last buffered task starts after about size / slot_count task durations:
+        # keep that under half of the lease duration
+        affordable = int(
+            self._slot_count * self._lease_seconds / (2 * max(self._task_seconds, 1))
+        )
+        return max(1, min(self._max_size, affordable))
+
+    def _missing_count(self) -> int:
+        return self._target_size() + self._waiting_slots - len(self._tasks)
+
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._condition:
+                    while not self._stopped.is_set() and self._missing_count() <= 0:
+                        self._condition.wait()
+                    if self._stopped.is_set():
+                        return
+                    count = min(self._missing_count(), MAX_ACQUIRE_BATCH_SIZE)
+
+                logger.info(
+                    "Attempting to acquire %s tasks for %s", count, self._social_network
+                )
+                tasks = self._task_service.acquire_next_tasks(
+                    self._social_network, count, self._task_wait_seconds
+                )
+                with self._condition:
+                    stopped = self._stopped.is_set()
+                    if not stopped:
+                        self._tasks.extend(tasks)
+                    if tasks:
+                        self._lease_seconds = min(
+                            _remaining_lease_seconds(task) for task in tasks
+                        )
+                    self._condition.notify_all()
+                if stopped:
+                    # Stopped while acquiring: the buffer may already be closed
+                    self._release(tasks)
+                    return
+
+                if not tasks and self._task_wait_seconds > 0:
+                    # Backend already waited for a task: poll again right away
+                    logger.info(
+                        "No tasks available after waiting %ss", self._task_wait_seconds
+                    )
+                elif not tasks:
+                    logger.info(
+                        "No tasks available - Sleeping %ss before next poll",
+                        self._polling_interval,
+                    )
+                    self._stopped.wait(self._polling_interval)
+        except BaseException as e:  # noqa: BLE001 - raised again by take, in the slots
+            # Acquire failures are fatal: raised by the slots waiting for a task
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def _ensure_lease(self, task: ExtractionTask) -> bool:
+        """Extend the lease of a task about to expire, False if it was lost."""
+        if _remaining_lease_seconds(task) > self._min_lease_seconds:
+            return True
+        try:
+            self._task_service.extend_task_lease(task)
+            return True
+        except TaskLeaseLostError:
+            logger.warning(
+                "Task %s - Lease expired while prefetched -> Skipping it", task.id
+            )
+            return False
+
+
+def _remaining_lease_seconds(task: ExtractionTask) -> float:
+    if task.visible_at is None:
+        return 0
+    return (
+        task.visible_at - datetime.datetime.now(datetime.timezone.utc)
+    ).total_seconds()
+
+
+class TaskLeaseHeartbeat:
+    """Periodically extends a task lease from a background thread.
+
+    Used as a context manager around the task execution and result storage
+    so that the server can use short leases: a task whose worker died
+    is recycled as soon as its lease expires.
+
+    Call completing before marking the task completed: an extension racing
+    with the completion is then rejected without warning, a lease actually
+    lost is reported by the completion.
+    """
+
+    def __init__(
+        self, task_service: ExtractionTaskService, task: ExtractionTask, interval: int
+    ):
+        self._task_service = task_service
+        self._task = task
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._completing = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-heartbeat-{task.id}", daemon=True
+        )
+
+    def __enter__(self) -> "TaskLeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def completing(self) -> None:
+        self._completing.set()
+
+    def stop(self) -> None:
+        """Stop extending the lease, without waiting for an extension in progress."""
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            try:
+                self._task_service.extend_task_lease(self._task)
+                logger.debug(
+                    "Task %s - Lease extended until %s",
+                    self._task.id,
+                    self._task.visible_at,
+                )
+            except TaskLeaseLostError:
+                if self._completing.is_set() or self._stopped.is_set():
+                    logger.debug(
+                        "Task %s - Lease not extended, task completed or released",
+                        self._task.id,
+                    )
+                else:
+                    logger.warning(
+                        "Task %s - Lease lost, task may be executed by another worker",
+                        self._task.id,
+                    )
+                return
+            except Exception:
+                # Keep trying: the lease may still be extended before it expires
+                logger.exception("Task %s - Failed to extend lease", self._task.id)
+
+
 def get_my_public_ip() -> str:
     try:
         response = requests.get("https://api4.my-ip.io/v2/ip.json")
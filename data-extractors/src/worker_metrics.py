@@ -0,0 +1,402 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Iterator, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "opi_extractor"
+
+TASK_DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@dataclass
+class TaskMetrics:
+    """What a task execution spent, recorded by the extractor executing it."""
+
+    http_requests: int = 0
+    http_response_bytes: int = 0
+    network_seconds: float = 0
+    sleep_seconds: float = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+
+# Metrics of the task executed by the current thread (slot), if any
+_current = threading.local()
+
+
+@contextmanager
+def recording_task_metrics(task_metrics: TaskMetrics) -> Iterator[TaskMetrics]:
+    """Record what the current thread does into task_metrics."""
+    _current.task_metrics = task_metrics
+    try:
+        yield task_metrics
+    finally:
+        _current.task_metrics = None
+
+
+def _current_task_metrics() -> Optional[TaskMetrics]:
+    return getattr(_current, "task_metrics", None)
+
+
+def record_http_response(
+    response: requests.Response, *args: Any, **kwargs: Any
+) -> None:
+    """requests response hook: hooks["response"].append(record_http_response)."""
+    if _current_task_metrics() is None:
+        return
+    # Called once the headers are received: reading the content downloads the body
+    started_at = time.monotonic()
+    response_bytes = len(response.content)
+    record_http_call(
+        response_bytes,
+        response.elapsed.total_seconds() + (time.monotonic() - started_at),
+    )
+
+
+def record_http_call(response_bytes: int, seconds: float) -> None:
+    """Count an HTTP request, with its response size and duration."""
+    task_metrics = _current_task_metrics()
+    if task_metrics is None:
+        return
+    task_metrics.http_requests += 1
+    task_metrics.http_response_bytes += response_bytes
+    task_metrics.network_seconds += seconds
+
+
+def record_http_query() -> None:
+    """Count an HTTP request whose response is not measured."""
+    task_metrics = _current_task_metrics()
+    if task_metrics is not None:
+        task_metrics.http_requests += 1
+
+
+def record_sleep(seconds: float) -> None:
+    task_metrics = _current_task_metrics()
+    if task_metrics is not None:
+        task_metrics.sleep_seconds += seconds
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep, recorded as a deliberate sleep (e.g. rate limiting)."""
+    time.sleep(seconds)
+    record_sleep(seconds)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    task_metrics = _current_task_metrics()
+    if task_metrics is None:
+        return
+    if hit:
+        task_metrics.cache_hits += 1
+    else:
+        task_metrics.cache_misses += 1
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self.bucket_counts = [0] * len(TASK_DURATION_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(TASK_DURATION_BUCKETS):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+
+class WorkerMetrics:
+    """Counters of the extract process, rendered in the Prometheus text format.
+
+    Tasks are labelled by social network and task type. The time of a slot is
+    broken down into stages: waiting for a task (queue_wait), then for each
+    task its deliberate sleeps, HTTP calls (network), the rest of its
+    execution (other), and handing its result over (upload). Results
+    uploaded in the background are timed apart (upload_background): the
+    slot does not wait for them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tasks: dict[tuple[str, str, str], int] = {}
+        self._task_durations: dict[tuple[str, str], _Histogram] = {}
+        self._http_requests: dict[tuple[str, str], int] = {}
+        self._http_response_bytes: dict[tuple[str, str], int] = {}
+        self._cache_lookups: dict[tuple[str, str, str], int] = {}
+        self._stage_seconds: dict[tuple[str, str, str], float] = {}
+        self._queue_wait_seconds: dict[str, float] = {}
+
+    def observe_queue_wait(self, social_network: str, seconds: float) -> None:
+        with self._lock:
+            _add(self._queue_wait_seconds, social_network, seconds)
+
+    def observe_task(
+        self,
+        social_network: str,
+        task_type: str,
+        status: str,
+        duration_seconds: float,
+        upload_seconds: float,
+        task_metrics: TaskMetrics,
+    ) -> None:
+        labels = (social_network, task_type)
+        other_seconds = max(
+            0,
+            duration_seconds
+            - task_metrics.network_seconds
+            - task_metrics.sleep_seconds,
+        )
+        with self._lock:
+            _add(self._tasks, (*labels, status), 1)
+            self._task_durations.setdefault(labels, _Histogram()).observe(
+                duration_seconds
+            )
+            _add(self._http_requests, labels, task_metrics.http_requests)
+            _add(self._http_response_bytes, labels, task_metrics.http_response_bytes)
+            _add(self._cache_lookups, (*labels, "hit"), task_metrics.cache_hits)
+            _add(self._cache_lookups, (*labels, "miss"), task_metrics.cache_misses)
+            _add(self._stage_seconds, (*labels, "sleep"), task_metrics.sleep_seconds)
+            _add(
+                self._stage_seconds, (*labels, "network"), task_metrics.network_seconds
+            )
+            _add(self._stage_seconds, (*labels, "other"), other_seconds)
+            _add(self._stage_seconds, (*labels, "upload"), upload_seconds)
+
+    def observe_background_upload(
+        self, social_network: str, task_type: str, seconds: float
+    ) -> None:
+        with self._lock:
+            _add(
+                self._stage_seconds,
+                (social_network, task_type, "upload_background"),
+                seconds,
+            )
+
+    def render(self) -> str:
+        task_labels = ("social_network", "task_type")
+        lines: list[str] = []
+        with self._lock:
+            _render_metric(
+                lines,
+                "tasks_total",
+                "counter",
+                "Tasks executed, by outcome",
+                (*task_labels, "status"),
+                self._tasks,
+            )
+            duration_metric = f"{METRIC_PREFIX}_task_duration_seconds"
+            lines += [
+                f"# HELP {duration_metric}"
+                " Task execution duration, result upload excluded",
+                f"# TYPE {duration_metric} histogram",
+            ]
+            for labels, histogram in sorted(self._task_durations.items()):
+                label_text = _label_text(task_labels, labels)
+                for bound, bucket_count in zip(
+                    TASK_DURATION_BUCKETS, histogram.bucket_counts, strict=True
+                ):
+                    lines.append(
+                        f'{duration_metric}_bucket{{{label_text},le="{bound}"}}'
+                        f" {bucket_count}"
+                    )
+                lines += [
+                    f'{duration_metric}_bucket{{{label_text},le="+Inf"}}'
+                    f" {histogram.count}",
+                    f"{duration_metric}_sum{{{label_text}}} {histogram.sum}",
+                    f"{duration_metric}_count{{{label_text}}} {histogram.count}",
+                ]
+            _render_metric(
+                lines,
+                "http_requests_total",
+                "counter",
+                "HTTP requests sent to the social network by tasks",
+                task_labels,
+                self._http_requests,
+            )
+            _render_metric(
+                lines,
+                "http_response_bytes_total",
+                "counter",
+                "Bytes of the HTTP responses received by tasks",
+                task_labels,
+                self._http_response_bytes,
+            )
+            _render_metric(
+                lines,
+                "cache_lookups_total",
+                "counter",
+                "Response cache lookups of tasks, by result (hit or miss)",
+                (*task_labels, "result"),
+                self._cache_lookups,
+            )
+            _render_metric(
+                lines,
+                "task_stage_seconds_total",
+                "counter",
+                "Time spent on tasks, by stage"
+                " (sleep, network, other, upload, upload_background)",
+                (*task_labels, "stage"),
+                self._stage_seconds,
+            )
+            _render_metric(
+                lines,
+                "queue_wait_seconds_total",
+                "counter",
+                "Time spent by slots waiting for a task to execute",
+                ("social_network",),
+                {(key,): value for key, value in self._queue_wait_seconds.items()},
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _add(counters: dict[Any, Any], key: Any, value: float) -> None:
+    counters[key] = counters.get(key, 0) + value
+
+
+def _label_text(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"),
+        )
+        for name, value in zip(names, values, strict=True)
+    )
+
+
+def _render_metric(
+    lines: list[str],
+    name: str,
+    metric_type: str,
+    description: str,
+    label_names: tuple[str, ...],
+    values: dict[Any, Any],
+) -> None:
+    lines += [
+        f"# HELP {METRIC_PREFIX}_{name} {description}",
+        f"# TYPE {METRIC_PREFIX}_{name} {metric_type}",
+    ]
+    for labels, value in sorted(values.items()):
+        lines.append(
+            f"{METRIC_PREFIX}_{name}{{{_label_text(label_names, labels)}}} {value}"
+        )
+
+
+WORKER_METRICS = WorkerMetrics()
+
+
+class MetricsExporter:
+    """Exposes WorkerMetrics on an HTTP endpoint and/or in a textfile.
+
+    The endpoint serves /metrics for Prometheus to scrape. The textfile is
+    rewritten every textfile_interval seconds and on exit (e.g. for the
+    node_exporter textfile collector). Use as a context manager.
+    """
+
+    def __init__(
+        self,
+        metrics: WorkerMetrics,
+        port: int = 0,
+        host: str = "127.0.0.1",
+        textfile: Optional[str] = None,
+        textfile_interval: float = 15,
+    ):
+        self._metrics = metrics
+        self._port = port
+        self._host = host
+        self._textfile = textfile
+        self._textfile_interval = textfile_interval
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def __enter__(self) -> "MetricsExporter":
+        if self._port:
+            self._server = ThreadingHTTPServer(
+                (self._host, self._port), _metrics_handler(self._metrics)
+            )
+            self._server.daemon_threads = True
+            self._threads.append(
+                threading.Thread(
+                    target=self._server.serve_forever,
+                    name="metrics-server",
+                    daemon=True,
+                )
+            )
+            logger.info(
+                "Serving metrics on http://%s:%s/metrics", self._host, self._port
+            )
+        if self._textfile is not None:
+            os.makedirs(os.path.dirname(self._textfile) or ".", exist_ok=True)
+            self._threads.append(
+                threading.Thread(
+                    target=self._write_textfile_periodically,
+                    name="metrics-textfile",
+                    daemon=True,
+                )
+            )
+            logger.info("Writing metrics to %s", self._textfile)
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for thread in self._threads:
+            thread.join()
+        if self._textfile is not None:
+            self._write_textfile()
+
+    def _write_textfile_periodically(self) -> None:
+        while not self._stopped.wait(self._textfile_interval):
+            self._write_textfile()
+
+    def _write_textfile(self) -> None:
+        assert self._textfile is not None
+        # Written to a temporary file then renamed: collectors never read a
+        # partially written file
+        tmp_path = f"{self._textfile}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(self._metrics.render())
+            os.replace(tmp_path, self._textfile)
+        except OSError:
+            logger.exception("Failed to write metrics to %s", self._textfile)
+
+
+def _metrics_handler(metrics: WorkerMetrics) -> type[BaseHTTPRequestHandler]:
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format, *args)
+
+    return MetricsHandler
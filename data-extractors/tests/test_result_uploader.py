@@ -0,0 +1,318 @@
+import datetime
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+from extraction_task.extraction_task import (
+    ExtractionTask,
+    ExtractionTaskStatus,
+    ExtractionTaskType,
+)
+from extraction_task.extraction_task_config import ExtractAccountTaskConfig
+from extraction_task.extraction_task_result import (
+    AccountExtractionResult,
+    ExtractionTaskResult,
+    PostDetailsExtractionResult,
+    PostListExtractionResult,
+)
+from extraction_task.extraction_task_service import (
+    ExtractionTaskService,
+    TaskLeaseLostError,
+)
+from extraction_task.social_network import SocialNetwork
+from result_uploader import ResultSpool, SpooledResultTaskService
+from worker_metrics import WORKER_METRICS
+
+NOW = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeTaskService(ExtractionTaskService):
+    """In-memory task service, whose uploads can be held or made to fail."""
+
+    def __init__(self) -> None:
+        self.completed: list[uuid.UUID] = []
+        self.extended: list[uuid.UUID] = []
+        self.lost_leases: set[uuid.UUID] = set()
+        self.upload_error: Optional[Exception] = None
+        # Cleared to hold mark_task_completed until it is set again
+        self.uploads_allowed = threading.Event()
+        self.uploads_allowed.set()
+
+    def acquire_next_task(
+        self, social_network: SocialNetwork, wait_seconds: int = 0
+    ) -> Optional[ExtractionTask]:
+        return None
+
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        pass
+
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        if task.id in self.lost_leases:
+            raise TaskLeaseLostError()
+        self.extended.append(task.id)
+
+    def mark_task_completed(
+        self, task: ExtractionTask, task_result: ExtractionTaskResult
+    ) -> None:
+        self.uploads_allowed.wait()
+        if self.upload_error is not None:
+            raise self.upload_error
+        if task.id in self.lost_leases:
+            raise TaskLeaseLostError()
+        self.completed.append(task.id)
+
+    def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
+        pass
+
+
+def make_task() -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid.uuid4(),
+        social_network=SocialNetwork.YOUTUBE,
+        type=ExtractionTaskType.EXTRACT_ACCOUNT,
+        task_config=ExtractAccountTaskConfig(account_id="account"),
+        status=ExtractionTaskStatus.ACQUIRED,
+        visible_at=NOW,
+        error=None,
+    )
+
+
+def make_account_result() -> AccountExtractionResult:
+    return AccountExtractionResult(
+        data_extraction_date=NOW,
+        handle="handle",
+        description="description",
+        follower_count=1,
+        following_count=2,
+        post_count=3,
+        view_count=4,
+        like_count=5,
+        categories=["category"],
+    )
+
+
+def make_post_list_result() -> PostListExtractionResult:
+    return PostListExtractionResult(
+        posts=[
+            PostDetailsExtractionResult(
+                data_extraction_date=NOW,
+                published_at=NOW,
+                post_id="post",
+                post_url="https://example.com/post",
+                title="title",
+                description="description",
+                comment_count=1,
+                view_count=2,
+                repost_count=3,
+                like_count=4,
+                share_count=5,
+                categories=[],
+                tags=["tag"],
+                sn_has_paid_placement=False,
+                sn_brand="",
+                post_type="video",
+                text_content="",
+            )
+        ]
+    )
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def spool_file(tmp_path: Path) -> str:
+    return str(tmp_path / "spool" / "results.sqlite")
+
+
+def make_service(
+    task_service: FakeTaskService,
+    spool_file: str,
+    max_pending: int = 10,
+    lease_extension_interval: int = 60,
+) -> SpooledResultTaskService:
+    return SpooledResultTaskService(
+        task_service,
+        ResultSpool(spool_file),
+        max_pending=max_pending,
+        lease_extension_interval=lease_extension_interval,
+    )
+
+
+def test_spool_keeps_results_across_processes(spool_file: str) -> None:
+    account_task, post_list_task = make_task(), make_task()
+    spool = ResultSpool(spool_file)
+    account_id = spool.append(account_task, make_account_result())
+    spool.append(post_list_task, make_post_list_result())
+    spool.close()
+
+    spool = ResultSpool(spool_file)
+    spooled_results = spool.list_all()
+    assert [spooled.task for spooled in spooled_results] == [
+        account_task,
+        post_list_task,
+    ]
+    assert spooled_results[0].result == make_account_result()
+    assert spooled_results[1].result == make_post_list_result()
+
+    spool.delete(account_id)
+    assert [spooled.task for spooled in spool.list_all()] == [post_list_task]
+    spool.close()
+
+
+def test_spool_is_locked_by_its_process(spool_file: str) -> None:
+    spool = ResultSpool(spool_file)
+    with pytest.raises(Exception, match="used by another process"):
+        ResultSpool(spool_file)
+    spool.close()
+
+
+def test_results_are_uploaded_in_the_background(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    task_service.uploads_allowed.clear()
+    task = make_task()
+
+    with make_service(task_service, spool_file) as service:
+        service.mark_task_completed(task, make_account_result())
+        # Returned before the upload
+        assert task_service.completed == []
+        task_service.uploads_allowed.set()
+        wait_until(lambda: task_service.completed == [task.id])
+
+    spool = ResultSpool(spool_file)
+    assert spool.list_all() == []
+    spool.close()
+    assert 'stage="upload_background"' in WORKER_METRICS.render()
+
+
+def test_lease_is_extended_until_the_upload_completes(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    task_service.uploads_allowed.clear()
+    task = make_task()
+
+    with make_service(task_service, spool_file, lease_extension_interval=1) as service:
+        service.mark_task_completed(task, make_account_result())
+        wait_until(
+            lambda: task_service.completed == [] and task.id in task_service.extended
+        )
+        task_service.uploads_allowed.set()
+        wait_until(lambda: task_service.completed == [task.id])
+
+
+def test_completions_wait_for_room_in_the_spool(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    task_service.uploads_allowed.clear()
+    first_task, second_task, third_task = make_task(), make_task(), make_task()
+
+    with make_service(task_service, spool_file, max_pending=1) as service:
+        service.mark_task_completed(first_task, make_account_result())
+        third_completed = threading.Event()
+
+        def complete_third_task() -> None:
+            service.mark_task_completed(second_task, make_account_result())
+            service.mark_task_completed(third_task, make_account_result())
+            third_completed.set()
+
+        thread = threading.Thread(target=complete_third_task)
+        thread.start()
+        assert not third_completed.wait(0.2)
+        task_service.uploads_allowed.set()
+        assert third_completed.wait(5)
+        thread.join()
+
+    assert task_service.completed == [first_task.id, second_task.id, third_task.id]
+
+
+def test_upload_error_is_raised_and_result_kept(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    task_service.upload_error = RuntimeError("backend down")
+    task = make_task()
+
+    service = make_service(task_service, spool_file)
+    with pytest.raises(RuntimeError, match="backend down"), service:
+        service.mark_task_completed(task, make_account_result())
+        with pytest.raises(RuntimeError, match="backend down"):
+            wait_until(
+                lambda: service.acquire_next_task(SocialNetwork.YOUTUBE) is not None
+            )
+
+    spool = ResultSpool(spool_file)
+    assert [spooled.task for spooled in spool.list_all()] == [task]
+    spool.close()
+
+
+def test_results_of_a_previous_process_are_uploaded(spool_file: str) -> None:
+    resumed_task, expired_task = make_task(), make_task()
+    spool = ResultSpool(spool_file)
+    spool.append(resumed_task, make_account_result())
+    spool.append(expired_task, make_account_result())
+    spool.close()
+    task_service = FakeTaskService()
+    task_service.lost_leases.add(expired_task.id)
+
+    with make_service(task_service, spool_file):
+        wait_until(lambda: task_service.completed == [resumed_task.id])
+
+    # The result of the task acquired again since is rejected, and dropped
+    assert task_service.completed == [resumed_task.id]
+    spool = ResultSpool(spool_file)
+    assert spool.list_all() == []
+    spool.close()
+
+
+def test_result_of_a_lost_lease_is_dropped(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    task = make_task()
+    task_service.lost_leases.add(task.id)
+
+    with make_service(task_service, spool_file) as service:
+        service.mark_task_completed(task, make_account_result())
+        service.limit_exit_wait(5)
+
+    assert task_service.completed == []
+    spool = ResultSpool(spool_file)
+    assert spool.list_all() == []
+    spool.close()
+
+
+def test_exit_leaves_results_not_uploaded_in_time_in_the_spool(
+    spool_file: str,
+) -> None:
+    task_service = FakeTaskService()
+    task_service.uploads_allowed.clear()
+    task = make_task()
+
+    service = make_service(task_service, spool_file)
+    with service:
+        service.mark_task_completed(task, make_account_result())
+        service.limit_exit_wait(0.1)
+        started_at = time.monotonic()
+    assert time.monotonic() - started_at < 2
+
+    # The upload in progress completes after exit, its result is not deleted
+    task_service.uploads_allowed.set()
+    wait_until(lambda: task_service.completed == [task.id])
+    spool = ResultSpool(spool_file)
+    assert [spooled.task for spooled in spool.list_all()] == [task]
+    spool.close()
+
+
+def test_completion_after_exit_is_not_spooled(spool_file: str) -> None:
+    task_service = FakeTaskService()
+    service = make_service(task_service, spool_file)
+    with service:
+        pass
+
+    with pytest.raises(TaskLeaseLostError):
+        service.mark_task_completed(make_task(), make_account_result())
+    spool = ResultSpool(spool_file)
+    assert spool.list_all() == []
+    spool.close()
@@ -0,0 +1,178 @@
+import datetime
+import signal
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+import pytest
+
+from data_extractors.data_extractor import DataExtractor
+from extraction_task.extraction_task import (
+    ExtractionTask,
+    ExtractionTaskStatus,
+    ExtractionTaskType,
+)
+from extraction_task.extraction_task_config import (
+    ExtractAccountTaskConfig,
+    ExtractPostDetailsTaskConfig,
+    ExtractPostListTaskConfig,
+)
+from extraction_task.extraction_task_result import (
+    AccountExtractionResult,
+    ExtractionTaskResult,
+    PostDetailsExtractionResult,
+    PostListExtractionResult,
+)
+from extraction_task.extraction_task_service import ExtractionTaskService
+from extraction_task.social_network import SocialNetwork
+import task_processing_loop
+from task_processing_loop import TaskProcessingLoop
+
+NOW = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class FakeTaskService(ExtractionTaskService):
+    """Hands out the given tasks, once acquire_allowed is set."""
+
+    def __init__(self, tasks: list[ExtractionTask]) -> None:
+        self.tasks = tasks
+        self.released: list[uuid.UUID] = []
+        self.marked: list[uuid.UUID] = []
+        self.acquiring = threading.Event()
+        self.acquire_allowed = threading.Event()
+        self.acquire_allowed.set()
+
+    def acquire_next_task(
+        self, social_network: SocialNetwork, wait_seconds: int = 0
+    ) -> Optional[ExtractionTask]:
+        # Long polling
+        self.acquiring.set()
+        self.acquire_allowed.wait()
+        return self.tasks.pop(0) if self.tasks else None
+
+    def release_tasks(self, tasks: list[ExtractionTask]) -> None:
+        self.released += [task.id for task in tasks]
+
+    def extend_task_lease(self, task: ExtractionTask) -> None:
+        pass
+
+    def mark_task_completed(
+        self, task: ExtractionTask, task_result: ExtractionTaskResult
+    ) -> None:
+        self.marked.append(task.id)
+
+    def mark_task_failed(self, task: ExtractionTask, task_error: str) -> None:
+        self.marked.append(task.id)
+
+
+class BlockingExtractor(DataExtractor):
+    """Extracts accounts once extraction_allowed is set."""
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.extraction_allowed = threading.Event()
+
+    def extract_account(
+        self, task_config: ExtractAccountTaskConfig
+    ) -> AccountExtractionResult:
+        self.started.set()
+        self.extraction_allowed.wait()
+        return AccountExtractionResult(
+            data_extraction_date=NOW,
+            handle="handle",
+            description="description",
+            follower_count=1,
+            following_count=2,
+            post_count=3,
+            view_count=4,
+            like_count=5,
+            categories=[],
+        )
+
+    def extract_post_list(
+        self, task_config: ExtractPostListTaskConfig
+    ) -> PostListExtractionResult:
+        raise NotImplementedError
+
+    def extract_post_details(
+        self, task_config: ExtractPostDetailsTaskConfig
+    ) -> PostDetailsExtractionResult:
+        raise NotImplementedError
+
+
+def make_task() -> ExtractionTask:
+    return ExtractionTask(
+        id=uuid.uuid4(),
+        social_network=SocialNetwork.YOUTUBE,
+        type=ExtractionTaskType.EXTRACT_ACCOUNT,
+        task_config=ExtractAccountTaskConfig(account_id="account"),
+        status=ExtractionTaskStatus.ACQUIRED,
+        visible_at=NOW,
+        error=None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_public_ip_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(task_processing_loop, "get_my_public_ip", lambda: "test")
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def start_loop(
+    task_service: FakeTaskService, extractor: BlockingExtractor
+) -> tuple[TaskProcessingLoop, threading.Thread]:
+    loop = TaskProcessingLoop(
+        task_service,
+        SocialNetwork.YOUTUBE,
+        lambda: extractor,
+        polling_interval=1,
+        exit_after_tasks_failure=True,
+        lease_extension_interval=60,
+        task_wait_seconds=1,
+        shutdown_grace_seconds=0.1,
+    )
+    thread = threading.Thread(target=loop.run)
+    thread.start()
+    return loop, thread
+
+
+def test_tasks_executing_after_the_grace_period_are_released_and_dropped() -> None:
+    task = make_task()
+    task_service = FakeTaskService([task])
+    extractor = BlockingExtractor()
+    loop, thread = start_loop(task_service, extractor)
+    assert extractor.started.wait(5)
+
+    # Called by the signal handler, installed by the main thread only
+    loop._handle_stop_signal(signal.SIGTERM, None)
+    thread.join(5)
+    assert task_service.released == [task.id]
+
+    # Not reported once released
+    extractor.extraction_allowed.set()
+    time.sleep(0.1)
+    assert task_service.marked == []
+
+
+def test_task_acquired_while_stopping_is_released() -> None:
+    task = make_task()
+    task_service = FakeTaskService([task])
+    task_service.acquire_allowed.clear()
+    extractor = BlockingExtractor()
+    loop, thread = start_loop(task_service, extractor)
+    assert task_service.acquiring.wait(5)
+
+    loop._handle_stop_signal(signal.SIGTERM, None)
+    task_service.acquire_allowed.set()
+    wait_until(lambda: task_service.released == [task.id])
+    thread.join(5)
+
+    assert not extractor.started.is_set()
+    assert task_service.marked == []
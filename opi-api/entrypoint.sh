@@ -9,4 +9,4 @@ echo "run db migration"
 
 # Run the application
 source /opi-api/.venv/bin/activate
-exec opi-api --host ${HOST} --port ${PORT} --reload ${RELOAD}
+exec opi-api --host ${HOST} --port ${PORT} --reload ${RELOAD} --workers ${WORKERS:-1}
@@ -0,0 +1,17 @@
+DROP INDEX IF EXISTS "v1"."extraction_task_account_id_idx";
+DROP INDEX IF EXISTS "v1"."extraction_task_failed_idx";
+DROP INDEX IF EXISTS "v1"."extraction_task_acquired_visible_at_idx";
+DROP INDEX IF EXISTS "v1"."extraction_task_available_idx";
+
+ALTER TABLE "v1"."extraction_task" RESET (
+    fillfactor,
+    autovacuum_vacuum_scale_factor,
+    autovacuum_analyze_scale_factor
+);
+
+ALTER TABLE "v1"."extraction_task"
+    DROP COLUMN IF EXISTS "post_id",
+    DROP COLUMN IF EXISTS "account_id";
+
+ALTER TABLE "v1"."extraction_task"
+    ALTER COLUMN "config" TYPE JSON USING "config"::json;
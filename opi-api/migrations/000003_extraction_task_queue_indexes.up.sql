@@ -0,0 +1,38 @@
+-- Store task config as JSONB and expose the ids used for filtering as real columns
+ALTER TABLE "v1"."extraction_task"
+    ALTER COLUMN "config" TYPE JSONB USING "config"::jsonb;
+
+ALTER TABLE "v1"."extraction_task"
+    ADD COLUMN "account_id" TEXT GENERATED ALWAYS AS ("config"->>'account_id') STORED,
+    ADD COLUMN "post_id" TEXT GENERATED ALWAYS AS ("config"->>'post_id') STORED;
+
+-- Tasks change status several times during their life: leave free space on each page
+-- so new row versions stay on the same page, and vacuum the queue more eagerly.
+ALTER TABLE "v1"."extraction_task" SET (
+    fillfactor = 70,
+    autovacuum_vacuum_scale_factor = 0.02,
+    autovacuum_analyze_scale_factor = 0.02
+);
+
+-- Matches the acquire ordering: keep in sync with ACQUIRE_TASKS_QUERY
+CREATE INDEX "extraction_task_available_idx"
+    ON "v1"."extraction_task" (
+        "social_network",
+        (CASE "type" WHEN 'extract-post-details' THEN 0 ELSE 1 END),
+        "created_at"
+    )
+    WHERE "status" = 'AVAILABLE';
+
+-- Used to find expired leases
+CREATE INDEX "extraction_task_acquired_visible_at_idx"
+    ON "v1"."extraction_task" ("visible_at")
+    WHERE "status" = 'ACQUIRED';
+
+-- Used by recycle-failed
+CREATE INDEX "extraction_task_failed_idx"
+    ON "v1"."extraction_task" ("created_at")
+    WHERE "status" = 'FAILED';
+
+-- Used by stats and per account filtering
+CREATE INDEX "extraction_task_account_id_idx"
+    ON "v1"."extraction_task" ("account_id", "social_network");
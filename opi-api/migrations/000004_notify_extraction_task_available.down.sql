@@ -0,0 +1,4 @@
+DROP TRIGGER IF EXISTS "extraction_task_available_after_update" ON "v1"."extraction_task";
+DROP TRIGGER IF EXISTS "extraction_task_available_after_insert" ON "v1"."extraction_task";
+DROP FUNCTION IF EXISTS "v1"."notify_extraction_task_available"();
+DROP FUNCTION IF EXISTS "v1"."notify_extraction_task_row_available"();
@@ -0,0 +1,38 @@
+-- Notify listeners (long polling acquire) when tasks become AVAILABLE,
+-- with the task social network as payload.
+-- Keep channel name in sync with app.db.listener.TASK_AVAILABLE_CHANNEL
+CREATE FUNCTION "v1"."notify_extraction_task_available"() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('extraction_task_available', available.social_network)
+    FROM (
+        SELECT DISTINCT social_network
+        FROM new_tasks
+        WHERE status = 'AVAILABLE'
+    ) AS available;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER "extraction_task_available_after_insert"
+    AFTER INSERT ON "v1"."extraction_task"
+    REFERENCING NEW TABLE AS new_tasks
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION "v1"."notify_extraction_task_available"();
+
+-- Row level, for the rows becoming AVAILABLE only: updates of the hot paths (acquire, extend
+-- lease, complete) are filtered out by the WHEN clause, without calling the function nor scanning
+-- a transition table. Notifications of a transaction with the same payload are sent once.
+CREATE FUNCTION "v1"."notify_extraction_task_row_available"() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pg_notify('extraction_task_available', NEW.social_network);
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER "extraction_task_available_after_update"
+    AFTER UPDATE OF "status" ON "v1"."extraction_task"
+    FOR EACH ROW
+    WHEN (NEW."status" = 'AVAILABLE' AND OLD."status" IS DISTINCT FROM 'AVAILABLE')
+    EXECUTE FUNCTION "v1"."notify_extraction_task_row_available"();
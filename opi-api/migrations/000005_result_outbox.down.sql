@@ -0,0 +1 @@
+DROP TABLE IF EXISTS "v1"."result_outbox";
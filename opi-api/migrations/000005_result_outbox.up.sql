@@ -0,0 +1,17 @@
+-- Extraction results accepted by /posts/ and /accounts/, waiting to be pushed to NocoDB.
+-- Rows are deleted once pushed. See app.backend.result_outbox.
+CREATE TABLE "v1"."result_outbox" (
+    "id" BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    "created_at" timestamptz NOT NULL DEFAULT (now()),
+    -- 'account' or 'post'
+    "kind" TEXT NOT NULL,
+    -- JSON array of the accounts or posts of one request
+    "payload" JSONB NOT NULL,
+    "attempts" INT NOT NULL DEFAULT 0,
+    -- Rows are claimed by pushing it forward, and on failure it is set to the retry time
+    "next_attempt_at" timestamptz NOT NULL DEFAULT (now()),
+    "last_error" TEXT
+);
+
+CREATE INDEX "result_outbox_next_attempt_at_idx"
+    ON "v1"."result_outbox" ("next_attempt_at");
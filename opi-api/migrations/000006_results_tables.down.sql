@@ -0,0 +1,15 @@
+CREATE TABLE IF NOT EXISTS "v1"."result_outbox" (
+    "id" BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    "created_at" timestamptz NOT NULL DEFAULT (now()),
+    "kind" TEXT NOT NULL,
+    "payload" JSONB NOT NULL,
+    "attempts" INT NOT NULL DEFAULT 0,
+    "next_attempt_at" timestamptz NOT NULL DEFAULT (now()),
+    "last_error" TEXT
+);
+
+CREATE INDEX IF NOT EXISTS "result_outbox_next_attempt_at_idx"
+    ON "v1"."result_outbox" ("next_attempt_at");
+
+DROP TABLE IF EXISTS "v1"."post";
+DROP TABLE IF EXISTS "v1"."account";
@@ -0,0 +1,121 @@
+-- Extraction results, keyed by their social network ids and upserted a whole request at a time.
+-- Changed rows are mirrored into NocoDB in the background (see app.backend.nocodb_sync):
+-- a row is pending while "synced_at" differs from "updated_at".
+CREATE TABLE "v1"."account" (
+    "social_network" TEXT NOT NULL,
+    "account_id" TEXT NOT NULL,
+    "account_extracted_at" timestamptz NOT NULL,
+    "handle" TEXT,
+    "description" TEXT NOT NULL,
+    "follower_count" BIGINT NOT NULL,
+    "following_count" BIGINT NOT NULL,
+    "post_count" BIGINT NOT NULL,
+    "view_count" BIGINT NOT NULL,
+    "like_count" BIGINT NOT NULL,
+    "categories" TEXT [] NOT NULL,
+    "created_at" timestamptz NOT NULL DEFAULT (now()),
+    "updated_at" timestamptz NOT NULL DEFAULT (now()),
+    "synced_at" timestamptz,
+    "sync_attempts" INT NOT NULL DEFAULT 0,
+    -- Rows are claimed by pushing it forward, and on failure it is set to the retry time
+    "next_sync_at" timestamptz NOT NULL DEFAULT (now()),
+    "sync_error" TEXT,
+    PRIMARY KEY ("social_network", "account_id")
+);
+
+CREATE INDEX "account_sync_pending_idx"
+    ON "v1"."account" ("next_sync_at")
+    WHERE "synced_at" IS DISTINCT FROM "updated_at";
+
+CREATE TABLE "v1"."post" (
+    "social_network" TEXT NOT NULL,
+    "post_id" TEXT NOT NULL,
+    "account_id" TEXT NOT NULL,
+    "post_extracted_at" timestamptz NOT NULL,
+    "published_at" timestamptz NOT NULL,
+    "post_url" TEXT NOT NULL,
+    "title" TEXT NOT NULL,
+    "description" TEXT NOT NULL,
+    "comment_count" BIGINT NOT NULL,
+    "view_count" BIGINT NOT NULL,
+    "repost_count" BIGINT NOT NULL,
+    "like_count" BIGINT NOT NULL,
+    "share_count" BIGINT NOT NULL,
+    "categories" TEXT [] NOT NULL,
+    "tags" TEXT [] NOT NULL,
+    "sn_has_paid_placement" BOOLEAN NOT NULL,
+    "sn_brand" TEXT NOT NULL,
+    "post_type" TEXT NOT NULL,
+    "text_content" TEXT NOT NULL,
+    "created_at" timestamptz NOT NULL DEFAULT (now()),
+    "updated_at" timestamptz NOT NULL DEFAULT (now()),
+    "synced_at" timestamptz,
+    "sync_attempts" INT NOT NULL DEFAULT 0,
+    "next_sync_at" timestamptz NOT NULL DEFAULT (now()),
+    "sync_error" TEXT,
+    PRIMARY KEY ("social_network", "post_id")
+);
+
+CREATE INDEX "post_account_id_idx"
+    ON "v1"."post" ("social_network", "account_id");
+
+CREATE INDEX "post_sync_pending_idx"
+    ON "v1"."post" ("next_sync_at")
+    WHERE "synced_at" IS DISTINCT FROM "updated_at";
+
+-- Results still waiting in the outbox are moved to the new tables (latest payload wins)
+INSERT INTO "v1"."account" (
+    "social_network", "account_id", "account_extracted_at", "handle", "description",
+    "follower_count", "following_count", "post_count", "view_count", "like_count", "categories"
+)
+SELECT DISTINCT ON (account.social_network, account.account_id)
+    account."social_network",
+    account."account_id",
+    account."account_extracted_at",
+    account."handle",
+    account."description",
+    account."follower_count",
+    account."following_count",
+    account."post_count",
+    account."view_count",
+    account."like_count",
+    account."categories"
+FROM "v1"."result_outbox" AS outbox
+    CROSS JOIN jsonb_array_elements(outbox.payload) AS item
+    CROSS JOIN jsonb_populate_record(NULL::"v1"."account", item) AS account
+WHERE outbox.kind = 'account'
+ORDER BY account.social_network, account.account_id, outbox.id DESC;
+
+INSERT INTO "v1"."post" (
+    "social_network", "post_id", "account_id", "post_extracted_at", "published_at", "post_url",
+    "title", "description", "comment_count", "view_count", "repost_count", "like_count",
+    "share_count", "categories", "tags", "sn_has_paid_placement", "sn_brand", "post_type",
+    "text_content"
+)
+SELECT DISTINCT ON (post.social_network, post.post_id)
+    post."social_network",
+    post."post_id",
+    post."account_id",
+    post."post_extracted_at",
+    post."published_at",
+    post."post_url",
+    post."title",
+    post."description",
+    post."comment_count",
+    post."view_count",
+    post."repost_count",
+    post."like_count",
+    post."share_count",
+    post."categories",
+    post."tags",
+    post."sn_has_paid_placement",
+    post."sn_brand",
+    post."post_type",
+    post."text_content"
+FROM "v1"."result_outbox" AS outbox
+    CROSS JOIN jsonb_array_elements(outbox.payload) AS item
+    CROSS JOIN jsonb_populate_record(NULL::"v1"."post", item) AS post
+WHERE outbox.kind = 'post'
+ORDER BY post.social_network, post.post_id, outbox.id DESC;
+
+DROP TABLE "v1"."result_outbox";
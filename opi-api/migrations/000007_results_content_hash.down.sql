@@ -0,0 +1,3 @@
+ALTER TABLE "v1"."post" DROP COLUMN "content_hash";
+
+ALTER TABLE "v1"."account" DROP COLUMN "content_hash";
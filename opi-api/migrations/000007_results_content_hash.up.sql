@@ -0,0 +1,6 @@
+-- Hash of the significant fields of a result (all but its extraction date), computed by the
+-- upserts: results re-extracted without changes are not rewritten, nor synced to NocoDB again.
+-- Existing rows have no hash, their next upsert is always written.
+ALTER TABLE "v1"."account" ADD COLUMN "content_hash" TEXT;
+
+ALTER TABLE "v1"."post" ADD COLUMN "content_hash" TEXT;
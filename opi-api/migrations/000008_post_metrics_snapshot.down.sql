@@ -0,0 +1,4 @@
+DROP FUNCTION IF EXISTS "v1"."create_post_metrics_snapshot_partition"(timestamptz);
+
+-- Drops its partitions too
+DROP TABLE IF EXISTS "v1"."post_metrics_snapshot";
@@ -0,0 +1,61 @@
+-- Post metrics as extracted over time, appended (COPY) by every /posts/ request: the post
+-- table only keeps the latest values. Partitioned by month of extraction (UTC), extraction
+-- times are mostly increasing so a BRIN index is enough for time range queries.
+CREATE TABLE "v1"."post_metrics_snapshot" (
+    "social_network" TEXT NOT NULL,
+    "post_id" TEXT NOT NULL,
+    "account_id" TEXT NOT NULL,
+    "extracted_at" timestamptz NOT NULL,
+    "view_count" BIGINT NOT NULL,
+    "like_count" BIGINT NOT NULL,
+    "comment_count" BIGINT NOT NULL,
+    "share_count" BIGINT NOT NULL,
+    "repost_count" BIGINT NOT NULL
+) PARTITION BY RANGE ("extracted_at");
+
+CREATE INDEX "post_metrics_snapshot_extracted_at_idx"
+    ON "v1"."post_metrics_snapshot" USING BRIN ("extracted_at");
+
+-- Create the partition holding "extracted_at" if it does not exist yet.
+-- Called by the API before appending snapshots (see app.backend.routing.endpoints.social_network)
+CREATE FUNCTION "v1"."create_post_metrics_snapshot_partition"("extracted_at" timestamptz)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start timestamp := date_trunc('month', extracted_at AT TIME ZONE 'UTC');
+    partition_name text := 'post_metrics_snapshot_' || to_char(month_start, 'YYYY_MM');
+BEGIN
+    -- Concurrent requests may create the same partition
+    PERFORM pg_advisory_xact_lock(hashtext(partition_name));
+    IF to_regclass(format('v1.%I', partition_name)) IS NULL THEN
+        EXECUTE format(
+            'CREATE TABLE v1.%I PARTITION OF v1.post_metrics_snapshot FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            month_start AT TIME ZONE 'UTC',
+            (month_start + INTERVAL '1 month') AT TIME ZONE 'UTC'
+        );
+    END IF;
+END;
+$$;
+
+-- Current metrics of existing posts are their first snapshot
+DO $$
+BEGIN
+    PERFORM "v1"."create_post_metrics_snapshot_partition"(months.month_start)
+    FROM (
+        SELECT DISTINCT
+            date_trunc('month', "post_extracted_at" AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'
+                AS month_start
+        FROM "v1"."post"
+    ) AS months;
+END;
+$$;
+
+INSERT INTO "v1"."post_metrics_snapshot" (
+    "social_network", "post_id", "account_id", "extracted_at",
+    "view_count", "like_count", "comment_count", "share_count", "repost_count"
+)
+SELECT
+    "social_network", "post_id", "account_id", "post_extracted_at",
+    "view_count", "like_count", "comment_count", "share_count", "repost_count"
+FROM "v1"."post";
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS "v1"."extraction_task_open_unique_idx";
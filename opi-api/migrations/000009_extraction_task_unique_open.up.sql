@@ -0,0 +1,24 @@
+-- A task can only be registered once while it is not COMPLETED (registration is idempotent,
+-- see register_tasks), completed tasks can be registered again to refresh their data.
+-- Keep existing duplicates of open tasks: the acquired one, else the oldest.
+DELETE FROM "v1"."extraction_task" AS task
+USING (
+    SELECT
+        "uid",
+        ROW_NUMBER() OVER (
+            PARTITION BY "social_network", "type", "config"
+            ORDER BY
+                CASE "status" WHEN 'ACQUIRED' THEN 0 WHEN 'AVAILABLE' THEN 1 ELSE 2 END,
+                "created_at",
+                "uid"
+        ) AS "rank"
+    FROM "v1"."extraction_task"
+    WHERE "status" <> 'COMPLETED'
+) AS duplicate
+WHERE task."uid" = duplicate."uid"
+    AND duplicate."rank" > 1;
+
+-- Matches the register_tasks ON CONFLICT clause
+CREATE UNIQUE INDEX "extraction_task_open_unique_idx"
+    ON "v1"."extraction_task" ("social_network", "type", "config")
+    WHERE "status" <> 'COMPLETED';
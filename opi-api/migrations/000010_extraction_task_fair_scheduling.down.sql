@@ -0,0 +1,14 @@
+DROP INDEX IF EXISTS "v1"."extraction_task_available_any_network_idx";
+DROP INDEX IF EXISTS "v1"."extraction_task_available_idx";
+
+CREATE INDEX "extraction_task_available_idx"
+    ON "v1"."extraction_task" (
+        "social_network",
+        (CASE "type" WHEN 'extract-post-details' THEN 0 ELSE 1 END),
+        "created_at"
+    )
+    WHERE "status" = 'AVAILABLE';
+
+ALTER TABLE "v1"."extraction_task"
+    DROP COLUMN IF EXISTS "fair_rank",
+    DROP COLUMN IF EXISTS "priority";
@@ -0,0 +1,47 @@
+-- Explicit task priority (higher first), by default extract-post-details tasks go first as before
+ALTER TABLE "v1"."extraction_task" ADD COLUMN "priority" SMALLINT NOT NULL DEFAULT 0;
+
+-- Position of AVAILABLE tasks in the round-robin: tasks of a registration get ranks starting at
+-- the head of the queue, interleaving accounts, so they are acquired alternately with the tasks
+-- registered before them and with the other accounts (see register_tasks).
+ALTER TABLE "v1"."extraction_task" ADD COLUMN "fair_rank" BIGINT NOT NULL DEFAULT 0;
+
+UPDATE "v1"."extraction_task"
+SET "priority" = 1
+WHERE "type" = 'extract-post-details';
+
+UPDATE "v1"."extraction_task" AS task
+SET "fair_rank" = ranked."fair_rank"
+FROM (
+    SELECT
+        "uid",
+        ROW_NUMBER() OVER (
+            PARTITION BY "social_network"
+            ORDER BY "account_position", "created_at", "uid"
+        ) AS "fair_rank"
+    FROM (
+        SELECT
+            "uid",
+            "social_network",
+            "created_at",
+            ROW_NUMBER() OVER (
+                PARTITION BY "social_network", "account_id"
+                ORDER BY "created_at", "uid"
+            ) AS "account_position"
+        FROM "v1"."extraction_task"
+        WHERE "status" = 'AVAILABLE'
+    ) AS available
+) AS ranked
+WHERE task."uid" = ranked."uid";
+
+-- Match the acquire ordering, filtered by social network or not: keep in sync with
+-- ACQUIRE_TASKS_QUERY
+DROP INDEX "v1"."extraction_task_available_idx";
+
+CREATE INDEX "extraction_task_available_idx"
+    ON "v1"."extraction_task" ("social_network", "priority" DESC, "fair_rank", "created_at")
+    WHERE "status" = 'AVAILABLE';
+
+CREATE INDEX "extraction_task_available_any_network_idx"
+    ON "v1"."extraction_task" ("priority" DESC, "fair_rank", "created_at")
+    WHERE "status" = 'AVAILABLE';
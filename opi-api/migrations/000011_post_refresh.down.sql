@@ -0,0 +1,3 @@
+DROP INDEX IF EXISTS "v1"."post_next_refresh_at_idx";
+
+ALTER TABLE "v1"."post" DROP COLUMN IF EXISTS "next_refresh_at";
@@ -0,0 +1,7 @@
+-- When the details of a post should be extracted again, planned by the post refresh scheduler
+-- (see app.backend.post_refresh): NULL until the post is first planned.
+ALTER TABLE "v1"."post" ADD COLUMN "next_refresh_at" timestamptz;
+
+-- Used both to find posts not planned yet (NULL) and posts due for a refresh
+CREATE INDEX "post_next_refresh_at_idx"
+    ON "v1"."post" ("next_refresh_at");
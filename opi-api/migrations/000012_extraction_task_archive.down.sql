@@ -0,0 +1,16 @@
+-- Archived tasks are moved back to the queue table
+INSERT INTO "v1"."extraction_task" (
+    "uid", "created_at", "finished_at", "type", "config", "social_network", "status", "error",
+    "priority"
+)
+SELECT
+    "uid", "created_at", "finished_at", "type", "config", "social_network", "status", "error",
+    "priority"
+FROM "v1"."extraction_task_archive"
+ON CONFLICT DO NOTHING;
+
+DROP TABLE IF EXISTS "v1"."extraction_task_archive";
+
+DROP INDEX IF EXISTS "v1"."extraction_task_finished_idx";
+
+ALTER TABLE "v1"."extraction_task" DROP COLUMN IF EXISTS "finished_at";
@@ -0,0 +1,36 @@
+-- When a task was marked COMPLETED or FAILED
+ALTER TABLE "v1"."extraction_task" ADD COLUMN "finished_at" timestamptz;
+
+UPDATE "v1"."extraction_task"
+SET "finished_at" = "created_at"
+WHERE "status" IN ('COMPLETED', 'FAILED');
+
+-- Used to find the tasks to archive
+CREATE INDEX "extraction_task_finished_idx"
+    ON "v1"."extraction_task" ("finished_at")
+    WHERE "status" IN ('COMPLETED', 'FAILED');
+
+-- Finished tasks are moved here in the background (see app.backend.task_archiver)
+-- so that v1.extraction_task only holds live work.
+CREATE TABLE "v1"."extraction_task_archive" (
+    "uid" uuid PRIMARY KEY,
+    "created_at" timestamptz NOT NULL,
+    "finished_at" timestamptz NOT NULL,
+    "archived_at" timestamptz NOT NULL DEFAULT (now()),
+    "type" TEXT NOT NULL,
+    "config" JSONB,
+    "account_id" TEXT,
+    "post_id" TEXT,
+    "social_network" TEXT NOT NULL,
+    "status" TEXT NOT NULL,
+    "error" TEXT,
+    "priority" SMALLINT NOT NULL
+);
+
+-- Used by stats and per account filtering
+CREATE INDEX "extraction_task_archive_account_id_idx"
+    ON "v1"."extraction_task_archive" ("account_id", "social_network");
+
+-- Rows are appended in finished_at order (roughly)
+CREATE INDEX "extraction_task_archive_finished_at_idx"
+    ON "v1"."extraction_task_archive" USING BRIN ("finished_at");
@@ -0,0 +1 @@
+ALTER TABLE "v1"."extraction_task" DROP COLUMN IF EXISTS "lease_token";
@@ -0,0 +1,4 @@
+-- Fencing token of the current lease, generated by each acquire: a worker whose lease
+-- expired and whose task was acquired again can no longer extend, complete, fail or
+-- release it.
+ALTER TABLE "v1"."extraction_task" ADD COLUMN "lease_token" uuid;
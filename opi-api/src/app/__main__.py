@@ -1,6 +1,7 @@
 """Main entrypoint for OPI API."""
 
 import argparse
+import os
 
 import uvicorn
 
@@ -27,28 +28,45 @@ def parse_command() -> argparse.Namespace:
 
     parser.add_argument(
         "--reload",
-        help="Enable auto-reload of the server.",
+        help="Enable auto-reload of the server (development only, implies a single worker).",
         type=str,
         choices=["true", "false"],
         default="false",
     )
 
+    parser.add_argument(
+        "--workers",
+        help="Number of worker processes.",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
+
+    parser.add_argument(
+        "--timeout-keep-alive",
+        help="Seconds to keep idle client connections open. "
+        "Should be longer than the idle timeout of any proxy in front of the API.",
+        type=int,
+        default=75,
+    )
+
     return parser.parse_args()
 
 
 def main() -> None:
     """Start the uvicorn server."""
     args = parse_command()
+    reload = args.reload == "true"
+    workers = 1 if reload else args.workers
+    # Worker processes inherit the environment: used to size their connection pool
+    os.environ["WEB_CONCURRENCY"] = str(workers)
     uvicorn.run(
         "app.factory:app",
-        reload=args.reload == "true",
+        reload=reload,
         log_level="info",
         host=args.host,
         port=args.port,
-        workers=1,
-        headers=[
-            ("Connection", "close"),
-        ],
+        workers=workers,
+        timeout_keep_alive=args.timeout_keep_alive,
     )
 
 
@@ -0,0 +1,53 @@
+"""In-process caches."""
+
+import time
+from collections import OrderedDict
+
+
+class TTLCache[K, V]:
+    """Least recently used cache whose entries expire after a time to live.
+
+    Entries are kept in the process memory: each uvicorn worker has its own cache.
+    """
+
+    def __init__(self, ttl_seconds: float, max_size: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Time after which an entry is considered stale.
+            max_size: Maximum number of entries, least recently used entries are
+                evicted first. No limit when None.
+
+        """
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Get a value, None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Set a value, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+        self._entries.move_to_end(key)
+        if self._max_size is not None and len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        """Remove a value if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
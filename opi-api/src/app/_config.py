@@ -8,6 +8,34 @@ class Settings(BaseSettings):
     nocodb_base_id: str
     nocodb_account_table: str
     nocodb_post_table: str
+    nocodb_timeout_seconds: float = 10
+    nocodb_connect_timeout_seconds: float = 5
+    nocodb_max_connections: int = 10
+    nocodb_write_batch_size: int = 10
+    nocodb_metadata_cache_ttl_seconds: float = 300
+    nocodb_record_id_cache_ttl_seconds: float = 600
+    nocodb_record_id_cache_size: int = 10000
+    extraction_task_stats_cache_ttl_seconds: float = 5
+    extraction_task_lease_seconds: int = 600
+    # Approximate under concurrent acquires: each one counts the live leases without the tasks
+    # being leased by the others, so an account may briefly get a few more
+    extraction_task_max_acquired_per_account: int = 2
+    expired_lease_reaper_interval_seconds: float = 60
+    extraction_task_archive_interval_seconds: float = 60
+    extraction_task_archive_batch_size: int = 5000
+    extraction_task_archive_completed_after_seconds: float = 3600
+    extraction_task_archive_failed_after_seconds: float = 604800
+    nocodb_sync_interval_seconds: float = 5
+    nocodb_sync_batch_size: int = 500
+    nocodb_sync_lease_seconds: int = 600
+    nocodb_sync_retry_base_seconds: float = 10
+    nocodb_sync_retry_max_seconds: float = 3600
+    posts_stream_batch_size: int = 500
+    post_refresh_interval_seconds: float = 300
+    post_refresh_batch_size: int = 1000
+    post_refresh_age_factor: float = 0.25
+    post_refresh_min_interval_seconds: float = 43200
+    post_refresh_max_interval_seconds: float = 7776000
 
 
 settings = Settings()
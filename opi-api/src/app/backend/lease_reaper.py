@@ -0,0 +1,23 @@
+"""Background recycling of expired task leases."""
+
+import asyncio
+import logging
+
+from app.backend.routing.endpoints.extraction_task import recycle_expired_leases
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def run_expired_lease_reaper(interval_seconds: float) -> None:
+    """Recycle expired leases every `interval_seconds` until cancelled."""
+    LOGGER.info("Starting expired lease reaper (every %ss)", interval_seconds)
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            recycled_count = await recycle_expired_leases()
+        except Exception:
+            # Keep the reaper alive: the next run will retry
+            LOGGER.exception("Expired lease reaper run failed")
+            continue
+        if recycled_count:
+            LOGGER.info("Recycled %s tasks with expired lease", recycled_count)
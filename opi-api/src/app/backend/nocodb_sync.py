@@ -0,0 +1,32 @@
+"""Background mirroring of the results tables into NocoDB."""
+
+import asyncio
+import contextlib
+import logging
+
+from app.backend.routing.endpoints.social_network import RESULTS_CHANGED, sync_results_to_nocodb
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def run_nocodb_sync(interval_seconds: float) -> None:
+    """Sync changed results to NocoDB until cancelled.
+
+    Waits up to `interval_seconds` between syncs when nothing changed: results
+    upserted by this worker wake it up immediately, those of other workers at the
+    next interval (or are synced by their own worker).
+    """
+    LOGGER.info("Starting NocoDB sync (every %ss)", interval_seconds)
+    while True:
+        RESULTS_CHANGED.clear()
+        try:
+            claimed_count = await sync_results_to_nocodb()
+        except Exception:
+            # Keep the sync alive: claimed rows are retried once their claim expires
+            LOGGER.exception("NocoDB sync failed")
+            claimed_count = 0
+        if claimed_count:
+            continue
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(interval_seconds):
+                await RESULTS_CHANGED.wait()
@@ -0,0 +1,34 @@
+"""Background scheduling of post refreshes."""
+
+import asyncio
+import logging
+
+from app._config import settings
+from app.backend.routing.endpoints.extraction_task import schedule_post_refreshes
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def run_post_refresh_scheduler(interval_seconds: float) -> None:
+    """Register refresh tasks for the posts due every `interval_seconds` until cancelled.
+
+    Runs again immediately while full batches of posts are planned (e.g. after a large
+    post list extraction), unless a full batch of posts was due: refresh tasks are
+    registered at most `post_refresh_batch_size` at a time, every `interval_seconds`.
+    """
+    LOGGER.info("Starting post refresh scheduler (every %ss)", interval_seconds)
+    while True:
+        try:
+            planned_count, due_count, registered_count = await schedule_post_refreshes()
+        except Exception:
+            # Keep the scheduler alive: the next run will retry
+            LOGGER.exception("Post refresh scheduling failed")
+            planned_count = due_count = 0
+        else:
+            if registered_count:
+                LOGGER.info("Registered %s post refresh tasks", registered_count)
+        if (
+            planned_count < settings.post_refresh_batch_size
+            or due_count >= settings.post_refresh_batch_size
+        ):
+            await asyncio.sleep(interval_seconds)
@@ -1,25 +1,39 @@
+import asyncio
 import json
 import logging
+import time
 import uuid
 from http import HTTPStatus
+from typing import Annotated
 
+import asyncpg
 import fastapi
 
 from app._auth import validate_api_key
+from app._cache import TTLCache
+from app._config import settings
 from app.db import pool
+from app.db.listener import TaskAvailableListener
 from app.models import (
     DetailedStats,
+    ExtendTaskLeaseResponse,
     ExtractionTask,
     ExtractionTaskResponse,
     ExtractionTaskStatsResponse,
     ExtractionTaskStatus,
     ExtractionTaskType,
     MarkTaskFailedPayload,
+    MarkTasksCompletedPayload,
+    MarkTasksFailedPayload,
+    MarkTasksResponse,
     NetworkCount,
     RecycleExpiredTasksResponse,
     RecycleFailedTasksResponse,
+    RegisterTasksResponse,
+    ReleaseTasksPayload,
     SocialNetwork,
     StatusCount,
+    TaskMarkResult,
     TaskTypeCount,
 )
 
@@ -27,101 +41,432 @@ LOGGER = logging.getLogger(__name__)
 API_KEY = fastapi.Depends(validate_api_key)
 
 
-async def acquire_available_task(
-    api_key: str = API_KEY,
-    social_network: SocialNetwork | None = None,
-) -> ExtractionTaskResponse:
-    get_task = """
-        UPDATE v1.extraction_task
-        SET status = 'ACQUIRED', visible_at = NOW() + INTERVAL '240 minutes'
-        WHERE uid = (
-            SELECT uid
-            FROM v1.extraction_task
-            WHERE status = 'AVAILABLE'
-            AND ($1::text IS NULL OR social_network = $1::text)
-            ORDER BY
-                -- Make extract-post-details higher priority
-                case type when 'extract-post-details' then 0 else 1 end ASC,
-                created_at ASC
-            LIMIT 1
-        )
-        RETURNING uid
-            , social_network
-            , type
-            , config
-            , visible_at
-        ;
-    """
+MAX_ACQUIRE_BATCH_SIZE = 100
+MAX_ACQUIRE_WAIT_SECONDS = 60
+
+# Priority of tasks registered without one: extract-post-details go first
+_DEFAULT_TASK_PRIORITIES = {ExtractionTaskType.EXTRACT_POST_DETAILS: 1}
+
+# Refreshes of already extracted posts go after the extraction of new content
+POST_REFRESH_TASK_PRIORITY = -1
+
+# Candidates locked per requested task: some may be dropped by the per account cap
+ACQUIRE_CANDIDATES_PER_TASK = 4
+
+ACQUIRE_TASKS_QUERY = """
+    WITH acquired AS MATERIALIZED (
+        -- Live leases per account
+        SELECT social_network, account_id, COUNT(*) AS acquired_count
+        FROM v1.extraction_task
+        WHERE status = 'ACQUIRED'
+            AND visible_at > NOW()
+            {social_network_filter}
+        GROUP BY social_network, account_id
+    ), candidate AS (
+        SELECT task.uid
+            , task.social_network
+            , task.account_id
+            , task.priority
+            , task.fair_rank
+            , task.created_at
+        FROM v1.extraction_task AS task
+        WHERE task.status = 'AVAILABLE'
+            {social_network_filter}
+            AND NOT EXISTS (
+                SELECT FROM acquired
+                WHERE acquired.social_network = task.social_network
+                    AND acquired.account_id = task.account_id
+                    AND acquired.acquired_count >= $3
+            )
+        ORDER BY
+            -- Higher priority first, then round-robin across registrations and accounts
+            -- (see register_tasks). Keep in sync with extraction_task_available_idx and
+            -- extraction_task_available_any_network_idx
+            task.priority DESC,
+            task.fair_rank ASC,
+            task.created_at ASC
+        LIMIT $1 * {candidates_per_task}
+        -- Skip rows being leased by a concurrent acquire instead of waiting on them
+        FOR UPDATE SKIP LOCKED
+    ), capped AS (
+        -- At most $3 live leases per account, counting the tasks acquired together
+        SELECT ranked.uid
+        FROM (
+            SELECT candidate.*
+                , COALESCE(acquired.acquired_count, 0) + ROW_NUMBER() OVER (
+                    PARTITION BY candidate.social_network, candidate.account_id
+                    ORDER BY candidate.priority DESC, candidate.fair_rank, candidate.created_at
+                ) AS account_slot
+            FROM candidate
+                LEFT JOIN acquired
+                    ON acquired.social_network = candidate.social_network
+                    AND acquired.account_id = candidate.account_id
+        ) AS ranked
+        WHERE ranked.account_slot <= $3
+        ORDER BY ranked.priority DESC, ranked.fair_rank ASC, ranked.created_at ASC
+        LIMIT $1
+    )
+    UPDATE v1.extraction_task AS task
+    SET status = 'ACQUIRED'
+        , visible_at = NOW() + make_interval(secs => $2)
+        , lease_token = uuid_generate_v4()
+    FROM capped
+    WHERE task.uid = capped.uid
+    RETURNING task.uid
+        , task.social_network
+        , task.type
+        , task.config
+        , task.visible_at
+        , task.lease_token
+    ;
+"""
+
+
+async def _acquire_tasks(
+    social_network: SocialNetwork | None,
+    count: int,
+) -> list[ExtractionTaskResponse]:
+    # The social network filter is only added when set (instead of `$3 IS NULL OR ...`)
+    # so that the prepared statement can always walk extraction_task_available_idx.
+    params: list = [
+        count,
+        settings.extraction_task_lease_seconds,
+        settings.extraction_task_max_acquired_per_account,
+    ]
+    social_network_filter = ""
+    if social_network:
+        social_network_filter = "AND social_network = $4"
+        params.append(social_network.value)
 
     async with pool.PGPool.get_connection() as conn:
         try:
-            row = await conn.fetchrow(get_task, social_network.value if social_network else None)
-
-            if row:
-                return ExtractionTaskResponse(
-                    task_uid=row[0],
-                    social_network=row[1],
-                    type=row[2],
-                    task_config=json.loads(row[3]),
-                    visible_at=row[4],
-                )
-            return ExtractionTaskResponse(error="no-task-available")
+            rows = await conn.fetch(
+                ACQUIRE_TASKS_QUERY.format(
+                    social_network_filter=social_network_filter,
+                    candidates_per_task=ACQUIRE_CANDIDATES_PER_TASK,
+                ),
+                *params,
+            )
         except Exception:
             LOGGER.exception("Error getting task")
             raise
 
+    return [
+        ExtractionTaskResponse(
+            task_uid=row[0],
+            social_network=row[1],
+            type=row[2],
+            task_config=json.loads(row[3]),
+            visible_at=row[4],
+            lease_token=row[5],
+        )
+        for row in rows
+    ]
+
+
+async def _acquire_tasks_or_wait(
+    social_network: SocialNetwork | None,
+    count: int,
+    wait_seconds: float,
+) -> list[ExtractionTaskResponse]:
+    """Acquire tasks, waiting up to `wait_seconds` for some to become available if none are.
+
+    No pool connection is held while waiting: the wait is woken up by TaskAvailableListener.
+    """
+    deadline = time.monotonic() + wait_seconds
+    # Subscribe before acquiring so that tasks made available in between wake us up
+    subscription = TaskAvailableListener.subscribe(social_network)
+    woken = False
+    try:
+        while True:
+            tasks = await _acquire_tasks(social_network, count)
+            remaining_seconds = deadline - time.monotonic()
+            if tasks or remaining_seconds <= 0:
+                break
+            try:
+                async with asyncio.timeout(remaining_seconds):
+                    await subscription
+            except TimeoutError:
+                # One last attempt in case a notification was missed
+                tasks = await _acquire_tasks(social_network, count)
+                break
+            woken = True
+            subscription = TaskAvailableListener.subscribe(social_network)
+    finally:
+        TaskAvailableListener.unsubscribe(social_network, subscription)
+
+    # Only one waiter is woken up per notification: pass the wake-up on when tasks may be left,
+    # after a full batch or when woken up while acquiring (for tasks maybe made available after)
+    woken_while_acquiring = subscription.done() and not subscription.cancelled()
+    if tasks and ((woken and len(tasks) == count) or woken_while_acquiring):
+        TaskAvailableListener.wake_next(social_network or tasks[-1].social_network or "")
+    return tasks
+
+
+async def acquire_available_task(
+    api_key: str = API_KEY,
+    social_network: SocialNetwork | None = None,
+    wait_seconds: Annotated[float, fastapi.Query(ge=0, le=MAX_ACQUIRE_WAIT_SECONDS)] = 0,
+) -> ExtractionTaskResponse:
+    """Acquire an available task.
+
+    With `wait_seconds`, if no task is available the request is held (long polling)
+    until one becomes available or the wait times out.
+    """
+    tasks = await _acquire_tasks_or_wait(social_network, 1, wait_seconds)
+    if tasks:
+        return tasks[0]
+    return ExtractionTaskResponse(error="no-task-available")
+
+
+async def acquire_available_tasks(
+    api_key: str = API_KEY,
+    social_network: SocialNetwork | None = None,
+    count: Annotated[int, fastapi.Query(ge=1, le=MAX_ACQUIRE_BATCH_SIZE)] = 1,
+    wait_seconds: Annotated[float, fastapi.Query(ge=0, le=MAX_ACQUIRE_WAIT_SECONDS)] = 0,
+) -> list[ExtractionTaskResponse]:
+    """Acquire up to `count` available tasks in a single statement.
+
+    Rows locked by a concurrent acquire are skipped rather than waited on, so
+    several workers can lease batches at the same time without contending on,
+    or double-leasing, the same tasks. An empty list means no task is available.
+
+    With `wait_seconds`, if no task is available the request is held (long polling)
+    until some become available or the wait times out.
+    """
+    return await _acquire_tasks_or_wait(social_network, count, wait_seconds)
+
 
 async def mark_completed(
     task_uid: uuid.UUID,
     api_key: str = API_KEY,
+    lease_token: uuid.UUID | None = None,
 ) -> fastapi.Response:
+    """Mark an acquired task as COMPLETED.
+
+    Responds with 409 if the task is no longer acquired, its lease has expired or,
+    when `lease_token` is set, it was acquired again since.
+    """
     update_task = """
         UPDATE v1.extraction_task
         SET status = 'COMPLETED'
             , visible_at = NULL
+            , finished_at = NOW()
         WHERE uid = $1
             AND visible_at > NOW()
             AND status = 'ACQUIRED'
+            AND ($2::uuid IS NULL OR lease_token = $2)
         ;
     """
 
     async with pool.PGPool.get_connection() as conn:
         try:
-            await conn.execute(update_task, task_uid)
-            return fastapi.Response(status_code=HTTPStatus.NO_CONTENT)
-
+            result = await conn.execute(update_task, task_uid, lease_token)
         except Exception:
             message = f"Error updating task {task_uid}"
             LOGGER.exception(message)
             raise
 
+    _raise_if_lease_lost(result)
+    return fastapi.Response(status_code=HTTPStatus.NO_CONTENT)
+
 
 async def mark_failed(
     task_uid: uuid.UUID,
     payload: MarkTaskFailedPayload,
     api_key: str = API_KEY,
+    lease_token: uuid.UUID | None = None,
 ) -> fastapi.Response:
+    """Mark an acquired task as FAILED.
+
+    Responds with 409 if the task is no longer acquired, its lease has expired or,
+    when `lease_token` is set, it was acquired again since.
+    """
     update_task = """
         UPDATE v1.extraction_task
         SET status = 'FAILED'
             , visible_at = NULL
+            , finished_at = NOW()
             , error = $2
         WHERE uid = $1
             AND visible_at > NOW()
             AND status = 'ACQUIRED'
+            AND ($3::uuid IS NULL OR lease_token = $3)
         ;
     """
 
     async with pool.PGPool.get_connection() as conn:
         try:
-            await conn.execute(update_task, task_uid, payload.error)
-            return fastapi.Response(status_code=HTTPStatus.NO_CONTENT)
-
+            result = await conn.execute(update_task, task_uid, payload.error, lease_token)
         except Exception:
             message = f"Error updating task {task_uid}"
             LOGGER.exception(message)
             raise
 
+    _raise_if_lease_lost(result)
+    return fastapi.Response(status_code=HTTPStatus.NO_CONTENT)
+
+
+def _raise_if_lease_lost(update_status: str) -> None:
+    """Respond with 409 if an update of an acquired task matched no row."""
+    if update_status == "UPDATE 0":
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail="Task is not acquired or its lease has expired",
+        )
+
+
+async def mark_tasks_completed(
+    payload: MarkTasksCompletedPayload,
+    api_key: str = API_KEY,
+) -> MarkTasksResponse:
+    """Mark a batch of acquired tasks as COMPLETED in a single statement.
+
+    Each task is only updated if it is still acquired, its lease has not expired and,
+    when its `lease_token` is set, it was not acquired again since. The response
+    reports for each task uid whether it was updated.
+    """
+    update_tasks = """
+        WITH input AS (
+            SELECT DISTINCT ON (uid) uid, lease_token
+            FROM unnest($1::uuid[], $2::uuid[]) AS input(uid, lease_token)
+        ), updated AS (
+            UPDATE v1.extraction_task AS task
+            SET status = 'COMPLETED'
+                , visible_at = NULL
+                , finished_at = NOW()
+            FROM input
+            WHERE task.uid = input.uid
+                AND task.visible_at > NOW()
+                AND task.status = 'ACQUIRED'
+                AND (input.lease_token IS NULL OR task.lease_token = input.lease_token)
+            RETURNING task.uid
+        )
+        SELECT input.uid
+            , updated.uid IS NOT NULL AS updated
+        FROM input
+        LEFT JOIN updated ON updated.uid = input.uid
+        ;
+    """
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            rows = await conn.fetch(
+                update_tasks,
+                [task.task_uid for task in payload.tasks],
+                [task.lease_token for task in payload.tasks],
+            )
+        except Exception:
+            LOGGER.exception("Error marking %s tasks completed", len(payload.tasks))
+            raise
+
+    return _to_mark_tasks_response(rows)
+
+
+async def mark_tasks_failed(
+    payload: MarkTasksFailedPayload,
+    api_key: str = API_KEY,
+) -> MarkTasksResponse:
+    """Mark a batch of acquired tasks as FAILED, each with its own error, in a single statement.
+
+    Each task is only updated if it is still acquired, its lease has not expired and,
+    when its `lease_token` is set, it was not acquired again since. The response
+    reports for each task uid whether it was updated.
+    """
+    update_tasks = """
+        WITH input AS (
+            SELECT DISTINCT ON (uid) uid, error, lease_token
+            FROM unnest($1::uuid[], $2::text[], $3::uuid[]) AS input(uid, error, lease_token)
+        ), updated AS (
+            UPDATE v1.extraction_task AS task
+            SET status = 'FAILED'
+                , visible_at = NULL
+                , finished_at = NOW()
+                , error = input.error
+            FROM input
+            WHERE task.uid = input.uid
+                AND task.visible_at > NOW()
+                AND task.status = 'ACQUIRED'
+                AND (input.lease_token IS NULL OR task.lease_token = input.lease_token)
+            RETURNING task.uid
+        )
+        SELECT input.uid
+            , updated.uid IS NOT NULL AS updated
+        FROM input
+        LEFT JOIN updated ON updated.uid = input.uid
+        ;
+    """
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            rows = await conn.fetch(
+                update_tasks,
+                [task.task_uid for task in payload.tasks],
+                [task.error for task in payload.tasks],
+                [task.lease_token for task in payload.tasks],
+            )
+        except Exception:
+            LOGGER.exception("Error marking %s tasks failed", len(payload.tasks))
+            raise
+
+    return _to_mark_tasks_response(rows)
+
+
+async def release_tasks(
+    payload: ReleaseTasksPayload,
+    api_key: str = API_KEY,
+) -> MarkTasksResponse:
+    """Release a batch of acquired tasks back to AVAILABLE in a single statement.
+
+    Used by workers to give back the leases of tasks they will not execute or finish
+    (e.g. on shutdown) instead of letting them expire. Each task is only released if
+    it is still acquired, its lease has not expired and, when its `lease_token` is
+    set, it was not acquired again since. The response reports for each task uid
+    whether it was released.
+    """
+    update_tasks = """
+        WITH input AS (
+            SELECT DISTINCT ON (uid) uid, lease_token
+            FROM unnest($1::uuid[], $2::uuid[]) AS input(uid, lease_token)
+        ), updated AS (
+            UPDATE v1.extraction_task AS task
+            SET status = 'AVAILABLE'
+                , visible_at = NULL
+            FROM input
+            WHERE task.uid = input.uid
+                AND task.visible_at > NOW()
+                AND task.status = 'ACQUIRED'
+                AND (input.lease_token IS NULL OR task.lease_token = input.lease_token)
+            RETURNING task.uid
+        )
+        SELECT input.uid
+            , updated.uid IS NOT NULL AS updated
+        FROM input
+        LEFT JOIN updated ON updated.uid = input.uid
+        ;
+    """
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            rows = await conn.fetch(
+                update_tasks,
+                [task.task_uid for task in payload.tasks],
+                [task.lease_token for task in payload.tasks],
+            )
+        except Exception:
+            LOGGER.exception("Error releasing %s tasks", len(payload.tasks))
+            raise
+
+    return _to_mark_tasks_response(rows)
+
+
+def _to_mark_tasks_response(rows: list) -> MarkTasksResponse:
+    results = [TaskMarkResult(task_uid=row["uid"], updated=row["updated"]) for row in rows]
+    return MarkTasksResponse(
+        updated_count=sum(1 for result in results if result.updated),
+        results=results,
+    )
+
 
 async def recycle_failed_tasks(
     api_key: str = API_KEY,
@@ -138,6 +483,7 @@ async def recycle_failed_tasks(
         SET status = 'AVAILABLE'
             , visible_at = NULL
             , error = NULL
+            , finished_at = NULL
         WHERE status = 'FAILED'
         RETURNING uid
     """
@@ -160,7 +506,14 @@ async def recycle_expired_tasks(
     (meaning the acquisition time has expired) and updates them to 'AVAILABLE' status,
     making them available for acquisition again. The visible_at is set to NULL so they
     become immediately available.
+
+    The same recycling also runs periodically in the background (see lease_reaper).
     """
+    return RecycleExpiredTasksResponse(recycled_count=await recycle_expired_leases())
+
+
+async def recycle_expired_leases() -> int:
+    """Put back ACQUIRED tasks whose lease has expired to AVAILABLE, return their count."""
     recycle_tasks = """
         UPDATE v1.extraction_task
         SET status = 'AVAILABLE'
@@ -173,80 +526,389 @@ async def recycle_expired_tasks(
     async with pool.PGPool.get_connection() as conn:
         try:
             rows = await conn.fetch(recycle_tasks)
-            return RecycleExpiredTasksResponse(recycled_count=len(rows))
+            return len(rows)
         except Exception:
             LOGGER.exception("Error recycling expired tasks")
             raise
 
 
+async def archive_finished_tasks() -> int:
+    """Move a batch of finished tasks to the archive table, return their count.
+
+    COMPLETED tasks are archived `extraction_task_archive_completed_after_seconds`
+    after they finished, FAILED tasks after `extraction_task_archive_failed_after_seconds`
+    (until then, they can be recycled).
+    """
+    archive_tasks = """
+        WITH finished AS (
+            SELECT uid
+            FROM v1.extraction_task
+            WHERE status IN ('COMPLETED', 'FAILED')
+                AND finished_at < NOW() - make_interval(secs => LEAST($1::float8, $2::float8))
+                AND (
+                    (status = 'COMPLETED' AND finished_at < NOW() - make_interval(secs => $1))
+                    OR (status = 'FAILED' AND finished_at < NOW() - make_interval(secs => $2))
+                )
+            LIMIT $3
+            FOR UPDATE SKIP LOCKED
+        ), archived AS (
+            DELETE FROM v1.extraction_task AS task
+            USING finished
+            WHERE task.uid = finished.uid
+            RETURNING task.*
+        ), inserted AS (
+            INSERT INTO v1.extraction_task_archive (
+                uid
+                , created_at
+                , finished_at
+                , type
+                , config
+                , account_id
+                , post_id
+                , social_network
+                , status
+                , error
+                , priority
+            )
+            SELECT uid
+                , created_at
+                , finished_at
+                , type
+                , config
+                , account_id
+                , post_id
+                , social_network
+                , status
+                , error
+                , priority
+            FROM archived
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM inserted
+    """
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            archived_count: int = await conn.fetchval(
+                archive_tasks,
+                settings.extraction_task_archive_completed_after_seconds,
+                settings.extraction_task_archive_failed_after_seconds,
+                settings.extraction_task_archive_batch_size,
+            )
+        except Exception:
+            LOGGER.exception("Error archiving finished tasks")
+            raise
+    return archived_count
+
+
+async def extend_task_lease(
+    task_uid: uuid.UUID,
+    api_key: str = API_KEY,
+    lease_token: uuid.UUID | None = None,
+) -> ExtendTaskLeaseResponse:
+    """Extend the lease of an acquired task.
+
+    Workers call this periodically while executing a task so that leases can stay short:
+    the lease of a task whose worker died expires quickly and the task is recycled.
+    Responds with 409 if the task is no longer acquired, its lease has already expired
+    or, when `lease_token` is set, it was acquired again since.
+
+    With `lease_token`, an expired lease is extended as long as the task was neither
+    recycled nor acquired again since: e.g. a worker restarted with the results it had
+    not uploaded yet gets its tasks back.
+    """
+    extend_lease = """
+        UPDATE v1.extraction_task
+        SET visible_at = NOW() + make_interval(secs => $2)
+        WHERE uid = $1
+            AND status = 'ACQUIRED'
+            -- Each acquire renews the lease token: a matching token proves the task was
+            -- not acquired again
+            AND (visible_at > NOW() OR $3::uuid IS NOT NULL)
+            AND ($3::uuid IS NULL OR lease_token = $3)
+        RETURNING visible_at
+        ;
+    """
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            visible_at = await conn.fetchval(
+                extend_lease, task_uid, settings.extraction_task_lease_seconds, lease_token
+            )
+        except Exception:
+            message = f"Error extending task {task_uid} lease"
+            LOGGER.exception(message)
+            raise
+
+    if visible_at is None:
+        raise fastapi.HTTPException(
+            status_code=HTTPStatus.CONFLICT,
+            detail="Task is not acquired or its lease has expired",
+        )
+    return ExtendTaskLeaseResponse(task_uid=task_uid, visible_at=visible_at)
+
+
 async def register_tasks(
     extraction_tasks: list[ExtractionTask],
     api_key: str = API_KEY,
-) -> list[ExtractionTask]:
+) -> RegisterTasksResponse:
+    """Register tasks, skipping the ones already registered and not completed yet.
+
+    Tasks are identified by their social network, type and config. Tasks are copied
+    (COPY) to a temporary table, then inserted with a single statement.
+
+    Tasks get fair ranks (acquisition order within a priority) starting at the rank of
+    the next task of their priority to be acquired, alternating between accounts: they
+    are acquired in turn with the tasks registered before, and a large registration
+    does not starve the ones made after it.
+    """
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            async with conn.transaction():
+                inserted_count = len(await _insert_tasks(conn, extraction_tasks))
+        except Exception:
+            LOGGER.exception("Error inserting tasks")
+            raise
+
+    return RegisterTasksResponse(
+        inserted_count=inserted_count,
+        existing_count=len(extraction_tasks) - inserted_count,
+    )
+
+
+async def _insert_tasks(
+    conn: asyncpg.Connection, extraction_tasks: list[ExtractionTask]
+) -> list[asyncpg.Record]:
+    """Insert tasks as described by register_tasks, return the inserted tasks.
+
+    The social network and config of the inserted tasks are returned.
+
+    Must be called in a transaction.
+    """
+    create_input_table = """
+        CREATE TEMPORARY TABLE extraction_task_input (
+            position BIGINT GENERATED ALWAYS AS IDENTITY
+            , social_network TEXT NOT NULL
+            , type TEXT NOT NULL
+            , config JSONB NOT NULL
+            , priority SMALLINT NOT NULL
+        ) ON COMMIT DROP
+    """
+
     register_tasks = """
-        INSERT INTO v1.extraction_task (
-            social_network
-            , type
-            , config
-            , status
-        )
-        (
+        WITH queue_head AS (
+            -- Ranks are only compared between tasks of the same priority
+            SELECT queue.social_network
+                , queue.priority
+                , COALESCE(
+                    (
+                        -- Keep in sync with ACQUIRE_TASKS_QUERY
+                        SELECT task.fair_rank
+                        FROM v1.extraction_task AS task
+                        WHERE task.status = 'AVAILABLE'
+                            AND task.social_network = queue.social_network
+                            AND task.priority = queue.priority
+                        ORDER BY task.fair_rank ASC, task.created_at ASC
+                        LIMIT 1
+                    ),
+                    0
+                ) AS fair_rank
+            FROM (
+                SELECT DISTINCT social_network, priority FROM extraction_task_input
+            ) AS queue
+        ), input_by_account AS (
+            SELECT input.*
+                , ROW_NUMBER() OVER (
+                    PARTITION BY input.social_network, input.priority, input.config->>'account_id'
+                    ORDER BY input.position
+                ) AS account_position
+            FROM extraction_task_input AS input
+        ), inserted AS (
+            INSERT INTO v1.extraction_task (
+                social_network
+                , type
+                , config
+                , status
+                , priority
+                , fair_rank
+            )
             SELECT input.social_network
                 , input.type
                 , input.config
-                , input.status
-            FROM unnest($1::"v1"."extraction_task"[]) AS input
+                , $1
+                , input.priority
+                , queue_head.fair_rank + ROW_NUMBER() OVER (
+                    PARTITION BY input.social_network, input.priority
+                    ORDER BY input.account_position, input.position
+                )
+            FROM input_by_account AS input
+                JOIN queue_head USING (social_network, priority)
+            -- Keep in sync with extraction_task_open_unique_idx
+            ON CONFLICT (social_network, type, config) WHERE status <> 'COMPLETED'
+            DO NOTHING
+            RETURNING social_network, config
         )
-        RETURNING
-            uid
-            , created_at
-            , type
-            , config
-            , social_network
-            , status
-            , visible_at
-            , error
+        SELECT social_network, config FROM inserted
     """
 
-    task_list = [
+    records = [
         (
-            None,
-            None,
+            task.social_network,
             task.type,
             task.task_config.model_dump_json(),
-            task.social_network,
-            ExtractionTaskStatus.AVAILABLE,
-            None,
-            None,
+            _DEFAULT_TASK_PRIORITIES.get(task.type, 0) if task.priority is None else task.priority,
         )
         for task in extraction_tasks
     ]
 
+    await conn.execute(create_input_table)
+    await conn.copy_records_to_table(
+        "extraction_task_input",
+        records=records,
+        columns=("social_network", "type", "config", "priority"),
+    )
+    return await conn.fetch(register_tasks, ExtractionTaskStatus.AVAILABLE)
+
+
+async def schedule_post_refreshes() -> tuple[int, int, int]:
+    """Register extract-post-details tasks for the posts due for a refresh.
+
+    Posts are refreshed less often as they get older: the next refresh of a post is
+    planned after its age times `post_refresh_age_factor`, bounded by
+    `post_refresh_min_interval_seconds` and `post_refresh_max_interval_seconds`.
+    Posts not planned yet are planned from their last extraction. The ones whose
+    refresh is overdue already (e.g. posts extracted before the scheduler was
+    deployed) are planned at a random date within their refresh interval instead,
+    not all due at once.
+
+    Posts with a task not completed yet are skipped until it is. The next refresh of a
+    post is planned once its task is registered: a post whose task could not be
+    registered (e.g. registered concurrently) stays due.
+
+    Returns:
+        The number of posts planned and of posts due (each at most
+        `post_refresh_batch_size`), and the number of tasks registered for them.
+
+    """
+    # Keep the refresh interval expressions in sync
+    plan_new_posts = """
+        UPDATE v1.post AS post
+        SET next_refresh_at = GREATEST(
+            post.post_extracted_at + LEAST(
+                GREATEST(
+                    (post.post_extracted_at - post.published_at) * $1,
+                    make_interval(secs => $2)
+                ),
+                make_interval(secs => $3)
+            ),
+            NOW() + random() * LEAST(
+                GREATEST((NOW() - post.published_at) * $1, make_interval(secs => $2)),
+                make_interval(secs => $3)
+            )
+        )
+        FROM (
+            SELECT social_network, post_id
+            FROM v1.post
+            WHERE next_refresh_at IS NULL
+            LIMIT $4
+            FOR UPDATE SKIP LOCKED
+        ) AS new_post
+        WHERE post.social_network = new_post.social_network
+            AND post.post_id = new_post.post_id
+    """
+    claim_due_posts = """
+        SELECT post.social_network
+            , post.account_id
+            , post.post_id
+        FROM v1.post AS post
+        WHERE post.next_refresh_at <= NOW()
+            -- Keep in sync with extraction_task_open_unique_idx
+            AND NOT EXISTS (
+                SELECT FROM v1.extraction_task AS task
+                WHERE task.social_network = post.social_network
+                    AND task.type = 'extract-post-details'
+                    AND task.config = jsonb_build_object(
+                        'account_id', post.account_id,
+                        'post_id', post.post_id
+                    )
+                    AND task.status <> 'COMPLETED'
+            )
+        ORDER BY post.next_refresh_at
+        LIMIT $1
+        FOR UPDATE OF post SKIP LOCKED
+    """
+    plan_refreshed_posts = """
+        UPDATE v1.post AS post
+        SET next_refresh_at = NOW() + LEAST(
+            GREATEST((NOW() - post.published_at) * $1, make_interval(secs => $2)),
+            make_interval(secs => $3)
+        )
+        FROM unnest($4::text[], $5::text[]) AS refreshed(social_network, post_id)
+        WHERE post.social_network = refreshed.social_network
+            AND post.post_id = refreshed.post_id
+    """
+
+    interval_params = (
+        settings.post_refresh_age_factor,
+        settings.post_refresh_min_interval_seconds,
+        settings.post_refresh_max_interval_seconds,
+    )
     async with pool.PGPool.get_connection() as conn:
         try:
-            rows = await conn.fetch(register_tasks, task_list)
-            return [
-                ExtractionTask(
-                    uid=row[0],
-                    type=row[2],
-                    task_config=json.loads(row[3]),
-                    social_network=row[4],
-                    status=row[5],
-                    visible_at=row[6],
-                    error=row[7],
+            async with conn.transaction():
+                planned_status = await conn.execute(
+                    plan_new_posts, *interval_params, settings.post_refresh_batch_size
+                )
+                due_posts = await conn.fetch(claim_due_posts, settings.post_refresh_batch_size)
+                inserted_tasks = await _insert_tasks(
+                    conn,
+                    [
+                        ExtractionTask(
+                            social_network=post["social_network"],
+                            type=ExtractionTaskType.EXTRACT_POST_DETAILS,
+                            task_config={
+                                "account_id": post["account_id"],
+                                "post_id": post["post_id"],
+                            },
+                            priority=POST_REFRESH_TASK_PRIORITY,
+                        )
+                        for post in due_posts
+                    ],
+                )
+                await conn.execute(
+                    plan_refreshed_posts,
+                    *interval_params,
+                    [task["social_network"] for task in inserted_tasks],
+                    [json.loads(task["config"])["post_id"] for task in inserted_tasks],
                 )
-                for row in rows
-            ]
         except Exception:
-            LOGGER.exception("Error inserting tasks")
+            LOGGER.exception("Error scheduling post refreshes")
             raise
 
+    # Command status of the UPDATE: "UPDATE <count>"
+    planned_count = int(planned_status.split()[-1])
+    return planned_count, len(due_posts), len(inserted_tasks)
+
+
+# GROUPING(type, social_network, extended_status) values for each grouping set
+_GROUPED_BY_ALL = 0b000
+_GROUPED_BY_STATUS = 0b110
+_GROUPED_BY_TYPE = 0b011
+_GROUPED_BY_NETWORK = 0b101
+
+_STATS_CACHE: TTLCache[
+    tuple[SocialNetwork | None, str | None, ExtractionTaskType | None, bool],
+    ExtractionTaskStatsResponse,
+] = TTLCache(ttl_seconds=settings.extraction_task_stats_cache_ttl_seconds, max_size=1000)
+
 
 async def get_extraction_task_stats(
     api_key: str = API_KEY,
     social_network: SocialNetwork | None = None,
     account_id: str | None = None,
     task_type: ExtractionTaskType | None = None,
+    *,
+    include_archive: bool = False,
 ) -> ExtractionTaskStatsResponse:
     """Get statistics on extraction tasks.
 
@@ -260,7 +922,18 @@ async def get_extraction_task_stats(
 
     Detailed stats include:
     - Counts for each combination of task type, network, and extended status
+
+    Archived tasks (finished tasks moved out of the queue table) are only counted
+    with `include_archive`, which scans the whole archive.
+
+    Responses are cached per filter combination for a few seconds
+    (see EXTRACTION_TASK_STATS_CACHE_TTL_SECONDS).
     """
+    cache_key = (social_network, account_id, task_type, include_archive)
+    cached_stats = _STATS_CACHE.get(cache_key)
+    if cached_stats is not None:
+        return cached_stats
+
     # Build the WHERE clause for filters
     where_clauses = []
     params = []
@@ -272,7 +945,7 @@ async def get_extraction_task_stats(
         param_index += 1
 
     if account_id:
-        where_clauses.append(f"config->>'account_id' = ${param_index}")
+        where_clauses.append(f"account_id = ${param_index}")
         params.append(account_id)
         param_index += 1
 
@@ -283,93 +956,94 @@ async def get_extraction_task_stats(
 
     where_clause = " AND ".join(where_clauses) if where_clauses else "TRUE"
 
-    # Query for global stats - count per extended status
-    status_query = f"""
-        SELECT
-            CASE
-                WHEN status = 'ACQUIRED' AND visible_at > NOW() THEN 'ACQUIRED_VALID'
-                WHEN status = 'ACQUIRED' AND visible_at <= NOW() THEN 'ACQUIRED_EXPIRED'
-                ELSE status
-            END AS extended_status,
-            COUNT(*) AS count
-        FROM v1.extraction_task
-        WHERE {where_clause}
-        GROUP BY extended_status
-        ORDER BY extended_status
-    """  # noqa: S608
-
-    # Query for global stats - count per task type
-    type_query = f"""
-        SELECT type, COUNT(*) AS count
-        FROM v1.extraction_task
-        WHERE {where_clause}
-        GROUP BY type
-        ORDER BY type
-    """  # noqa: S608 - where_clause is safe
-
-    # Query for global stats - count per network
-    network_query = f"""
-        SELECT social_network, COUNT(*) AS count
-        FROM v1.extraction_task
-        WHERE {where_clause}
-        GROUP BY social_network
-        ORDER BY social_network
-    """  # noqa: S608 - where_clause is safe
+    archive_union = (
+        f"""
+            UNION ALL
+            SELECT type, social_network, status, NULL
+            FROM v1.extraction_task_archive
+            WHERE {where_clause}
+        """  # noqa: S608 - where_clause is safe
+        if include_archive
+        else ""
+    )
 
-    # Query for detailed stats - count per combination of type, network, and extended status
-    detailed_query = f"""
+    # Single scan computing, through grouping sets, the count per extended status,
+    # per task type, per network and per combination of the three.
+    # GROUPING() returns a bitmask of the columns aggregated away in each row:
+    # (type, social_network, extended_status).
+    stats_query = f"""
         SELECT
+            GROUPING(type, social_network, extended_status) AS grouping,
             type,
             social_network,
-            CASE
-                WHEN status = 'ACQUIRED' AND visible_at > NOW() THEN 'ACQUIRED_VALID'
-                WHEN status = 'ACQUIRED' AND visible_at <= NOW() THEN 'ACQUIRED_EXPIRED'
-                ELSE status
-            END AS extended_status,
+            extended_status,
             COUNT(*) AS count
-        FROM v1.extraction_task
-        WHERE {where_clause}
-        GROUP BY type, social_network, extended_status
+        FROM (
+            SELECT
+                type,
+                social_network,
+                CASE
+                    WHEN status = 'ACQUIRED' AND visible_at > NOW() THEN 'ACQUIRED_VALID'
+                    WHEN status = 'ACQUIRED' AND visible_at <= NOW() THEN 'ACQUIRED_EXPIRED'
+                    ELSE status
+                END AS extended_status
+            FROM (
+                SELECT type, social_network, status, visible_at
+                FROM v1.extraction_task
+                WHERE {where_clause}
+                {archive_union}
+            ) AS all_task
+        ) AS task
+        GROUP BY GROUPING SETS (
+            (type, social_network, extended_status),
+            (extended_status),
+            (type),
+            (social_network)
+        )
         ORDER BY type, social_network, extended_status
-    """  # noqa: S608 - where_clause is safe
+    """  # noqa: S608 - where_clause and archive_union are safe
 
     async with pool.PGPool.get_connection() as conn:
         try:
-            # Execute all queries
-            status_rows = await conn.fetch(status_query, *params)
-            type_rows = await conn.fetch(type_query, *params)
-            network_rows = await conn.fetch(network_query, *params)
-            detailed_rows = await conn.fetch(detailed_query, *params)
-
-            # Build global stats
-            global_stats = {
-                "status_counts": [
-                    StatusCount(status=row[0], count=row[1]).model_dump() for row in status_rows
-                ],
-                "type_counts": [
-                    TaskTypeCount(type=row[0], count=row[1]).model_dump() for row in type_rows
-                ],
-                "network_counts": [
-                    NetworkCount(social_network=row[0], count=row[1]).model_dump()
-                    for row in network_rows
-                ],
-            }
-
-            # Build detailed stats
-            detailed_stats = [
-                DetailedStats(
-                    type=row[0],
-                    social_network=row[1],
-                    status=row[2],
-                    count=row[3],
-                )
-                for row in detailed_rows
-            ]
-
-            return ExtractionTaskStatsResponse(
-                global_stats=global_stats,
-                detailed_stats=detailed_stats,
-            )
+            rows = await conn.fetch(stats_query, *params)
         except Exception:
             LOGGER.exception("Error getting extraction task stats")
             raise
+
+    # Build global stats
+    global_stats = {
+        "status_counts": [
+            StatusCount(status=row["extended_status"], count=row["count"]).model_dump()
+            for row in rows
+            if row["grouping"] == _GROUPED_BY_STATUS
+        ],
+        "type_counts": [
+            TaskTypeCount(type=row["type"], count=row["count"]).model_dump()
+            for row in rows
+            if row["grouping"] == _GROUPED_BY_TYPE
+        ],
+        "network_counts": [
+            NetworkCount(social_network=row["social_network"], count=row["count"]).model_dump()
+            for row in rows
+            if row["grouping"] == _GROUPED_BY_NETWORK
+        ],
+    }
+
+    # Build detailed stats
+    detailed_stats = [
+        DetailedStats(
+            type=row["type"],
+            social_network=row["social_network"],
+            status=row["extended_status"],
+            count=row["count"],
+        )
+        for row in rows
+        if row["grouping"] == _GROUPED_BY_ALL
+    ]
+
+    stats = ExtractionTaskStatsResponse(
+        global_stats=global_stats,
+        detailed_stats=detailed_stats,
+    )
+    _STATS_CACHE.set(cache_key, stats)
+    return stats
@@ -1,75 +1,496 @@
-import http
+import asyncio
+import datetime as dt
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from http import HTTPStatus
 
-from fastapi import Depends, Response
+import asyncpg
+import httpx
+import pydantic
+from fastapi import Depends, HTTPException, Request
 
 from app._auth import validate_api_key
 from app._config import settings
-from app.models import Account, Post
-from app.nocodb import MissingTargetBehavior, NocoDBClient
+from app.db import pool
+from app.models import Account, Post, UpsertResultsResponse
+from app.nocodb import (
+    MissingTargetBehavior,
+    NocoDBClient,
+    TargetRecordNotFoundError,
+    UpsertItem,
+)
 
+LOGGER = logging.getLogger(__name__)
 API_KEY = Depends(validate_api_key)
 
+# Bounds the memory used by a line of /posts/stream
+MAX_NDJSON_LINE_BYTES = 1_000_000
 
-async def upsert_posts(posts: list[Post], api_key: str = API_KEY) -> Response:
-    client = NocoDBClient()
-    for post in posts:
-        client.upsert_record(
-            settings.nocodb_post_table,
-            {
-                "Account": {
-                    "target_table": settings.nocodb_account_table,
-                    "lookup": {
-                        "Social Network": post.social_network,
-                        "Account Id": post.account_id,
-                    },
-                },
-            },
-            {"Post Id": post.post_id},
-            {
-                "Social Network": post.social_network,
-                "Post Id": post.post_id,
-                "Post Url": post.post_url,
-                "Published At": post.published_at.isoformat(),
-                "Title": post.title,
-                "Description": post.description,
-                "Comment Count": post.comment_count,
-                "View Count": post.view_count,
-                "Repost Count": post.repost_count,
-                "Like Count": post.like_count,
-                "Share Count": post.share_count,
-                "Categories": post.categories,
-                "Tags": post.tags,
-                "SN Has Paid Placement": post.sn_has_paid_placement,
-                "SN Brand": post.sn_brand,
-                "Post Type": post.post_type,
-            },
-            on_missing_target_record=MissingTargetBehavior.CREATE,
+# Set when results are upserted, wakes up the NocoDB sync of this worker
+RESULTS_CHANGED = asyncio.Event()
+
+_ACCOUNTS_ADAPTER = pydantic.TypeAdapter(list[Account])
+_POSTS_ADAPTER = pydantic.TypeAdapter(list[Post])
+
+ACCOUNT_COLUMNS = tuple(Account.model_fields)
+POST_COLUMNS = tuple(Post.model_fields)
+
+POST_METRICS_SNAPSHOT_COLUMNS = (
+    "social_network",
+    "post_id",
+    "account_id",
+    "extracted_at",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "share_count",
+    "repost_count",
+)
+
+# Months (UTC) whose post_metrics_snapshot partition is known to exist
+_snapshot_partitions: set[dt.datetime] = set()
+
+
+def _upsert_results_query(
+    table: str,
+    key_column: str,
+    extracted_at_column: str,
+    columns: Sequence[str],
+) -> str:
+    """Upsert a JSON array of results, the last one wins if a key is duplicated.
+
+    Items are decoded by jsonb_populate_record with the table row type, so the whole
+    request is upserted with a single statement. Results whose content (everything but
+    their extraction date) is unchanged are skipped: they are not marked for a NocoDB sync.
+    The query returns the number of written rows.
+    """
+    column_list = ", ".join(columns)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}"
+        for column in columns
+        if column not in ("social_network", key_column)
+    )
+    return f"""
+        WITH written AS (
+            INSERT INTO v1.{table} AS stored ({column_list}, content_hash)
+            SELECT DISTINCT ON (result.social_network, result.{key_column})
+                {", ".join(f"result.{column}" for column in columns)}
+                , md5((item.value - '{extracted_at_column}')::text)
+            FROM jsonb_array_elements($1::jsonb) WITH ORDINALITY AS item(value, position)
+                CROSS JOIN jsonb_populate_record(NULL::v1.{table}, item.value) AS result
+            ORDER BY result.social_network, result.{key_column}, item.position DESC
+            ON CONFLICT (social_network, {key_column}) DO UPDATE
+            SET {updates}
+                , content_hash = EXCLUDED.content_hash
+                , updated_at = NOW()
+            WHERE stored.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+            RETURNING 1
+        )
+        SELECT COUNT(*) FROM written
+    """  # noqa: S608 - table and column names are constants
+
+
+UPSERT_ACCOUNTS_QUERY = _upsert_results_query(
+    "account", "account_id", "account_extracted_at", ACCOUNT_COLUMNS
+)
+UPSERT_POSTS_QUERY = _upsert_results_query("post", "post_id", "post_extracted_at", POST_COLUMNS)
+
+
+async def upsert_posts(posts: list[Post], api_key: str = API_KEY) -> UpsertResultsResponse:
+    """Upsert posts, the changed ones are mirrored into NocoDB in the background."""
+    written_count = await _upsert_posts(posts)
+    return UpsertResultsResponse(
+        written_count=written_count, skipped_count=len(posts) - written_count
+    )
+
+
+async def upsert_posts_stream(request: Request, api_key: str = API_KEY) -> UpsertResultsResponse:
+    """Upsert posts sent as NDJSON (one post per line), processed while they are received.
+
+    Posts are upserted in batches of `posts_stream_batch_size` as soon as a batch is
+    complete, so memory does not depend on the request size. Batches are committed
+    independently: on an invalid line, the posts of the previous batches stay upserted.
+    """
+    written_count = 0
+    posts_count = 0
+    batch: list[Post] = []
+    line_number = 0
+    async for line in _iter_lines(request.stream()):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            batch.append(Post.model_validate_json(line))
+        except pydantic.ValidationError as e:
+            raise HTTPException(
+                status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                detail=f"Invalid post on line {line_number}: {e}",
+            ) from e
+        if len(batch) >= settings.posts_stream_batch_size:
+            written_count += await _upsert_posts(batch)
+            posts_count += len(batch)
+            batch = []
+    if batch:
+        written_count += await _upsert_posts(batch)
+        posts_count += len(batch)
+    return UpsertResultsResponse(
+        written_count=written_count, skipped_count=posts_count - written_count
+    )
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        if len(pending) > MAX_NDJSON_LINE_BYTES and b"\n" not in pending:
+            raise HTTPException(
+                status_code=HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Lines are limited to {MAX_NDJSON_LINE_BYTES} bytes",
+            )
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+async def _upsert_posts(posts: list[Post]) -> int:
+    await _create_post_metrics_snapshot_partitions(posts)
+    return await _upsert_results(
+        "post",
+        UPSERT_POSTS_QUERY,
+        _POSTS_ADAPTER.dump_json(posts).decode(),
+        lambda conn: _append_post_metrics_snapshots(conn, posts),
+    )
+
+
+async def upsert_accounts(accounts: list[Account], api_key: str = API_KEY) -> UpsertResultsResponse:
+    """Upsert accounts, the changed ones are mirrored into NocoDB in the background."""
+    written_count = await _upsert_results(
+        "account", UPSERT_ACCOUNTS_QUERY, _ACCOUNTS_ADAPTER.dump_json(accounts).decode()
+    )
+    return UpsertResultsResponse(
+        written_count=written_count, skipped_count=len(accounts) - written_count
+    )
+
+
+async def _upsert_results(
+    table: str,
+    query: str,
+    payload: str,
+    append_snapshots: Callable[[asyncpg.Connection], Awaitable[None]] | None = None,
+) -> int:
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            async with conn.transaction():
+                written_count: int = await conn.fetchval(query, payload)
+                if append_snapshots is not None:
+                    await append_snapshots(conn)
+        except Exception:
+            LOGGER.exception("Error upserting %s results", table)
+            raise
+    if written_count:
+        RESULTS_CHANGED.set()
+    return written_count
+
+
+async def _create_post_metrics_snapshot_partitions(posts: list[Post]) -> None:
+    """Create the missing monthly partitions, before the snapshots are copied.
+
+    Creating a partition locks the whole table: it is done in its own transaction.
+    """
+    months = {
+        post.post_extracted_at.astimezone(dt.UTC).replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        for post in posts
+    }
+    missing_months = sorted(months - _snapshot_partitions)
+    if not missing_months:
+        return
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            await conn.execute(
+                """
+                SELECT v1.create_post_metrics_snapshot_partition(month)
+                FROM unnest($1::timestamptz[]) AS month
+                """,
+                missing_months,
+            )
+        except Exception:
+            LOGGER.exception("Error creating post metrics snapshot partitions")
+            raise
+    _snapshot_partitions.update(missing_months)
+
+
+async def _append_post_metrics_snapshots(conn: asyncpg.Connection, posts: list[Post]) -> None:
+    await conn.copy_records_to_table(
+        "post_metrics_snapshot",
+        schema_name="v1",
+        columns=POST_METRICS_SNAPSHOT_COLUMNS,
+        records=[
+            (
+                post.social_network,
+                post.post_id,
+                post.account_id,
+                post.post_extracted_at,
+                post.view_count,
+                post.like_count,
+                post.comment_count,
+                post.share_count,
+                post.repost_count,
+            )
+            for post in posts
+        ],
+    )
+
+
+async def sync_results_to_nocodb() -> int:
+    """Mirror a batch of changed accounts, then posts, into NocoDB.
+
+    Returns:
+        The number of rows claimed
+
+    """
+    accounts_count = await _sync_results(
+        "account",
+        "account_id",
+        lambda rows: upsert_accounts_to_nocodb(
+            _ACCOUNTS_ADAPTER.validate_python([dict(row) for row in rows])
+        ),
+    )
+    posts_count = await _sync_results(
+        "post",
+        "post_id",
+        lambda rows: upsert_posts_to_nocodb(
+            _POSTS_ADAPTER.validate_python([dict(row) for row in rows])
+        ),
+    )
+    return accounts_count + posts_count
+
+
+async def _sync_results(
+    table: str,
+    key_column: str,
+    push: Callable[[list[asyncpg.Record]], Awaitable[None]],
+) -> int:
+    claim_rows = f"""
+        WITH claimed AS (
+            SELECT social_network, {key_column}
+            FROM v1.{table}
+            WHERE synced_at IS DISTINCT FROM updated_at
+                AND next_sync_at <= NOW()
+            ORDER BY next_sync_at
+            LIMIT $1
+            FOR UPDATE SKIP LOCKED
         )
-    return Response(status_code=http.HTTPStatus.NO_CONTENT)
-
-
-async def upsert_accounts(accounts: list[Account], api_key: str = API_KEY) -> Response:
-    client = NocoDBClient()
-    for account in accounts:
-        client.upsert_record(
-            settings.nocodb_account_table,
-            {},
-            {
-                "Social Network": account.social_network,
-                "Account Id": account.account_id,
-            },
-            {
-                "Social Network": account.social_network,
-                "Account Id": account.account_id,
-                "Account Extraction Date": account.account_extracted_at.isoformat(),
-                "Handle": account.handle,
-                "Description": account.description,
-                "Follower Count": account.follower_count,
-                "Following Count": account.following_count,
-                "Post Count": account.post_count,
-                "View Count": account.view_count,
-                "Like Count": account.like_count,
-                "Categories": account.categories,
-            },
+        UPDATE v1.{table} AS result
+        SET sync_attempts = result.sync_attempts + 1
+            , next_sync_at = NOW() + make_interval(secs => $2)
+        FROM claimed
+        WHERE result.social_network = claimed.social_network
+            AND result.{key_column} = claimed.{key_column}
+        RETURNING result.*
+    """  # noqa: S608 - table and column names are constants
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            rows = await conn.fetch(
+                claim_rows,
+                settings.nocodb_sync_batch_size,
+                settings.nocodb_sync_lease_seconds,
+            )
+        except Exception:
+            LOGGER.exception("Error claiming %s rows to sync", table)
+            raise
+
+    if rows:
+        await _sync_rows(table, key_column, rows, push)
+    return len(rows)
+
+
+async def _sync_rows(
+    table: str,
+    key_column: str,
+    rows: list[asyncpg.Record],
+    push: Callable[[list[asyncpg.Record]], Awaitable[None]],
+) -> None:
+    """Push rows to NocoDB, splitting them in halves on a record error to isolate failing rows.
+
+    Any other failure (NocoDB unreachable, server error) is recorded on all the rows at once.
+    """
+    try:
+        await push(rows)
+    except Exception as e:  # noqa: BLE001 - any failure is recorded on the rows and retried
+        if len(rows) == 1 or not _is_record_error(e):
+            await _record_sync_error(table, key_column, rows, e)
+            return
+        LOGGER.warning("Syncing %s %s rows failed, splitting them", len(rows), table)
+        middle = len(rows) // 2
+        await _sync_rows(table, key_column, rows[:middle], push)
+        await _sync_rows(table, key_column, rows[middle:], push)
+        return
+    await _mark_synced(table, key_column, rows)
+
+
+def _is_record_error(error: Exception) -> bool:
+    """Whether the error may be caused by some of the pushed records only."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return (
+            HTTPStatus.BAD_REQUEST <= status_code < HTTPStatus.INTERNAL_SERVER_ERROR
+            and status_code != HTTPStatus.TOO_MANY_REQUESTS
         )
-    return Response(status_code=http.HTTPStatus.NO_CONTENT)
+    return isinstance(error, pydantic.ValidationError | TargetRecordNotFoundError)
+
+
+async def _mark_synced(table: str, key_column: str, rows: list[asyncpg.Record]) -> None:
+    # Rows updated since they were claimed stay pending: synced_at is set to the pushed version
+    mark_synced = f"""
+        UPDATE v1.{table} AS result
+        SET synced_at = synced.updated_at
+            , sync_attempts = 0
+            , sync_error = NULL
+            , next_sync_at = NOW()
+        FROM unnest($1::text[], $2::text[], $3::timestamptz[])
+            AS synced(social_network, key, updated_at)
+        WHERE result.social_network = synced.social_network
+            AND result.{key_column} = synced.key
+    """  # noqa: S608 - table and column names are constants
+
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            await conn.execute(
+                mark_synced,
+                [row["social_network"] for row in rows],
+                [row[key_column] for row in rows],
+                [row["updated_at"] for row in rows],
+            )
+        except Exception:
+            LOGGER.exception("Error marking %s rows as synced", table)
+            raise
+
+
+async def _record_sync_error(
+    table: str,
+    key_column: str,
+    rows: list[asyncpg.Record],
+    error: Exception,
+) -> None:
+    record_error = f"""
+        UPDATE v1.{table} AS result
+        SET sync_error = $3
+            , next_sync_at = NOW() + make_interval(
+                secs => LEAST($4 * 2 ^ (result.sync_attempts - 1), $5)
+            )
+        FROM unnest($1::text[], $2::text[]) AS failed(social_network, key)
+        WHERE result.social_network = failed.social_network
+            AND result.{key_column} = failed.key
+        RETURNING result.social_network, result.{key_column}, result.sync_attempts
+            , result.next_sync_at
+    """  # noqa: S608 - table and column names are constants
+
+    message = f"{type(error).__name__}: {error}"
+    async with pool.PGPool.get_connection() as conn:
+        try:
+            updated_rows = await conn.fetch(
+                record_error,
+                [row["social_network"] for row in rows],
+                [row[key_column] for row in rows],
+                message,
+                settings.nocodb_sync_retry_base_seconds,
+                settings.nocodb_sync_retry_max_seconds,
+            )
+        except Exception:
+            LOGGER.exception("Error recording %s sync failure", table)
+            raise
+    if len(updated_rows) == 1:
+        updated = updated_rows[0]
+        LOGGER.warning(
+            "Syncing %s %s/%s failed (attempt %s), retrying at %s: %s",
+            table,
+            updated["social_network"],
+            updated[key_column],
+            updated["sync_attempts"],
+            updated["next_sync_at"],
+            message,
+        )
+    elif updated_rows:
+        LOGGER.warning(
+            "Syncing %s %s rows failed, retrying from %s: %s",
+            len(updated_rows),
+            table,
+            min(updated["next_sync_at"] for updated in updated_rows),
+            message,
+        )
+
+
+async def upsert_posts_to_nocodb(posts: list[Post]) -> None:
+    """Upsert posts into NocoDB, creating their missing accounts."""
+    await NocoDBClient().upsert_records(
+        settings.nocodb_post_table,
+        [
+            UpsertItem(
+                linked_field_mappings={
+                    "Account": {
+                        "target_table": settings.nocodb_account_table,
+                        "lookup": {
+                            "Social Network": post.social_network,
+                            "Account Id": post.account_id,
+                        },
+                    },
+                },
+                logical_id={"Post Id": post.post_id},
+                record={
+                    "Social Network": post.social_network,
+                    "Post Id": post.post_id,
+                    "Post Url": post.post_url,
+                    "Published At": post.published_at.isoformat(),
+                    "Title": post.title,
+                    "Description": post.description,
+                    "Comment Count": post.comment_count,
+                    "View Count": post.view_count,
+                    "Repost Count": post.repost_count,
+                    "Like Count": post.like_count,
+                    "Share Count": post.share_count,
+                    "Categories": post.categories,
+                    "Tags": post.tags,
+                    "SN Has Paid Placement": post.sn_has_paid_placement,
+                    "SN Brand": post.sn_brand,
+                    "Post Type": post.post_type,
+                },
+            )
+            for post in posts
+        ],
+        on_missing_target_record=MissingTargetBehavior.CREATE,
+    )
+
+
+async def upsert_accounts_to_nocodb(accounts: list[Account]) -> None:
+    """Upsert accounts into NocoDB."""
+    await NocoDBClient().upsert_records(
+        settings.nocodb_account_table,
+        [
+            UpsertItem(
+                logical_id={
+                    "Social Network": account.social_network,
+                    "Account Id": account.account_id,
+                },
+                record={
+                    "Social Network": account.social_network,
+                    "Account Id": account.account_id,
+                    "Account Extraction Date": account.account_extracted_at.isoformat(),
+                    "Handle": account.handle,
+                    "Description": account.description,
+                    "Follower Count": account.follower_count,
+                    "Following Count": account.following_count,
+                    "Post Count": account.post_count,
+                    "View Count": account.view_count,
+                    "Like Count": account.like_count,
+                    "Categories": account.categories,
+                },
+            )
+            for account in accounts
+        ],
+    )
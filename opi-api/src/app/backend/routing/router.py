@@ -1,3 +1,5 @@
+from http import HTTPStatus
+
 import fastapi
 
 from app.backend.routing.endpoints import extraction_task, social_network
@@ -9,6 +11,12 @@ router.add_api_route(
     methods=["POST"],
     description="Get available task and switch its status to acquired",
 )
+router.add_api_route(
+    "/extraction-task/acquire-batch",
+    endpoint=extraction_task.acquire_available_tasks,
+    methods=["POST"],
+    description="Get up to `count` available tasks and switch their status to acquired",
+)
 router.add_api_route(
     "/extraction-task/recycle-failed",
     endpoint=extraction_task.recycle_failed_tasks,
@@ -21,6 +29,12 @@ router.add_api_route(
     methods=["POST"],
     description="Recycle all acquired tasks that have passed their acquisition limit",
 )
+router.add_api_route(
+    "/extraction-task/{task_uid}/extend-lease",
+    endpoint=extraction_task.extend_task_lease,
+    methods=["POST"],
+    description="Extend the lease of an acquired task",
+)
 router.add_api_route(
     "/extraction-task/{task_uid}/mark-failed/",
     endpoint=extraction_task.mark_failed,
@@ -34,23 +48,68 @@ router.add_api_route(
     methods=["POST"],
     description="Mark Completed",
 )
+router.add_api_route(
+    "/extraction-task/mark-completed",
+    endpoint=extraction_task.mark_tasks_completed,
+    methods=["POST"],
+    description="Mark a batch of tasks as completed",
+)
+router.add_api_route(
+    "/extraction-task/mark-failed",
+    endpoint=extraction_task.mark_tasks_failed,
+    methods=["POST"],
+    description="Mark a batch of tasks as failed, each with its own error",
+)
+router.add_api_route(
+    "/extraction-task/release",
+    endpoint=extraction_task.release_tasks,
+    methods=["POST"],
+    description="Release a batch of acquired tasks back to available status",
+)
 router.add_api_route(
     "/extraction-task/",
     endpoint=extraction_task.register_tasks,
     methods=["POST"],
-    description="Register tasks",
+    description=(
+        "Register tasks, skipping the ones already registered and not completed "
+        "(same social network, type and config)"
+    ),
 )
 router.add_api_route(
     "/posts/",
     endpoint=social_network.upsert_posts,
     methods=["POST"],
-    description="Upsert account posts",
+    status_code=HTTPStatus.ACCEPTED,
+    description=(
+        "Upsert account posts, the changed ones are synced to NocoDB in the background. "
+        "Reports how many posts were written and skipped (unchanged)"
+    ),
+)
+router.add_api_route(
+    "/posts/stream",
+    endpoint=social_network.upsert_posts_stream,
+    methods=["POST"],
+    status_code=HTTPStatus.ACCEPTED,
+    description=(
+        "Upsert account posts sent as NDJSON (one post per line), processed in batches "
+        "while they are received. Reports how many posts were written and skipped (unchanged)"
+    ),
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        },
+    },
 )
 router.add_api_route(
     "/accounts/",
     endpoint=social_network.upsert_accounts,
     methods=["POST"],
-    description="Upsert accounts data",
+    status_code=HTTPStatus.ACCEPTED,
+    description=(
+        "Upsert accounts data, the changed ones are synced to NocoDB in the background. "
+        "Reports how many accounts were written and skipped (unchanged)"
+    ),
 )
 router.add_api_route(
     "/extraction-task/stats",
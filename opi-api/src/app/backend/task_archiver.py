@@ -0,0 +1,29 @@
+"""Background archival of finished tasks."""
+
+import asyncio
+import logging
+
+from app._config import settings
+from app.backend.routing.endpoints.extraction_task import archive_finished_tasks
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def run_task_archiver(interval_seconds: float) -> None:
+    """Archive finished tasks every `interval_seconds` until cancelled.
+
+    Runs again immediately while full batches of tasks are archived.
+    """
+    LOGGER.info("Starting task archiver (every %ss)", interval_seconds)
+    while True:
+        try:
+            archived_count = await archive_finished_tasks()
+        except Exception:
+            # Keep the archiver alive: the next run will retry
+            LOGGER.exception("Task archiver run failed")
+            archived_count = 0
+        else:
+            if archived_count:
+                LOGGER.info("Archived %s finished tasks", archived_count)
+        if archived_count < settings.extraction_task_archive_batch_size:
+            await asyncio.sleep(interval_seconds)
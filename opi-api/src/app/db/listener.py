@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+
+import asyncpg
+
+from app.db import pool
+
+logger = logging.getLogger("uvicorn")
+
+# Notified (with the social network as payload) by the extraction_task triggers
+# when tasks become AVAILABLE. See migration 000004.
+TASK_AVAILABLE_CHANNEL = "extraction_task_available"
+
+RECONNECT_DELAY_SECONDS = 5
+
+
+class TaskAvailableListener:
+    """Postgresql LISTEN on task availability, shared by all requests of the process.
+
+    A dedicated connection (outside of the pool) listens to TASK_AVAILABLE_CHANNEL.
+    Waiters subscribe before checking for tasks, then wait for the subscription
+    to be notified: a task made available in between can't be missed.
+
+    A notification wakes a single waiter, the longest waiting one: waking them all
+    would have them all race for the same tasks. A waiter which acquired all the tasks
+    it asked for calls wake_next, so that the next one checks for the remaining tasks.
+    """
+
+    _waiters: dict[str | None, deque[asyncio.Future[None]]] = {}  # noqa: RUF012
+
+    @classmethod
+    def subscribe(cls, social_network: str | None) -> asyncio.Future[None]:
+        """Get a future done the next time a task becomes available, for this waiter only.
+
+        Args:
+            social_network: Only be notified for tasks of this network, any if None.
+
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        cls._waiters.setdefault(social_network, deque()).append(waiter)
+        return waiter
+
+    @classmethod
+    def unsubscribe(cls, social_network: str | None, waiter: asyncio.Future[None]) -> None:
+        """Stop waiting, e.g. once tasks were acquired without waiting."""
+        waiters = cls._waiters.get(social_network)
+        if waiters is not None and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del cls._waiters[social_network]
+
+    @classmethod
+    def wake_next(cls, social_network: str) -> None:
+        """Wake the longest waiting subscriber to tasks of this network (or of any)."""
+        for key in (social_network, None):
+            waiters = cls._waiters.get(key)
+            while waiters:
+                waiter = waiters.popleft()
+                # Cancelled when its wait timed out
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+            cls._waiters.pop(key, None)
+
+    @classmethod
+    def _wake_all(cls) -> None:
+        for waiters in cls._waiters.values():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+        cls._waiters.clear()
+
+    @classmethod
+    def _on_notification(
+        cls,
+        _connection: asyncpg.Connection,
+        _pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        cls.wake_next(payload)
+
+    @classmethod
+    async def run(cls) -> None:
+        """Listen until cancelled, reconnecting if the connection is lost."""
+        while True:
+            terminated = asyncio.Event()
+            try:
+                conn = await asyncpg.connect(dsn=pool.DSN)
+            except Exception:
+                logger.exception("Task available listener failed to connect")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+                continue
+
+            try:
+                conn.add_termination_listener(lambda _conn, event=terminated: event.set())
+                await conn.add_listener(TASK_AVAILABLE_CHANNEL, cls._on_notification)
+                logger.info("Listening to %s", TASK_AVAILABLE_CHANNEL)
+                # Wake up all waiters: notifications may have been missed while disconnected
+                cls._wake_all()
+                await terminated.wait()
+                logger.warning("Task available listener connection lost")
+            finally:
+                if not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
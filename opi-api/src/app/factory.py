@@ -1,14 +1,65 @@
 """Factory fro OPI API."""
 
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import APIRouter, FastAPI
 
+from app._config import settings
+from app.backend.lease_reaper import run_expired_lease_reaper
+from app.backend.nocodb_sync import run_nocodb_sync
 from app.backend.ping import router as ping_router
+from app.backend.post_refresh import run_post_refresh_scheduler
 from app.backend.routing import router
+from app.backend.task_archiver import run_task_archiver
+from app.db import pool
+from app.db.listener import TaskAvailableListener
+from app.nocodb import NocoDBClient
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the db pool, run background tasks for the app lifetime, close everything on shutdown."""
+    await pool.PGPool.warm_up()
+    background_tasks = [asyncio.create_task(TaskAvailableListener.run())]
+    if settings.expired_lease_reaper_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_expired_lease_reaper(settings.expired_lease_reaper_interval_seconds)
+            )
+        )
+
+    if settings.nocodb_sync_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(run_nocodb_sync(settings.nocodb_sync_interval_seconds))
+        )
+
+    if settings.extraction_task_archive_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(
+                run_task_archiver(settings.extraction_task_archive_interval_seconds)
+            )
+        )
+
+    if settings.post_refresh_interval_seconds > 0:
+        background_tasks.append(
+            asyncio.create_task(run_post_refresh_scheduler(settings.post_refresh_interval_seconds))
+        )
+
+    yield
+
+    for background_task in background_tasks:
+        background_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await background_task
+    await NocoDBClient.close()
+    await pool.PGPool.close_connection()
 
 
 def create_app() -> FastAPI:
     """Create Fastapi app an inistialize routers."""
-    app = FastAPI(title="Observatoire pratique influence API")
+    app = FastAPI(title="Observatoire pratique influence API", lifespan=lifespan)
 
     main_router = APIRouter()
     app.include_router(main_router)
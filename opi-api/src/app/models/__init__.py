@@ -1,35 +1,54 @@
 """OPI API models."""
 
-from app.models.socialnetwork import Account, Post, SocialNetwork
+from app.models.socialnetwork import Account, Post, SocialNetwork, UpsertResultsResponse
 from app.models.task import (
     DetailedStats,
+    ExtendTaskLeaseResponse,
     ExtractionTask,
     ExtractionTaskResponse,
     ExtractionTaskStatsResponse,
     ExtractionTaskStatus,
     ExtractionTaskType,
     MarkTaskFailedPayload,
+    MarkTasksCompletedPayload,
+    MarkTasksFailedPayload,
+    MarkTasksResponse,
     NetworkCount,
     RecycleExpiredTasksResponse,
     RecycleFailedTasksResponse,
+    RegisterTasksResponse,
+    ReleaseTasksPayload,
     StatusCount,
+    TaskFailure,
+    TaskLease,
+    TaskMarkResult,
     TaskTypeCount,
 )
 
 __all__ = [
     "Account",
     "DetailedStats",
+    "ExtendTaskLeaseResponse",
     "ExtractionTask",
     "ExtractionTaskResponse",
     "ExtractionTaskStatsResponse",
     "ExtractionTaskStatus",
     "ExtractionTaskType",
     "MarkTaskFailedPayload",
+    "MarkTasksCompletedPayload",
+    "MarkTasksFailedPayload",
+    "MarkTasksResponse",
     "NetworkCount",
     "Post",
     "RecycleExpiredTasksResponse",
     "RecycleFailedTasksResponse",
+    "RegisterTasksResponse",
+    "ReleaseTasksPayload",
     "SocialNetwork",
     "StatusCount",
+    "TaskFailure",
+    "TaskLease",
+    "TaskMarkResult",
     "TaskTypeCount",
+    "UpsertResultsResponse",
 ]
@@ -58,3 +58,10 @@ class Post(pydantic.BaseModel):
     sn_brand: str
     post_type: str
     text_content: str
+
+
+class UpsertResultsResponse(pydantic.BaseModel):
+    """Upsert accounts/posts response."""
+
+    written_count: int
+    skipped_count: int
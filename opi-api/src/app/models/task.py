@@ -55,6 +55,8 @@ class ExtractionTask(pydantic.BaseModel):
     status: ExtractionTaskStatus | None = None
     visible_at: pydantic.AwareDatetime | None = None
     error: str | None = None
+    # Higher first, defaults to 1 for extract-post-details and 0 for other tasks
+    priority: int | None = pydantic.Field(default=None, ge=-32768, le=32767)
 
 
 class ExtractionTaskResponse(pydantic.BaseModel):
@@ -66,6 +68,15 @@ class ExtractionTaskResponse(pydantic.BaseModel):
     type: ExtractionTaskType | None = None
     task_config: ExtractionTaskConfig | None = None
     error: str | None = None
+    # Identifies this lease: passed back to extend, complete, fail or release the task
+    lease_token: uuid.UUID | None = None
+
+
+class ExtendTaskLeaseResponse(pydantic.BaseModel):
+    """Response model for extend lease endpoint."""
+
+    task_uid: uuid.UUID
+    visible_at: pydantic.AwareDatetime
 
 
 class MarkTaskFailedPayload(pydantic.BaseModel):
@@ -74,6 +85,62 @@ class MarkTaskFailedPayload(pydantic.BaseModel):
     error: str | None
 
 
+class TaskLease(pydantic.BaseModel):
+    """Lease of one task of the bulk MarkCompleted and Release endpoints."""
+
+    task_uid: uuid.UUID
+    lease_token: uuid.UUID | None = None
+
+
+class MarkTasksCompletedPayload(pydantic.BaseModel):
+    """Payload for bulk MarkCompleted endpoint."""
+
+    tasks: list[TaskLease] = pydantic.Field(max_length=1000)
+
+
+class ReleaseTasksPayload(pydantic.BaseModel):
+    """Payload for bulk Release endpoint."""
+
+    tasks: list[TaskLease] = pydantic.Field(max_length=1000)
+
+
+class TaskFailure(pydantic.BaseModel):
+    """Error for one task of the bulk MarkFailed endpoint."""
+
+    task_uid: uuid.UUID
+    error: str | None
+    lease_token: uuid.UUID | None = None
+
+
+class MarkTasksFailedPayload(pydantic.BaseModel):
+    """Payload for bulk MarkFailed endpoint."""
+
+    tasks: list[TaskFailure] = pydantic.Field(max_length=1000)
+
+
+class TaskMarkResult(pydantic.BaseModel):
+    """Outcome of a bulk mark endpoint for one task."""
+
+    task_uid: uuid.UUID
+    # False when the task was not acquired, its lease had expired or its lease_token
+    # did not match
+    updated: bool
+
+
+class MarkTasksResponse(pydantic.BaseModel):
+    """Response model for bulk mark endpoints."""
+
+    updated_count: int
+    results: list[TaskMarkResult]
+
+
+class RegisterTasksResponse(pydantic.BaseModel):
+    """Register tasks response."""
+
+    inserted_count: int
+    existing_count: int
+
+
 class RecycleFailedTasksResponse(pydantic.BaseModel):
     """Response model for recycle failed tasks endpoint."""
 
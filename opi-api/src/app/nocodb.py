@@ -1,16 +1,26 @@
 """Generic NocoDB client for upserting records."""
 
+import asyncio
+import itertools
 import logging
+from collections.abc import Awaitable, Iterable
 from enum import StrEnum
-from typing import Any, NotRequired, TypedDict, Unpack
+from typing import Any, ClassVar, NotRequired, TypedDict, Unpack
 from urllib.parse import quote
 
-import requests
+import httpx
 
+from app._cache import TTLCache
 from app._config import settings
 
 LOGGER = logging.getLogger(__name__)
 
+# Logical ids looked up per `where` query, keeps the query string short
+LOOKUP_BATCH_SIZE = 50
+LOOKUP_PAGE_SIZE = 100
+
+type LogicalIdKey = tuple[tuple[str, str], ...]
+
 
 class NocoRecord(TypedDict):
     """NocoDB record."""
@@ -19,8 +29,20 @@ class NocoRecord(TypedDict):
     fields: dict[str, Any]
 
 
+class UpsertItem(TypedDict):
+    """Record to upsert.
+
+    linked_field_mappings maps link field names to
+    {"target_table": <table name>, "lookup": <logical id of the target record>}.
+    """
+
+    logical_id: dict[str, Any]
+    record: dict[str, Any]
+    linked_field_mappings: NotRequired[dict[str, Any]]
+
+
 class RequestKwargs(TypedDict):
-    """Keyword arguments for requests.request."""
+    """Keyword arguments for httpx.AsyncClient.request."""
 
     json: NotRequired[Any]
     params: NotRequired[dict[str, Any]]
@@ -63,7 +85,28 @@ class MissingTargetBehavior(StrEnum):
 
 # TODO(iai): Merge this client with the one used in data-extractor
 class NocoDBClient:
-    """Generic NocoDB client for upserting records."""
+    """Generic NocoDB client for upserting records.
+
+    All instances of the process share one HTTP client: connections to NocoDB are kept
+    alive, and at most settings.nocodb_max_connections requests are in flight at once.
+    They also share the table and field metadata, cached for
+    settings.nocodb_metadata_cache_ttl_seconds and refreshed when a table or a field
+    is missing from the cache, and the record ids of the logical ids they looked up
+    or upserted, evicted when a write using them fails.
+    """
+
+    _http_client: ClassVar[httpx.AsyncClient | None] = None
+    _table_ids: ClassVar[TTLCache[str, str]] = TTLCache(
+        ttl_seconds=settings.nocodb_metadata_cache_ttl_seconds
+    )
+    _table_fields: ClassVar[TTLCache[str, list[dict[str, Any]]]] = TTLCache(
+        ttl_seconds=settings.nocodb_metadata_cache_ttl_seconds
+    )
+    # Record ids by (table name, logical id key)
+    _record_ids: ClassVar[TTLCache[tuple[str, LogicalIdKey], str]] = TTLCache(
+        ttl_seconds=settings.nocodb_record_id_cache_ttl_seconds,
+        max_size=settings.nocodb_record_id_cache_size,
+    )
 
     def __init__(self) -> None:
         """Initialize the NocoDB client.
@@ -72,9 +115,30 @@ class NocoDBClient:
             config: NocoDB configuration
 
         """
-        self._table_id_cache: dict[str, str] = {}
         self._base_url = f"{settings.nocodb_url}/api/v3"
 
+    @classmethod
+    def _get_http_client(cls) -> httpx.AsyncClient:
+        if cls._http_client is None:
+            cls._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    settings.nocodb_timeout_seconds,
+                    connect=settings.nocodb_connect_timeout_seconds,
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.nocodb_max_connections,
+                    max_keepalive_connections=settings.nocodb_max_connections,
+                ),
+            )
+        return cls._http_client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Close the shared HTTP client."""
+        if cls._http_client is not None:
+            await cls._http_client.aclose()
+            cls._http_client = None
+
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication.
 
@@ -87,11 +151,10 @@ class NocoDBClient:
             "Content-Type": "application/json",
         }
 
-    def _make_request(
+    async def _make_request(
         self,
         method: str,
         endpoint: str,
-        timeout: int = 10,
         **kwargs: Unpack[RequestKwargs],
     ) -> dict[str, Any]:
         """Make an HTTP request to NocoDB API.
@@ -99,8 +162,7 @@ class NocoDBClient:
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
             endpoint: API endpoint path
-            timeout: The request timeout
-            **kwargs: Additional arguments for requests
+            **kwargs: Additional arguments for httpx
 
         Returns:
             Response data as dictionary
@@ -113,70 +175,30 @@ class NocoDBClient:
         headers = self._get_headers()
 
         try:
-            response = requests.request(method, url, headers=headers, timeout=timeout, **kwargs)
+            response = await self._get_http_client().request(method, url, headers=headers, **kwargs)
             response.raise_for_status()
             return response.json()
-        except requests.RequestException:
-            LOGGER.exception("Nocodb Request failed {response.text}")
+        except httpx.HTTPStatusError as e:
+            LOGGER.exception("Nocodb Request failed %s", e.response.text)
+            raise
+        except httpx.HTTPError:
+            LOGGER.exception("Nocodb Request failed %s %s", method, endpoint)
             raise
 
-    def get_tables(self) -> list[dict[str, Any]]:
+    async def get_tables(self) -> list[dict[str, Any]]:
         """Get all tables in the base.
 
         Returns:
             List of table dictionaries
 
         """
-        response = self._make_request(
+        response = await self._make_request(
             "GET",
             f"/meta/bases/{settings.nocodb_base_id}/tables",
         )
         return response.get("list", [])
 
-    def update_record(
-        self,
-        table_id: str,
-        record_id: str,
-        record_data: dict[str, Any],
-    ) -> NocoRecord:
-        """Update an existing record.
-
-        Args:
-            table_id: Table ID
-            record_id: Record ID
-            record_data: Updated record data
-
-        Returns:
-            Updated record
-
-        """
-        endpoint = f"/data/{settings.nocodb_base_id}/{table_id}/records"
-        payload = {"id": record_id, "fields": record_data}
-        response = self._make_request("PATCH", endpoint, json=payload)
-        records = response.get("records", [])
-        return records[0]
-
-    def create_record(self, table_id: str, record_data: dict[str, Any]) -> NocoRecord:
-        """Create a new record.
-
-        Args:
-            table_id: Table ID
-            record_data: Record data to create
-
-        Returns:
-            Created record
-
-        """
-        data = [{"fields": record_data}]
-        response = self._make_request(
-            "POST",
-            f"/data/{settings.nocodb_base_id}/{table_id}/records",
-            json=data,
-        )
-        records = response.get("records", [])
-        return records[0]
-
-    def _get_table_id(self, table_name: str) -> str:
+    async def _get_table_id(self, table_name: str) -> str:
         """Get table ID by table name.
 
         Args:
@@ -189,166 +211,302 @@ class NocoDBClient:
             Exception: If table not found
 
         """
-        if table_name in self._table_id_cache:
-            return self._table_id_cache[table_name]
+        table_id = self._table_ids.get(table_name)
+        if table_id is not None:
+            return table_id
 
-        tables = self.get_tables()
+        tables = await self.get_tables()
         for table in tables:
+            self._table_ids.set(table["title"], table["id"])
             if table.get("title") == table_name:
                 table_id = table["id"]
-                self._table_id_cache[table_name] = table_id
-                return table_id
+        if table_id is not None:
+            return table_id
         message = f"Table '{table_name}' not found in base"
         raise TableNotFoundError(message)
 
-    def _find_record_id_by_logical_id(
+    async def _find_record_ids_by_logical_ids(
         self,
         noco_table: str,
-        logical_id: dict[str, Any],
-    ) -> str | None:
-        record = self._find_record_by_logical_id(noco_table, logical_id)
-        return record["id"] if record else None
+        logical_ids: list[dict[str, Any]],
+    ) -> dict[LogicalIdKey, str]:
+        """Find the ids of existing records, in cache or with a few `where` queries.
 
-    def _find_record_by_logical_id(
-        self,
-        noco_table: str,
-        logical_id: dict[str, Any],
-    ) -> NocoRecord | None:
-        table_id = self._get_table_id(noco_table)
-        where = "~and".join([f"(\"{k}\", eq, '{quote(v)}')" for k, v in logical_id.items()])
-        params: dict[str, Any] = {"where": where}
+        Args:
+            noco_table: Name of the table
+            logical_ids: Logical identifiers of the records to find
 
-        response = self._make_request(
-            "GET",
-            f"/data/{settings.nocodb_base_id}/{table_id}/records",
-            params=params,
+        Returns:
+            Record ids by logical id key, missing records are not included
+
+        """
+        record_ids: dict[LogicalIdKey, str] = {}
+        unique_logical_ids = []
+        for key, logical_id in {_logical_id_key(lid): lid for lid in logical_ids}.items():
+            record_id = self._record_ids.get((noco_table, key))
+            if record_id is not None:
+                record_ids[key] = record_id
+            else:
+                unique_logical_ids.append(logical_id)
+        if not unique_logical_ids:
+            return record_ids
+
+        table_id = await self._get_table_id(noco_table)
+        batches = await _gather(
+            *(
+                self._find_records_by_logical_ids(table_id, list(batch))
+                for batch in itertools.batched(unique_logical_ids, LOOKUP_BATCH_SIZE)
+            )
         )
-        records = response.get("records", [])
-        if records:
-            if len(records) > 1:
-                LOGGER.warning("Duplicate record for logical_id: %s", logical_id)
-            record_dict = records[0]
-            return NocoRecord(id=record_dict["id"], fields=record_dict)
-        return None
-
-    def _get_table_fields(self, table_id: str) -> list[dict[str, Any]]:
+
+        for records in batches:
+            for record in records:
+                key = _logical_id_key(record["fields"], keys=unique_logical_ids[0])
+                if key in record_ids:
+                    LOGGER.warning("Duplicate record for logical_id: %s", dict(key))
+                    continue
+                record_ids[key] = record["id"]
+                self._record_ids.set((noco_table, key), record["id"])
+        return record_ids
+
+    def _forget_record_ids(self, table_name: str, items: list[UpsertItem]) -> None:
+        """Evict the cached record ids of items and of their link targets."""
+        for item in items:
+            self._record_ids.invalidate((table_name, _logical_id_key(item["logical_id"])))
+            for mapping in item.get("linked_field_mappings", {}).values():
+                self._record_ids.invalidate(
+                    (mapping["target_table"], _logical_id_key(mapping["lookup"]))
+                )
+
+    async def _find_records_by_logical_ids(
+        self,
+        table_id: str,
+        logical_ids: list[dict[str, Any]],
+    ) -> list[NocoRecord]:
+        where = "~or".join(
+            "(" + "~and".join(f"(\"{k}\", eq, '{quote(str(v))}')" for k, v in lid.items()) + ")"
+            for lid in logical_ids
+        )
+        params: dict[str, Any] = {
+            "where": where,
+            "fields": ",".join(logical_ids[0]),
+            "pageSize": LOOKUP_PAGE_SIZE,
+        }
+
+        records: list[NocoRecord] = []
+        page = 1
+        while True:
+            response = await self._make_request(
+                "GET",
+                f"/data/{settings.nocodb_base_id}/{table_id}/records",
+                params={**params, "page": page},
+            )
+            records.extend(
+                NocoRecord(id=record["id"], fields=record.get("fields", {}))
+                for record in response.get("records", [])
+            )
+            if not response.get("next"):
+                return records
+            page += 1
+
+    async def _get_table_fields(
+        self, table_id: str, *, refresh: bool = False
+    ) -> list[dict[str, Any]]:
         """Get all columns for a table.
 
         Args:
             table_id: Table ID
+            refresh: Fetch the fields even if they are cached
 
         Returns:
             List of fields
 
         """
-        response = self._make_request(
-            "GET", f"/meta/bases/{settings.nocodb_base_id}/tables/{table_id}"
-        )
-        return response.get("fields", [])
-
-    def _get_link_field_id(self, table_id: str, field_name: str) -> str:
-        return self._get_field_def_by_name(table_id, field_name)["id"]
-
-    def _get_link_field_target_table_id(self, table_id: str, field_name: str) -> str:
-        return self._get_field_def_by_name(table_id, field_name)["options"]["related_table_id"]
-
-    def _get_field_def_by_name(self, table_id: str, field_name: str) -> dict[str, Any]:
-        columns = self._get_table_fields(table_id)
-        for column in columns:
-            if column.get("title") == field_name:
-                return column
+        fields = None if refresh else self._table_fields.get(table_id)
+        if fields is None:
+            response = await self._make_request(
+                "GET", f"/meta/bases/{settings.nocodb_base_id}/tables/{table_id}"
+            )
+            fields = response.get("fields", [])
+            self._table_fields.set(table_id, fields)
+        return fields
+
+    async def _get_link_field_target_table_id(self, table_id: str, field_name: str) -> str:
+        field_def = await self._get_field_def_by_name(table_id, field_name)
+        return field_def["options"]["related_table_id"]
+
+    async def _get_field_def_by_name(self, table_id: str, field_name: str) -> dict[str, Any]:
+        # The cached fields may predate the field creation: refresh them once before failing
+        for refresh in (False, True):
+            columns = await self._get_table_fields(table_id, refresh=refresh)
+            for column in columns:
+                if column.get("title") == field_name:
+                    return column
 
         message = f"Link field '{field_name}' not found in table"
         raise FieldNotFoundError(message)
 
-    def link_record(
+    async def _bulk_write_records(
         self,
-        from_table_id: str,
-        link_field_id: str,
-        from_record_id: str,
-        target_record_id: str,
-    ) -> None:
-        """Link a record to another record via a link field.
-
-        Args:
-            from_table_id: Source table ID
-            from_record_id: Source record ID
-            link_field_id: Link field ID
-            target_record_id: Target record ID to link to
-
-        """
-        data = {"id": target_record_id}
-        endpoint = (
-            f"/data/{settings.nocodb_base_id}/{from_table_id}/links/"
-            f"{link_field_id}/{from_record_id}/"
+        method: str,
+        table_id: str,
+        payloads: list[dict[str, Any]],
+    ) -> list[NocoRecord]:
+        """Create (POST) or update (PATCH) records, settings.nocodb_write_batch_size at a time."""
+        endpoint = f"/data/{settings.nocodb_base_id}/{table_id}/records"
+        responses = await _gather(
+            *(
+                self._make_request(method, endpoint, json=list(batch))
+                for batch in itertools.batched(payloads, settings.nocodb_write_batch_size)
+            )
         )
-        self._make_request("POST", endpoint, json=data)
+        return [record for response in responses for record in response.get("records", [])]
 
-    def upsert_record(
+    async def _resolve_links(
         self,
         table_name: str,
-        linked_field_mappings: dict[str, Any],
-        logical_id: dict[str, Any],
-        record: dict[str, Any],
-        on_missing_target_record: MissingTargetBehavior = MissingTargetBehavior.DONT_SET,
-    ) -> NocoRecord:
-        """Upserts record into NOCODB."""
-        table_id = self._get_table_id(table_name)
+        table_id: str,
+        items: list[UpsertItem],
+        on_missing_target_record: MissingTargetBehavior,
+    ) -> list[dict[str, list[dict[str, str]]]]:
+        """Resolve the link fields of each item to the ids of their target records.
 
-        existing_record_id = self._find_record_id_by_logical_id(
-            table_name,
-            logical_id,
-        )
+        Returns:
+            For each item, the link field values to set in its record payload
 
-        if existing_record_id:
-            result = self.update_record(table_id, existing_record_id, record)
-            LOGGER.debug("Updated record %s with id %s", logical_id, result["id"])
-        else:
-            # Create new record
-            result = self.create_record(table_id, record)
-            LOGGER.debug("Created record %s with id %s", logical_id, result["id"])
-
-        for field_name, mapping in linked_field_mappings.items():
-            target_record_logical_id = mapping["lookup"]
-            target_table_name = mapping["target_table"]
-            link_field_id = self._get_link_field_id(table_id, field_name)
-            target_record_id = self._find_record_id_by_logical_id(
-                target_table_name, target_record_logical_id
-            )
-            if target_record_id:
-                self.link_record(
-                    from_table_id=table_id,
-                    link_field_id=link_field_id,
-                    from_record_id=result["id"],
-                    target_record_id=target_record_id,
+        """
+        targets: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for item in items:
+            for field_name, mapping in item.get("linked_field_mappings", {}).items():
+                targets.setdefault((field_name, mapping["target_table"]), []).append(
+                    mapping["lookup"]
                 )
-            elif on_missing_target_record == MissingTargetBehavior.RAISE:
-                raise TargetRecordNotFoundError(table_name, field_name, target_record_logical_id)
-            elif on_missing_target_record == MissingTargetBehavior.DONT_SET:
+
+        target_ids: dict[tuple[str, str], dict[LogicalIdKey, str]] = {}
+        for (field_name, target_table_name), lookups in targets.items():
+            found = await self._find_record_ids_by_logical_ids(target_table_name, lookups)
+            missing = list(
+                {
+                    key: lookup
+                    for lookup in lookups
+                    if (key := _logical_id_key(lookup)) not in found
+                }.values()
+            )
+            if missing and on_missing_target_record == MissingTargetBehavior.RAISE:
+                raise TargetRecordNotFoundError(table_name, field_name, missing[0])
+            if missing and on_missing_target_record == MissingTargetBehavior.CREATE:
                 LOGGER.debug(
-                    "Not setting missing target record."
-                    " Table_name:%s, field_name: %s, target_record_id: %s",
+                    "Creating %s missing target records. Table_name:%s, field_name: %s",
+                    len(missing),
                     table_name,
                     field_name,
-                    target_record_id,
                 )
-            elif on_missing_target_record == MissingTargetBehavior.CREATE:
-                LOGGER.debug(
-                    "Creating missing target record."
-                    " Table_name:%s, field_name: %s, target_record_id: %s",
-                    table_name,
-                    field_name,
-                    target_record_id,
+                target_table_id = await self._get_link_field_target_table_id(table_id, field_name)
+                created = await self._bulk_write_records(
+                    "POST", target_table_id, [{"fields": lookup} for lookup in missing]
                 )
-                target_table_id = self._get_link_field_target_table_id(table_id, field_name)
-                target_record_id = self.create_record(
-                    table_id=target_table_id, record_data=mapping["lookup"]
-                )["id"]
-                self.link_record(
-                    from_table_id=table_id,
-                    link_field_id=link_field_id,
-                    from_record_id=result["id"],
-                    target_record_id=target_record_id,
+                for lookup, record in zip(missing, created, strict=True):
+                    found[_logical_id_key(lookup)] = record["id"]
+                    self._record_ids.set((target_table_name, _logical_id_key(lookup)), record["id"])
+            target_ids[field_name, target_table_name] = found
+
+        links: list[dict[str, list[dict[str, str]]]] = []
+        for item in items:
+            item_links = {}
+            for field_name, mapping in item.get("linked_field_mappings", {}).items():
+                target_record_id = target_ids[field_name, mapping["target_table"]].get(
+                    _logical_id_key(mapping["lookup"])
                 )
+                if target_record_id:
+                    item_links[field_name] = [{"id": target_record_id}]
+                else:
+                    LOGGER.debug(
+                        "Not setting missing target record."
+                        " Table_name:%s, field_name: %s, target_record_logical_id: %s",
+                        table_name,
+                        field_name,
+                        mapping["lookup"],
+                    )
+            links.append(item_links)
+        return links
+
+    async def upsert_records(
+        self,
+        table_name: str,
+        items: list[UpsertItem],
+        on_missing_target_record: MissingTargetBehavior = MissingTargetBehavior.DONT_SET,
+    ) -> list[NocoRecord]:
+        """Upserts records into NOCODB in bulk.
+
+        Existing records and link targets are looked up with a few `where` queries, then
+        records are created and updated settings.nocodb_write_batch_size at a time, link
+        fields included.
+
+        Args:
+            table_name: Name of the table
+            items: Records to upsert, the last one wins if logical ids are duplicated
+            on_missing_target_record: What to do when a link target record does not exist
+
+        Returns:
+            Updated then created records
 
-        return result
+        """
+        if not items:
+            return []
+
+        table_id = await self._get_table_id(table_name)
+        items = list({_logical_id_key(item["logical_id"]): item for item in items}.values())
+        existing_record_ids = await self._find_record_ids_by_logical_ids(
+            table_name, [item["logical_id"] for item in items]
+        )
+        links = await self._resolve_links(table_name, table_id, items, on_missing_target_record)
+
+        to_update: list[dict[str, Any]] = []
+        to_create: list[dict[str, Any]] = []
+        created_keys: list[LogicalIdKey] = []
+        for item, item_links in zip(items, links, strict=True):
+            fields = {**item["record"], **item_links}
+            key = _logical_id_key(item["logical_id"])
+            record_id = existing_record_ids.get(key)
+            if record_id:
+                to_update.append({"id": record_id, "fields": fields})
+            else:
+                to_create.append({"fields": fields})
+                created_keys.append(key)
+
+        try:
+            updated = await self._bulk_write_records("PATCH", table_id, to_update)
+            created = await self._bulk_write_records("POST", table_id, to_create)
+        except httpx.HTTPStatusError:
+            # A cached record or link target may have been deleted from NocoDB
+            self._forget_record_ids(table_name, items)
+            raise
+        for key, record in zip(created_keys, created, strict=True):
+            self._record_ids.set((table_name, key), record["id"])
+        LOGGER.debug(
+            "Upserted %s records in %s: %s updated, %s created",
+            len(items),
+            table_name,
+            len(updated),
+            len(created),
+        )
+        return updated + created
+
+
+async def _gather[T](*aws: Awaitable[T]) -> list[T]:
+    """Like asyncio.gather, but cancel the other requests as soon as one fails."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _logical_id_key(
+    fields: dict[str, Any],
+    keys: Iterable[str] | None = None,
+) -> LogicalIdKey:
+    """Hashable logical id, values are compared as strings."""
+    return tuple((k, str(fields.get(k))) for k in sorted(keys if keys is not None else fields))
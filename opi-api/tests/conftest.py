@@ -0,0 +1,60 @@
+import asyncio
+import os
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import asyncpg
+import pytest
+
+# Tests needing a database run against TEST_POSTGRES_DSN, migrated beforehand: its tasks (archived
+# ones too), accounts, posts and post metrics snapshots are deleted by each test. Set before
+# importing the app, which reads its settings on import.
+TEST_POSTGRES_DSN = os.getenv("TEST_POSTGRES_DSN")
+if TEST_POSTGRES_DSN:
+    os.environ["POSTGRES_DSN"] = TEST_POSTGRES_DSN
+for name, value in {
+    "API_KEY": "test",
+    "NOCODB_URL": "http://nocodb.invalid",
+    "NOCODB_API_TOKEN": "test",
+    "NOCODB_BASE_ID": "test",
+    "NOCODB_ACCOUNT_TABLE": "Account",
+    "NOCODB_POST_TABLE": "Post",
+}.items():
+    os.environ.setdefault(name, value)
+
+from app.db import pool  # noqa: E402 - the environment is set above
+
+type Run = Callable[[Coroutine[Any, Any, Any]], Any]
+
+
+async def _delete_tasks_and_posts() -> None:
+    conn = await asyncpg.connect(dsn=pool.DSN)
+    try:
+        await conn.execute(
+            """
+            TRUNCATE v1.extraction_task, v1.extraction_task_archive, v1.account, v1.post
+                , v1.post_metrics_snapshot
+            """
+        )
+    finally:
+        await conn.close()
+
+
+@pytest.fixture
+def run() -> Run:
+    """Run coroutines against an empty task queue and no posts, each in an event loop of its own."""
+    if not TEST_POSTGRES_DSN:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    asyncio.run(_delete_tasks_and_posts())
+
+    def run_with_pool(coroutine: Coroutine[Any, Any, Any]) -> Any:  # noqa: ANN401
+        async def run_and_close_pool() -> Any:  # noqa: ANN401
+            try:
+                return await coroutine
+            finally:
+                # The pool is bound to the event loop
+                await pool.PGPool.close_connection()
+
+        return asyncio.run(run_and_close_pool())
+
+    return run_with_pool
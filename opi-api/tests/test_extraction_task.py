@@ -0,0 +1,367 @@
+import asyncio
+import contextlib
+import datetime as dt
+import time
+import uuid
+
+import fastapi
+import pytest
+
+from app._config import settings
+from app.backend.routing.endpoints.extraction_task import (
+    acquire_available_tasks,
+    archive_finished_tasks,
+    extend_task_lease,
+    mark_tasks_completed,
+    mark_tasks_failed,
+    recycle_expired_leases,
+    register_tasks,
+    schedule_post_refreshes,
+)
+from app.db import pool
+from app.db.listener import TaskAvailableListener
+from app.models import (
+    ExtractionTask,
+    ExtractionTaskResponse,
+    MarkTasksCompletedPayload,
+    MarkTasksFailedPayload,
+    SocialNetwork,
+    TaskFailure,
+    TaskLease,
+)
+
+from .conftest import Run
+
+
+def post_details_task(account_id: str, post_id: str, priority: int | None = None) -> ExtractionTask:
+    return ExtractionTask.model_validate(
+        {
+            "social_network": SocialNetwork.YOUTUBE,
+            "type": "extract-post-details",
+            "task_config": {"account_id": account_id, "post_id": post_id},
+            "priority": priority,
+        }
+    )
+
+
+def account_ids(tasks: list[ExtractionTaskResponse]) -> list[str]:
+    return [task.task_config.account_id for task in tasks if task.task_config is not None]
+
+
+async def acquire_one_at_a_time(count: int) -> list[ExtractionTaskResponse]:
+    tasks: list[ExtractionTaskResponse] = []
+    for _ in range(count):
+        tasks += await acquire_available_tasks(api_key="test", count=1)
+    return tasks
+
+
+async def complete_tasks(tasks: list[ExtractionTaskResponse]) -> None:
+    await mark_tasks_completed(
+        MarkTasksCompletedPayload(
+            tasks=[
+                TaskLease(task_uid=task.task_uid, lease_token=task.lease_token) for task in tasks
+            ]
+        ),
+        api_key="test",
+    )
+
+
+def test_register_tasks_skips_tasks_not_completed_yet(run: Run) -> None:
+    task = post_details_task("account", "post")
+
+    response = run(register_tasks([task, task, post_details_task("account", "other")]))
+    assert (response.inserted_count, response.existing_count) == (2, 1)
+
+    response = run(register_tasks([task]))
+    assert (response.inserted_count, response.existing_count) == (0, 1)
+
+    # Acquired tasks are not completed yet either
+    acquired = run(acquire_available_tasks(api_key="test", count=2))
+    assert len(acquired) == 2
+    response = run(register_tasks([task]))
+    assert (response.inserted_count, response.existing_count) == (0, 1)
+
+    run(complete_tasks(acquired))
+    response = run(register_tasks([task]))
+    assert (response.inserted_count, response.existing_count) == (1, 0)
+
+
+async def task_statuses() -> dict[str, str]:
+    """Status of the tasks, by post id."""
+    async with pool.PGPool.get_connection() as conn:
+        rows = await conn.fetch(
+            "SELECT config->>'post_id' AS post_id, status FROM v1.extraction_task"
+        )
+    return {row["post_id"]: row["status"] for row in rows}
+
+
+def test_bulk_mark_updates_the_acquired_tasks_only(run: Run) -> None:
+    run(register_tasks([post_details_task("account", f"post{index}") for index in range(3)]))
+    completed, failed = run(acquire_one_at_a_time(2))
+    not_acquired = uuid.uuid4()
+
+    response = run(
+        mark_tasks_completed(
+            MarkTasksCompletedPayload(
+                tasks=[TaskLease(task_uid=completed.task_uid), TaskLease(task_uid=not_acquired)]
+            ),
+            api_key="test",
+        )
+    )
+    assert response.updated_count == 1
+    assert {result.task_uid: result.updated for result in response.results} == {
+        completed.task_uid: True,
+        not_acquired: False,
+    }
+
+    response = run(
+        mark_tasks_failed(
+            MarkTasksFailedPayload(
+                tasks=[
+                    TaskFailure(task_uid=failed.task_uid, error="error"),
+                    # Completed already
+                    TaskFailure(task_uid=completed.task_uid, error="error"),
+                ]
+            ),
+            api_key="test",
+        )
+    )
+    assert response.updated_count == 1
+    assert run(task_statuses()) == {"post0": "COMPLETED", "post1": "FAILED", "post2": "AVAILABLE"}
+
+
+async def acquire_while_registering() -> tuple[list[ExtractionTaskResponse], float]:
+    """Wait for a task with a long polling acquire, while it is registered."""
+    # Woken up by the listener once it listens
+    listening = TaskAvailableListener.subscribe(None)
+    listener = asyncio.create_task(TaskAvailableListener.run())
+    try:
+        await listening
+        started_at = time.monotonic()
+        acquiring = asyncio.create_task(
+            acquire_available_tasks(api_key="test", count=1, wait_seconds=10)
+        )
+        await asyncio.sleep(0.2)
+        await register_tasks([post_details_task("account", "post")])
+        return await acquiring, time.monotonic() - started_at
+    finally:
+        listener.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+
+
+def test_long_polling_acquire_is_woken_by_a_registration(run: Run) -> None:
+    tasks, seconds = run(acquire_while_registering())
+    assert account_ids(tasks) == ["account"]
+    assert seconds < 5
+
+
+def test_acquire_interleaves_registrations_and_accounts(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "extraction_task_max_acquired_per_account", 100)
+    run(register_tasks([post_details_task("a", f"a{index}") for index in range(4)]))
+    run(register_tasks([post_details_task("b", f"b{index}") for index in range(2)]))
+
+    # The later registration is not queued behind the first one
+    assert account_ids(run(acquire_one_at_a_time(6))) == ["a", "a", "b", "a", "b", "a"]
+
+
+def test_acquire_interleaves_registrations_of_each_priority(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "extraction_task_max_acquired_per_account", 100)
+    run(register_tasks([post_details_task("b", f"b{index}", priority=0) for index in range(3)]))
+    run(register_tasks([post_details_task("a", f"a{index}", priority=1) for index in range(6)]))
+    assert account_ids(run(acquire_one_at_a_time(5))) == ["a"] * 5
+
+    # Queued with the tasks of its priority, not behind the ranks of the other priority
+    run(register_tasks([post_details_task("c", f"c{index}", priority=0) for index in range(2)]))
+    assert account_ids(run(acquire_one_at_a_time(6))) == ["a", "b", "b", "c", "b", "c"]
+
+
+def test_acquire_alternates_accounts_of_a_registration(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "extraction_task_max_acquired_per_account", 100)
+    run(
+        register_tasks(
+            [post_details_task("a", f"a{index}") for index in range(3)]
+            + [post_details_task("b", f"b{index}") for index in range(2)]
+        )
+    )
+
+    assert account_ids(run(acquire_one_at_a_time(5))) == ["a", "b", "a", "b", "a"]
+
+
+def test_acquire_caps_the_tasks_leased_per_account(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "extraction_task_max_acquired_per_account", 2)
+    run(
+        register_tasks(
+            [post_details_task("a", f"a{index}") for index in range(5)]
+            + [post_details_task("b", "b0")]
+        )
+    )
+
+    acquired = run(acquire_available_tasks(api_key="test", count=10))
+    assert sorted(account_ids(acquired)) == ["a", "a", "b"]
+    assert run(acquire_available_tasks(api_key="test", count=10)) == []
+
+    run(complete_tasks([next(task for task in acquired if account_ids([task]) == ["a"])]))
+    assert account_ids(run(acquire_available_tasks(api_key="test", count=10))) == ["a"]
+
+
+async def expire_leases() -> None:
+    async with pool.PGPool.get_connection() as conn:
+        await conn.execute(
+            "UPDATE v1.extraction_task SET visible_at = NOW() - INTERVAL '1 second'"
+            " WHERE status = 'ACQUIRED'"
+        )
+
+
+def test_extend_task_lease_postpones_the_lease_of_acquired_tasks(run: Run) -> None:
+    run(register_tasks([post_details_task("account", "post")]))
+    (task,) = run(acquire_available_tasks(api_key="test", count=1))
+
+    response = run(extend_task_lease(task.task_uid, api_key="test"))
+    assert response.visible_at >= task.visible_at
+
+    run(complete_tasks([task]))
+    with pytest.raises(fastapi.HTTPException):
+        run(extend_task_lease(task.task_uid, api_key="test"))
+
+
+def test_expired_leases_are_recycled(run: Run) -> None:
+    run(register_tasks([post_details_task("account", "post")]))
+    run(acquire_available_tasks(api_key="test", count=1))
+    assert run(recycle_expired_leases()) == 0
+
+    run(expire_leases())
+    assert run(recycle_expired_leases()) == 1
+    assert run(task_statuses()) == {"post": "AVAILABLE"}
+    assert len(run(acquire_available_tasks(api_key="test", count=1))) == 1
+
+
+def test_extend_task_lease_takes_an_expired_lease_back(run: Run) -> None:
+    run(register_tasks([post_details_task("account", "post")]))
+    (task,) = run(acquire_available_tasks(api_key="test", count=1))
+    run(expire_leases())
+
+    with pytest.raises(fastapi.HTTPException):
+        run(extend_task_lease(task.task_uid, api_key="test"))
+    # The lease token proves the task was not acquired again
+    response = run(extend_task_lease(task.task_uid, api_key="test", lease_token=task.lease_token))
+    assert response.visible_at > dt.datetime.now(dt.UTC)
+
+    run(expire_leases())
+    run(recycle_expired_leases())
+    with pytest.raises(fastapi.HTTPException):
+        run(extend_task_lease(task.task_uid, api_key="test", lease_token=task.lease_token))
+
+
+async def insert_due_post(post_id: str, *, planned: bool = True) -> None:
+    """Insert a post extracted 10 days ago, due for a refresh if planned."""
+    published_at = dt.datetime.now(dt.UTC) - dt.timedelta(days=10)
+    next_refresh_at = dt.datetime.now(dt.UTC) - dt.timedelta(hours=1) if planned else None
+    async with pool.PGPool.get_connection() as conn:
+        await conn.execute(
+            """
+            INSERT INTO v1.post (
+                social_network, post_id, account_id, post_extracted_at, published_at, post_url,
+                title, description, comment_count, view_count, repost_count, like_count,
+                share_count, categories, tags, sn_has_paid_placement, sn_brand, post_type,
+                text_content, next_refresh_at
+            )
+            VALUES (
+                'youtube', $1, 'account', $2, $2, 'url', 'title', 'description', 0, 0, 0, 0, 0,
+                '{}', '{}', FALSE, '', 'video', '', $3
+            )
+            """,
+            post_id,
+            published_at,
+            next_refresh_at,
+        )
+
+
+async def next_refresh_dates() -> dict[str, dt.datetime]:
+    async with pool.PGPool.get_connection() as conn:
+        rows = await conn.fetch("SELECT post_id, next_refresh_at FROM v1.post")
+    return {row["post_id"]: row["next_refresh_at"] for row in rows}
+
+
+def test_schedule_post_refreshes_plans_posts_whose_task_is_registered(run: Run) -> None:
+    run(insert_due_post("pending"))
+    run(insert_due_post("due"))
+    # The refresh of this post is pending already
+    run(register_tasks([post_details_task("account", "pending")]))
+    due_before = run(next_refresh_dates())
+
+    assert run(schedule_post_refreshes()) == (0, 1, 1)
+    due_after = run(next_refresh_dates())
+    assert due_after["pending"] == due_before["pending"]
+    assert due_after["due"] > dt.datetime.now(dt.UTC)
+    assert run(schedule_post_refreshes()) == (0, 0, 0)
+
+    run(complete_tasks(run(acquire_available_tasks(api_key="test", count=10))))
+    # Due again once its task is completed
+    assert run(schedule_post_refreshes()) == (0, 1, 1)
+    assert run(next_refresh_dates())["pending"] > dt.datetime.now(dt.UTC)
+
+
+def test_schedule_post_refreshes_spreads_overdue_posts(run: Run) -> None:
+    for index in range(20):
+        run(insert_due_post(f"post{index}", planned=False))
+
+    # Planned within their refresh interval (10 days times the age factor), not due
+    assert run(schedule_post_refreshes()) == (20, 0, 0)
+    planned_dates = sorted(run(next_refresh_dates()).values())
+    now = dt.datetime.now(dt.UTC)
+    assert now < planned_dates[0] < planned_dates[-1]
+    assert planned_dates[-1] < now + dt.timedelta(days=10) * settings.post_refresh_age_factor
+
+
+def test_refresh_tasks_are_acquired_after_new_content(run: Run) -> None:
+    run(insert_due_post("refreshed"))
+    run(schedule_post_refreshes())
+    run(register_tasks([post_details_task("account", "new")]))
+
+    acquired = run(acquire_one_at_a_time(2))
+    assert [task.task_config.post_id for task in acquired if task.task_config is not None] == [
+        "new",
+        "refreshed",
+    ]
+
+
+async def archived_task_statuses() -> dict[str, str]:
+    """Status of the archived tasks, by post id."""
+    async with pool.PGPool.get_connection() as conn:
+        rows = await conn.fetch(
+            "SELECT config->>'post_id' AS post_id, status FROM v1.extraction_task_archive"
+        )
+    return {row["post_id"]: row["status"] for row in rows}
+
+
+def test_finished_tasks_are_archived_after_their_retention(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    run(register_tasks([post_details_task("account", f"post{index}") for index in range(3)]))
+    completed, failed = run(acquire_one_at_a_time(2))
+    run(complete_tasks([completed]))
+    run(
+        mark_tasks_failed(
+            MarkTasksFailedPayload(tasks=[TaskFailure(task_uid=failed.task_uid, error="error")]),
+            api_key="test",
+        )
+    )
+    assert run(archive_finished_tasks()) == 0
+
+    monkeypatch.setattr(settings, "extraction_task_archive_completed_after_seconds", 0)
+    assert run(archive_finished_tasks()) == 1
+    assert run(task_statuses()) == {"post1": "FAILED", "post2": "AVAILABLE"}
+
+    monkeypatch.setattr(settings, "extraction_task_archive_failed_after_seconds", 0)
+    assert run(archive_finished_tasks()) == 1
+    assert run(task_statuses()) == {"post2": "AVAILABLE"}
+    assert run(archived_task_statuses()) == {"post0": "COMPLETED", "post1": "FAILED"}
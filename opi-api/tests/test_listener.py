@@ -0,0 +1,43 @@
+import asyncio
+
+from app.db.listener import TaskAvailableListener
+
+
+def test_wake_next_wakes_the_longest_waiting_subscriber_only() -> None:
+    async def wake_next() -> None:
+        first = TaskAvailableListener.subscribe("youtube")
+        second = TaskAvailableListener.subscribe("youtube")
+        other_network = TaskAvailableListener.subscribe("tiktok")
+
+        TaskAvailableListener.wake_next("youtube")
+        assert (first.done(), second.done(), other_network.done()) == (True, False, False)
+        TaskAvailableListener.wake_next("youtube")
+        assert second.done()
+        assert not other_network.done()
+        TaskAvailableListener.unsubscribe("tiktok", other_network)
+
+    asyncio.run(wake_next())
+
+
+def test_wake_next_falls_back_to_subscribers_of_any_network() -> None:
+    async def wake_next() -> None:
+        any_network = TaskAvailableListener.subscribe(None)
+        TaskAvailableListener.wake_next("youtube")
+        assert any_network.done()
+
+    asyncio.run(wake_next())
+
+
+def test_wake_next_skips_cancelled_and_unsubscribed_waiters() -> None:
+    async def wake_next() -> None:
+        timed_out = TaskAvailableListener.subscribe("youtube")
+        unsubscribed = TaskAvailableListener.subscribe("youtube")
+        waiting = TaskAvailableListener.subscribe("youtube")
+        timed_out.cancel()
+        TaskAvailableListener.unsubscribe("youtube", unsubscribed)
+
+        TaskAvailableListener.wake_next("youtube")
+        assert waiting.done()
+        assert not unsubscribed.done()
+
+    asyncio.run(wake_next())
@@ -0,0 +1,280 @@
+import asyncio
+import datetime as dt
+from collections.abc import AsyncIterator
+from http import HTTPStatus
+
+import httpx
+import pydantic
+import pytest
+from fastapi import HTTPException, Request
+
+from app._config import settings
+from app.backend.routing.endpoints import social_network
+from app.backend.routing.endpoints.social_network import (
+    _is_record_error,
+    _iter_lines,
+    sync_results_to_nocodb,
+    upsert_accounts,
+    upsert_posts,
+    upsert_posts_stream,
+)
+from app.db import pool
+from app.models import Account, Post
+from app.nocodb import TargetRecordNotFoundError
+
+from .conftest import Run
+
+EXTRACTED_AT = dt.datetime(2025, 1, 1, tzinfo=dt.UTC)
+
+
+def make_post(post_id: str, view_count: int = 0) -> Post:
+    return Post(
+        post_extracted_at=EXTRACTED_AT,
+        published_at=EXTRACTED_AT,
+        social_network="youtube",
+        account_id="account",
+        post_id=post_id,
+        post_url=f"https://www.youtube.com/watch?v={post_id}",
+        title="title",
+        description="description",
+        comment_count=0,
+        view_count=view_count,
+        repost_count=0,
+        like_count=0,
+        share_count=0,
+        categories=[],
+        tags=[],
+        sn_has_paid_placement=False,
+        sn_brand="",
+        post_type="video",
+        text_content="",
+    )
+
+
+def make_account(account_id: str, follower_count: int = 0) -> Account:
+    return Account(
+        account_extracted_at=EXTRACTED_AT,
+        account_id=account_id,
+        social_network="youtube",
+        handle=f"@{account_id}",
+        description="description",
+        follower_count=follower_count,
+        following_count=0,
+        post_count=0,
+        view_count=0,
+        like_count=0,
+        categories=[],
+    )
+
+
+def http_status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://nocodb.invalid")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status_code, request=request)
+    )
+
+
+@pytest.mark.parametrize(
+    ("status_code", "is_record_error"),
+    [(400, True), (422, True), (429, False), (500, False), (503, False)],
+)
+def test_http_errors_are_record_errors_if_caused_by_the_request(
+    status_code: int, *, is_record_error: bool
+) -> None:
+    assert _is_record_error(http_status_error(status_code)) is is_record_error
+
+
+def test_invalid_and_unlinked_records_are_record_errors() -> None:
+    with pytest.raises(pydantic.ValidationError) as validation_error:
+        Post.model_validate({})
+    assert _is_record_error(validation_error.value)
+    assert _is_record_error(TargetRecordNotFoundError("Post", "Account", {"account_id": "x"}))
+    assert not _is_record_error(httpx.ConnectError("unreachable"))
+
+
+async def sync_states() -> dict[str, tuple[bool, str | None]]:
+    """Whether each post is synced, and its sync error."""
+    async with pool.PGPool.get_connection() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT post_id, synced_at IS NOT DISTINCT FROM updated_at AS synced, sync_error
+            FROM v1.post
+            """
+        )
+    return {row["post_id"]: (row["synced"], row["sync_error"]) for row in rows}
+
+
+def test_sync_isolates_the_failing_posts(run: Run, monkeypatch: pytest.MonkeyPatch) -> None:
+    pushed: list[list[str]] = []
+
+    async def upsert_posts_to_nocodb(posts: list[Post]) -> None:
+        pushed.append([post.post_id for post in posts])
+        if any(post.post_id == "invalid" for post in posts):
+            raise http_status_error(422)
+
+    monkeypatch.setattr(social_network, "upsert_posts_to_nocodb", upsert_posts_to_nocodb)
+    post_ids = ["a", "b", "invalid", "c"]
+    run(upsert_posts([make_post(post_id) for post_id in post_ids]))
+
+    assert run(sync_results_to_nocodb()) == 4
+    # The posts are pushed in halves until the failing one is pushed alone
+    assert ["invalid"] in pushed
+    assert len(pushed) < len(post_ids) * 2
+    states = run(sync_states())
+    assert {post_id: synced for post_id, (synced, _) in states.items()} == {
+        "a": True,
+        "b": True,
+        "invalid": False,
+        "c": True,
+    }
+    assert states["invalid"][1] == "HTTPStatusError: error"
+
+    # The failing post is retried later only
+    assert run(sync_results_to_nocodb()) == 0
+
+
+def test_sync_records_outages_on_all_the_posts(run: Run, monkeypatch: pytest.MonkeyPatch) -> None:
+    pushed: list[list[str]] = []
+
+    async def upsert_posts_to_nocodb(posts: list[Post]) -> None:
+        pushed.append([post.post_id for post in posts])
+        raise http_status_error(503)
+
+    monkeypatch.setattr(social_network, "upsert_posts_to_nocodb", upsert_posts_to_nocodb)
+    run(upsert_posts([make_post("a"), make_post("b")]))
+
+    assert run(sync_results_to_nocodb()) == 2
+    assert len(pushed) == 1
+    assert run(sync_states()) == {
+        "a": (False, "HTTPStatusError: error"),
+        "b": (False, "HTTPStatusError: error"),
+    }
+
+
+def test_upsert_posts_skips_the_posts_extracted_again_unchanged(run: Run) -> None:
+    response = run(upsert_posts([make_post("a"), make_post("b")]))
+    assert (response.written_count, response.skipped_count) == (2, 0)
+
+    extracted_again = make_post("a").model_copy(
+        update={"post_extracted_at": EXTRACTED_AT + dt.timedelta(days=1)}
+    )
+    response = run(upsert_posts([extracted_again, make_post("b", view_count=10)]))
+    assert (response.written_count, response.skipped_count) == (1, 1)
+
+    # The last post wins if a post is sent twice
+    response = run(upsert_posts([make_post("a", view_count=10), make_post("a")]))
+    assert (response.written_count, response.skipped_count) == (0, 2)
+
+
+def test_upsert_accounts_skips_the_accounts_extracted_again_unchanged(run: Run) -> None:
+    response = run(upsert_accounts([make_account("a")]))
+    assert (response.written_count, response.skipped_count) == (1, 0)
+
+    extracted_again = make_account("a").model_copy(
+        update={"account_extracted_at": EXTRACTED_AT + dt.timedelta(days=1)}
+    )
+    response = run(upsert_accounts([extracted_again]))
+    assert (response.written_count, response.skipped_count) == (0, 1)
+
+    response = run(upsert_accounts([make_account("a", follower_count=10)]))
+    assert (response.written_count, response.skipped_count) == (1, 0)
+
+
+async def post_metrics_snapshots() -> list[tuple[str, dt.datetime, int]]:
+    async with pool.PGPool.get_connection() as conn:
+        rows = await conn.fetch(
+            """
+            SELECT post_id, extracted_at, view_count
+            FROM v1.post_metrics_snapshot
+            ORDER BY extracted_at, post_id
+            """
+        )
+    return [(row["post_id"], row["extracted_at"], row["view_count"]) for row in rows]
+
+
+def test_upsert_posts_appends_a_metrics_snapshot_of_every_post(run: Run) -> None:
+    next_month = EXTRACTED_AT + dt.timedelta(days=31)
+    run(upsert_posts([make_post("a"), make_post("b", view_count=10)]))
+    # Unchanged posts are snapshotted too, in the partition of their extraction month
+    run(
+        upsert_posts(
+            [
+                make_post("a").model_copy(update={"post_extracted_at": next_month}),
+                make_post("b", view_count=20).model_copy(update={"post_extracted_at": next_month}),
+            ]
+        )
+    )
+
+    assert run(post_metrics_snapshots()) == [
+        ("a", EXTRACTED_AT, 0),
+        ("b", EXTRACTED_AT, 10),
+        ("a", next_month, 0),
+        ("b", next_month, 20),
+    ]
+
+
+async def chunks_of(*chunks: bytes) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+def lines_of(*chunks: bytes) -> list[bytes]:
+    async def collect_lines() -> list[bytes]:
+        return [line async for line in _iter_lines(chunks_of(*chunks))]
+
+    return asyncio.run(collect_lines())
+
+
+def test_iter_lines_joins_the_lines_split_across_chunks() -> None:
+    assert lines_of(b"fir", b"st\nsec", b"ond\n\nth", b"ird") == [
+        b"first",
+        b"second",
+        b"",
+        b"third",
+    ]
+    assert lines_of(b"first\n") == [b"first"]
+
+
+def test_iter_lines_rejects_too_long_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(social_network, "MAX_NDJSON_LINE_BYTES", 4)
+    assert lines_of(b"abc\nab", b"c\n") == [b"abc", b"abc"]
+    with pytest.raises(HTTPException) as error:
+        lines_of(b"abc", b"de")
+    assert error.value.status_code == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+
+
+def ndjson_request(*chunks: bytes) -> Request:
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive() -> dict[str, object]:
+        return messages.pop(0)
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_upsert_posts_stream_upserts_the_posts_in_batches(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "posts_stream_batch_size", 2)
+    body = b"".join(make_post(post_id).model_dump_json().encode() + b"\n" for post_id in "abc")
+    middle = len(body) // 2
+
+    response = run(
+        upsert_posts_stream(ndjson_request(body[:middle], body[middle:]), api_key="test")
+    )
+    assert (response.written_count, response.skipped_count) == (3, 0)
+    assert set(run(sync_states())) == {"a", "b", "c"}
+
+
+def test_upsert_posts_stream_keeps_the_batches_before_an_invalid_line(
+    run: Run, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "posts_stream_batch_size", 2)
+    body = b"".join(make_post(post_id).model_dump_json().encode() + b"\n" for post_id in "abc")
+
+    with pytest.raises(HTTPException) as error:
+        run(upsert_posts_stream(ndjson_request(body + b"{}\n"), api_key="test"))
+    assert error.value.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert error.value.detail.startswith("Invalid post on line 4")
+    assert set(run(sync_states())) == {"a", "b"}